@@ -12,11 +12,13 @@ from pathlib import Path
 # Add src to path for module imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from ocio_performance_analysis import OCIOTestParser
+from ocio_performance_analysis import OCIOTestParser, setup_logging
 
 
 def main():
     """Main function to run the parser."""
+    setup_logging()
+
     # Set up paths
     script_dir = Path(__file__).parent.parent
     test_dir = script_dir / "data" / "OCIO_tests"
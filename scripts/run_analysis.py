@@ -12,11 +12,13 @@ from pathlib import Path
 # Add src to path for module imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from ocio_performance_analysis import OCIOAnalyzer
+from ocio_performance_analysis import OCIOAnalyzer, setup_logging
 
 
 def main():
     """Main function to run the analysis."""
+    setup_logging()
+
     # Set up paths
     script_dir = Path(__file__).parent.parent
     csv_file = script_dir / "data" / "ocio_test_results.csv"
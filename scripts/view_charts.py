@@ -12,27 +12,52 @@ from pathlib import Path
 # Add src to path for module imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from ocio_performance_analysis import OCIOChartViewer
+from ocio_performance_analysis import OCIOChartViewer, setup_logging
 
 
-def main():
-    """Main function with command line interface."""
+def _create_viewer(use_matplotlib=False):
+    """Set up logging and create a viewer for the project's analysis results."""
+    setup_logging()
+
     script_dir = Path(__file__).parent.parent
     analysis_dir = script_dir / "analysis_results"
 
-    viewer = OCIOChartViewer(analysis_dir)
+    return OCIOChartViewer(analysis_dir, use_matplotlib=use_matplotlib)
+
+
+def view_aces():
+    """View the comprehensive ACES comparison chart."""
+    _create_viewer().view_specific_chart('comprehensive')
+    return 0
+
+
+def view_merged():
+    """View the merged OCIO version comparison chart."""
+    _create_viewer().view_specific_chart('merged')
+    return 0
+
+
+def main():
+    """Main function with command line interface."""
+    args = sys.argv[1:]
+    use_matplotlib = '--mpl' in args
+    if use_matplotlib:
+        args.remove('--mpl')
+
+    viewer = _create_viewer(use_matplotlib)
 
-    if len(sys.argv) == 1:
+    if len(args) == 0:
         # No arguments - show all charts
         viewer.view_all_charts()
-    elif len(sys.argv) == 2:
-        arg = sys.argv[1].lower()
+    elif len(args) == 1:
+        arg = args[0].lower()
         if arg in ['--help', '-h', 'help']:
             print("📊 OCIO Chart Viewer - Usage:")
             print("  python scripts/view_charts.py                    # View all charts")
             print("  python scripts/view_charts.py <chart_name>       # View specific chart")
             print("  python scripts/view_charts.py --list             # List available charts")
             print("  python scripts/view_charts.py --help             # Show this help")
+            print("  Add --mpl to show charts in a matplotlib window instead of the system viewer")
             print("\\nChart names (partial matching supported):")
             print("  'aces' or 'comprehensive'  - ACES comparison chart")
             print("  'ocio' or 'merged'          - OCIO version comparison chart")
@@ -42,7 +67,7 @@ def main():
             viewer.list_charts()
         else:
             # View specific chart
-            viewer.view_specific_chart(sys.argv[1])
+            viewer.view_specific_chart(args[0])
     else:
         print("❌ Too many arguments. Use --help for usage information.")
         return 1
@@ -10,10 +10,10 @@ comparisons across different configurations.
 __version__ = "1.0.0"
 __author__ = "OCIO Performance Analysis Team"
 
-from .analyzer import OCIOAnalyzer
-from .config import OCIOConfig, ConfigurationManager, get_config, get_config_manager
+import importlib
+
+from .config import OCIOConfig, ConfigurationManager, get_config, get_config_manager, set_config
 from .data_analyzer import OCIODataAnalyzer
-from .chart_generator import OCIOChartGenerator
 from .report_generator import OCIOReportGenerator
 from .performance_analyzer import OCIOPerformanceAnalyzer
 from .exceptions import (
@@ -27,7 +27,21 @@ from .exceptions import (
 )
 from .logging_config import get_logger, setup_logging
 from .parser import OCIOTestParser, OCIOTestResult
-from .viewer import OCIOChartViewer
+
+# Classes that pull in matplotlib are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "OCIOAnalyzer": ".analyzer",
+    "OCIOChartGenerator": ".chart_generator",
+    "OCIOChartViewer": ".viewer",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -43,6 +57,7 @@ __all__ = [
     "ConfigurationManager",
     "get_config",
     "get_config_manager",
+    "set_config",
     "get_logger",
     "setup_logging",
     "OCIOAnalysisError",
@@ -0,0 +1,298 @@
+"""
+Numeric kernels for OCIO Performance Analysis.
+
+Kernels are JIT-compiled with Numba when it is installed (``pip install
+.[jit]``) and fall back to equivalent NumPy implementations otherwise.
+Numba is only imported when a kernel is first called, and compiled code is
+not cached on disk: cache entries record the module name the kernel was
+compiled under and break when the package is later imported by another name.
+Inputs too small to repay the compile time use the NumPy implementations
+directly, so typical result sets never import Numba at all. Each kernel takes
+an ``engine`` argument ('auto', 'numpy' or 'numba', see
+``OCIOConfig.compute_engine``) to override that choice.
+"""
+
+import importlib.util
+from typing import Callable, Tuple
+
+import numpy as np
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Importing Numba and compiling the pair kernel takes about a second, which
+# the NumPy implementation (one vectorized step per group) only exceeds at
+# around this many groups
+_PAIR_JIT_MIN_GROUPS = 10_000
+
+
+class _Kernel:
+    """A kernel compiled with Numba on first call, falling back to NumPy."""
+
+    def __init__(self, loop_impl: Callable, numpy_impl: Callable):
+        """
+        Args:
+            loop_impl: Plain-Python loop implementation for Numba to compile
+            numpy_impl: Equivalent NumPy implementation
+        """
+        self.loop_impl = loop_impl
+        self.numpy_impl = numpy_impl
+        self._impl = None
+
+    def _compile(self) -> Callable:
+        """Compile the loop implementation, or return the NumPy one without Numba."""
+        if not NUMBA_AVAILABLE:
+            return self.numpy_impl
+        try:
+            from numba import njit
+            return njit(nogil=True)(self.loop_impl)
+        except Exception as e:
+            logger.warning(f"Failed to load Numba ({e}), using NumPy kernels")
+            return self.numpy_impl
+
+    def __call__(self, *args):
+        impl = self._impl
+        if impl is None:
+            impl = self._impl = self._compile()
+        try:
+            return impl(*args)
+        except Exception as e:
+            if impl is self.numpy_impl:
+                raise
+            # Compilation happens on the first call, so typing and compiler
+            # errors surface here too; never let them lose results
+            logger.warning(
+                f"Numba kernel {self.loop_impl.__name__} failed ({e}), "
+                "using the NumPy implementation"
+            )
+            self._impl = self.numpy_impl
+            return self.numpy_impl(*args)
+
+
+def _timing_stats_numpy(timing_values: np.ndarray) -> Tuple[float, float, float]:
+    """NumPy implementation of timing_stats()."""
+    return (
+        float(np.minimum.reduce(timing_values)),
+        float(np.maximum.reduce(timing_values)),
+        float(np.add.reduce(timing_values) / timing_values.size),
+    )
+
+
+def _timing_stats_loop(timing_values):
+    """Loop implementation of timing_stats() for Numba; a single pass over the array."""
+    min_time = timing_values[0]
+    max_time = timing_values[0]
+    total = 0.0
+    for value in timing_values:
+        total += value
+        if value < min_time:
+            min_time = value
+        if value > max_time:
+            max_time = value
+    return min_time, max_time, total / timing_values.shape[0]
+
+
+_timing_stats_kernel = _Kernel(_timing_stats_loop, _timing_stats_numpy)
+
+
+def timing_stats(timing_values: np.ndarray, engine: str = 'auto') -> Tuple[float, float, float]:
+    """
+    Compute the min, max and mean of a non-empty float64 timing array.
+
+    Args:
+        timing_values: Array of timing values in milliseconds
+        engine: 'numba' to use the JIT kernel; 'auto' and 'numpy' use NumPy,
+                since one run's timings are too few to repay compiling it
+
+    Returns:
+        Tuple of (min, max, mean)
+    """
+    kernel = _timing_stats_kernel if engine == 'numba' else _timing_stats_numpy
+    min_time, max_time, avg_time = kernel(timing_values)
+    return float(min_time), float(max_time), float(avg_time)
+
+
+def _segment_timing_stats_numpy(timing_values, offsets, min_times, max_times, avg_times):
+    """NumPy implementation of the segment_timing_stats() kernel."""
+    starts = offsets[:-1]
+    min_times[:] = np.minimum.reduceat(timing_values, starts)
+    max_times[:] = np.maximum.reduceat(timing_values, starts)
+    avg_times[:] = np.add.reduceat(timing_values, starts) / (offsets[1:] - starts)
+
+
+def _segment_timing_stats_loop(timing_values, offsets, min_times, max_times, avg_times):
+    """Loop implementation of the segment_timing_stats() kernel for Numba; one pass per segment."""
+    for segment in range(offsets.shape[0] - 1):
+        start = offsets[segment]
+        end = offsets[segment + 1]
+        min_time = timing_values[start]
+        max_time = timing_values[start]
+        total = 0.0
+        for i in range(start, end):
+            value = timing_values[i]
+            total += value
+            if value < min_time:
+                min_time = value
+            if value > max_time:
+                max_time = value
+        min_times[segment] = min_time
+        max_times[segment] = max_time
+        avg_times[segment] = total / (end - start)
+
+
+_segment_timing_stats_kernel = _Kernel(_segment_timing_stats_loop, _segment_timing_stats_numpy)
+
+
+def segment_timing_stats(timing_values: np.ndarray, offsets: np.ndarray,
+                         engine: str = 'auto') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the min, max and mean of many timing arrays at once.
+
+    The arrays are concatenated into ``timing_values``; array ``k`` is
+    ``timing_values[offsets[k]:offsets[k + 1]]`` and must not be empty.
+
+    Args:
+        timing_values: float64 timing values of every array, in order
+        offsets: int64 start of each array, followed by the total length
+        engine: 'numba' to use the JIT kernel; 'auto' and 'numpy' use
+                ``ufunc.reduceat``, which already reduces all arrays in C
+
+    Returns:
+        Tuple of (min, max, mean) float64 arrays, one value per timing array
+    """
+    count = offsets.size - 1
+    min_times = np.empty(count, dtype=np.float64)
+    max_times = np.empty(count, dtype=np.float64)
+    avg_times = np.empty(count, dtype=np.float64)
+    if count:
+        kernel = _segment_timing_stats_kernel if engine == 'numba' else _segment_timing_stats_numpy
+        kernel(timing_values, offsets, min_times, max_times, avg_times)
+    return min_times, max_times, avg_times
+
+
+def _pair_improvements_numpy(times, group_starts, group_ends, pair_offsets,
+                             first, second, improvement_pct):
+    """NumPy implementation of the pair_improvements() kernel."""
+    for start, end, offset in zip(group_starts, group_ends, pair_offsets):
+        rows, cols = np.triu_indices(end - start, 1)
+        first[offset:offset + rows.size] = rows + start
+        second[offset:offset + rows.size] = cols + start
+
+    first_times = times[first]
+    second_times = times[second]
+    faster = np.minimum(first_times, second_times)
+    slower = np.maximum(first_times, second_times)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        improvement_pct[:] = np.where(
+            (first_times > 0) & (second_times > 0),
+            (slower - faster) / slower * 100,
+            np.nan
+        )
+
+
+def _pair_improvements_loop(times, group_starts, group_ends, pair_offsets,
+                            first, second, improvement_pct):
+    """Loop implementation of the pair_improvements() kernel for Numba."""
+    for group in range(group_starts.shape[0]):
+        pair = pair_offsets[group]
+        end = group_ends[group]
+        for i in range(group_starts[group], end):
+            for j in range(i + 1, end):
+                first[pair] = i
+                second[pair] = j
+                if times[i] > 0 and times[j] > 0:
+                    faster = min(times[i], times[j])
+                    slower = max(times[i], times[j])
+                    improvement_pct[pair] = (slower - faster) / slower * 100
+                else:
+                    improvement_pct[pair] = np.nan
+                pair += 1
+
+
+_pair_improvements_kernel = _Kernel(_pair_improvements_loop, _pair_improvements_numpy)
+
+
+def pair_improvements(times: np.ndarray, group_starts: np.ndarray, group_ends: np.ndarray,
+                      engine: str = 'auto') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compare every pair of rows within each group.
+
+    Groups are the row ranges ``[group_starts[k], group_ends[k])``. Pairs are
+    listed group by group, and within a group in ``(i, j)`` order with
+    ``i < j``, matching a nested loop over the rows.
+
+    Args:
+        times: float64 mean time of each row
+        group_starts: int64 first row of each group
+        group_ends: int64 end (exclusive) row of each group
+        engine: 'numpy' or 'numba' to force a kernel; 'auto' uses Numba only
+                for many groups
+
+    Returns:
+        Tuple of (first row, second row, improvement percentage) arrays. The
+        improvement is how much faster the quicker row of the pair is than the
+        slower one, and NaN when either time is not positive.
+    """
+    sizes = group_ends - group_starts
+    pair_offsets = np.zeros(sizes.size + 1, dtype=np.int64)
+    np.cumsum(sizes * (sizes - 1) // 2, out=pair_offsets[1:])
+
+    pair_count = int(pair_offsets[-1])
+    first = np.empty(pair_count, dtype=np.int64)
+    second = np.empty(pair_count, dtype=np.int64)
+    improvement_pct = np.empty(pair_count, dtype=np.float64)
+    if engine == 'numpy' or (engine == 'auto' and sizes.size < _PAIR_JIT_MIN_GROUPS):
+        kernel = _pair_improvements_numpy
+    else:
+        kernel = _pair_improvements_kernel
+    kernel(times, group_starts, group_ends, pair_offsets[:-1], first, second, improvement_pct)
+    return first, second, improvement_pct
+
+
+def _group_means_numpy(codes, values, group_count, means):
+    """NumPy implementation of the group_means() kernel."""
+    valid = ~np.isnan(values)
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=group_count)
+    counts = np.bincount(codes[valid], minlength=group_count)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means[:] = sums / counts
+
+
+def _group_means_loop(codes, values, group_count, means):
+    """Loop implementation of the group_means() kernel for Numba; a single pass over the rows."""
+    sums = np.zeros(group_count)
+    counts = np.zeros(group_count, dtype=np.int64)
+    for row in range(codes.shape[0]):
+        value = values[row]
+        if not np.isnan(value):
+            sums[codes[row]] += value
+            counts[codes[row]] += 1
+    for group in range(group_count):
+        means[group] = sums[group] / counts[group] if counts[group] > 0 else np.nan
+
+
+_group_means_kernel = _Kernel(_group_means_loop, _group_means_numpy)
+
+
+def group_means(codes: np.ndarray, values: np.ndarray, group_count: int,
+                engine: str = 'auto') -> np.ndarray:
+    """
+    Compute the mean value of each group, ignoring NaN values.
+
+    Args:
+        codes: int64 group of each row, from 0 to ``group_count - 1``
+        values: float64 value of each row
+        group_count: Number of groups
+        engine: 'numba' to use the JIT kernel; 'auto' and 'numpy' use
+                ``np.bincount``, which is already a single pass in C
+
+    Returns:
+        float64 array of group means, NaN for groups without values
+    """
+    means = np.empty(group_count, dtype=np.float64)
+    kernel = _group_means_kernel if engine == 'numba' else _group_means_numpy
+    kernel(codes, values, group_count, means)
+    return means
@@ -15,8 +15,6 @@ import pandas as pd
 import seaborn as sns
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Set up matplotlib for better plots
@@ -1813,6 +1811,8 @@ Better Performing: {"ACES 1.0" if overall_aces_1 < overall_aces_2 else "ACES 2.0
 
 def main():
     """Main function to run the analysis."""
+    logging.basicConfig(level=logging.INFO)
+
     # Set up paths
     script_dir = Path(__file__).parent
     csv_file = script_dir / "ocio_test_results.csv"
@@ -12,6 +12,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 
+from .config import get_config
 from .exceptions import ChartGenerationError
 from .logging_config import get_logger
 
@@ -27,6 +28,7 @@ class OCIOChartGenerator:
         plt.style.use('default')
         sns.set_palette("husl")
         self._setup_plot_defaults()
+        self.png_compress_level = get_config().chart.png_compress_level
 
     def _setup_plot_defaults(self):
         """Configure default plot settings."""
@@ -41,6 +43,21 @@ class OCIOChartGenerator:
             'figure.titlesize': 16
         })
 
+    def _save_figure(self, output_path: Path) -> None:
+        """
+        Save the current figure.
+
+        PNGs are written with a low zlib compression level: encoding dominates
+        chart creation time, and the charts only need to be viewable.
+
+        Args:
+            output_path: Path to save the figure to
+        """
+        savefig_kwargs = {}
+        if Path(output_path).suffix.lower() == '.png':
+            savefig_kwargs['pil_kwargs'] = {'compress_level': self.png_compress_level}
+        plt.savefig(output_path, dpi=300, bbox_inches='tight', **savefig_kwargs)
+
     def create_summary_plot(self, summary_data: pd.DataFrame, output_path: Path) -> None:
         """
         Create summary analysis plot.
@@ -60,7 +77,7 @@ class OCIOChartGenerator:
 
             # 1. Performance by ACES Version
             if 'aces_version' in summary_data.columns and 'mean_avg_time' in summary_data.columns:
-                aces_perf = summary_data.groupby('aces_version')['mean_avg_time'].mean()
+                aces_perf = summary_data.groupby('aces_version', observed=True)['mean_avg_time'].mean()
                 ax1.bar(aces_perf.index, aces_perf.values, color=['skyblue', 'lightcoral'])
                 ax1.set_title('Average Performance by ACES Version')
                 ax1.set_ylabel('Average Time (ms)')
@@ -68,7 +85,7 @@ class OCIOChartGenerator:
 
             # 2. Performance by OS Release
             if 'os_release' in summary_data.columns:
-                os_perf = summary_data.groupby('os_release')['mean_avg_time'].mean()
+                os_perf = summary_data.groupby('os_release', observed=True)['mean_avg_time'].mean()
                 ax2.bar(os_perf.index, os_perf.values, color='lightgreen')
                 ax2.set_title('Average Performance by OS Release')
                 ax2.set_ylabel('Average Time (ms)')
@@ -87,7 +104,7 @@ class OCIOChartGenerator:
                 ax4.set_ylabel('Frequency')
 
             plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            self._save_figure(output_path)
             plt.close()
             
             logger.info(f"Summary plot saved to {output_path}")
@@ -165,7 +182,7 @@ class OCIOChartGenerator:
                 ax2.legend()
 
             plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            self._save_figure(output_path)
             plt.close()
             
             logger.info(f"Comparison plot saved to {output_path}")
@@ -203,13 +220,17 @@ class OCIOChartGenerator:
             # 1. Box plot comparison
             if not aces_1_data.empty and not aces_2_data.empty:
                 box_data = [aces_1_data['mean_avg_time'], aces_2_data['mean_avg_time']]
-                axes[0, 0].boxplot(box_data, labels=['ACES 1.0', 'ACES 2.0'])
+                axes[0, 0].boxplot(box_data)
+                # Set separately: boxplot's labels argument was renamed in Matplotlib 3.9
+                axes[0, 0].set_xticks([1, 2], ['ACES 1.0', 'ACES 2.0'])
                 axes[0, 0].set_title('Performance Distribution by ACES Version')
                 axes[0, 0].set_ylabel('Average Time (ms)')
 
             # 2. OCIO version comparison within ACES versions
             if 'ocio_version' in data.columns:
-                aces_ocio = data.groupby(['aces_version', 'ocio_version'])['mean_avg_time'].mean().unstack()
+                aces_ocio = data.groupby(
+                    ['aces_version', 'ocio_version'], observed=True
+                )['mean_avg_time'].mean().unstack()
                 aces_ocio.plot(kind='bar', ax=axes[0, 1])
                 axes[0, 1].set_title('Performance by ACES and OCIO Version')
                 axes[0, 1].set_ylabel('Average Time (ms)')
@@ -230,14 +251,14 @@ class OCIOChartGenerator:
 
             # 4. System count comparison
             if 'cpu_model' in data.columns:
-                aces_systems = data.groupby('aces_version')['cpu_model'].nunique()
+                aces_systems = data.groupby('aces_version', observed=True)['cpu_model'].nunique()
                 axes[1, 1].bar(aces_systems.index, aces_systems.values, 
                               color=['skyblue', 'lightcoral'])
                 axes[1, 1].set_title('Number of Systems Tested by ACES Version')
                 axes[1, 1].set_ylabel('Number of Systems')
 
             plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            self._save_figure(output_path)
             plt.close()
             
             logger.info(f"ACES comparison plot saved to {output_path}")
@@ -307,7 +328,7 @@ class OCIOChartGenerator:
                        square=True, fmt='.2f')
             plt.title('Performance Metrics Correlation Heatmap')
             plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            self._save_figure(output_path)
             plt.close()
             
             logger.info(f"Performance heatmap saved to {output_path}")
@@ -346,7 +367,7 @@ class OCIOChartGenerator:
             ax2.set_ylabel(f'{column} (ms)')
             
             plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            self._save_figure(output_path)
             plt.close()
             
             logger.info(f"Distribution plot saved to {output_path}")
@@ -395,7 +416,7 @@ class OCIOChartGenerator:
                         bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
                 
             plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            self._save_figure(output_path)
             plt.close()
             
             logger.info(f"Scatter plot saved to {output_path}")
@@ -428,7 +449,7 @@ class OCIOChartGenerator:
             plt.xticks(rotation=45)
             
             plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            self._save_figure(output_path)
             plt.close()
             
             logger.info(f"Violin plot saved to {output_path}")
@@ -476,7 +497,7 @@ class OCIOChartGenerator:
             plt.xticks(rotation=45)
             
             plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            self._save_figure(output_path)
             plt.close()
             
             logger.info(f"Time series plot saved to {output_path}")
@@ -15,6 +15,9 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Valid values of OCIOConfig.compute_engine
+COMPUTE_ENGINES = ('auto', 'numpy', 'numba')
+
 
 @dataclass
 class ChartConfig:
@@ -35,6 +38,8 @@ class ChartConfig:
     format: str = 'png'
     bbox_inches: str = 'tight'
     transparent: bool = False
+    # zlib level for PNG output (0-9); low levels encode much faster
+    png_compress_level: int = 1
 
 
 @dataclass 
@@ -91,8 +96,12 @@ class OCIOConfig:
     
     # Processing settings
     enable_caching: bool = True
+    cache_dir: str = '~/.cache/ocio_perf'
     parallel_processing: bool = False
     max_workers: int = 4
+    # Numeric kernels: 'numba' always JIT-compiles them, 'numpy' never does,
+    # and 'auto' compiles only where the input is large enough to repay it
+    compute_engine: str = 'auto'
     
     def __post_init__(self):
         if self.chart is None:
@@ -228,8 +237,10 @@ class ConfigurationManager:
             'default_data_dir': config.default_data_dir,
             'default_output_dir': config.default_output_dir,
             'enable_caching': config.enable_caching,
+            'cache_dir': config.cache_dir,
             'parallel_processing': config.parallel_processing,
-            'max_workers': config.max_workers
+            'max_workers': config.max_workers,
+            'compute_engine': config.compute_engine
         }
     
     def reset_to_defaults(self) -> None:
@@ -256,6 +267,12 @@ class ConfigurationManager:
         # Validate chart config
         if config_to_validate.chart.dpi < 50 or config_to_validate.chart.dpi > 600:
             errors.append("Chart DPI should be between 50 and 600")
+        if not 0 <= config_to_validate.chart.png_compress_level <= 9:
+            errors.append("PNG compression level must be between 0 and 9")
+            
+        # Validate processing settings
+        if config_to_validate.compute_engine not in COMPUTE_ENGINES:
+            errors.append(f"Compute engine must be one of: {list(COMPUTE_ENGINES)}")
             
         # Validate analysis config  
         if config_to_validate.analysis.outlier_threshold <= 0:
@@ -299,3 +316,16 @@ def get_config() -> OCIOConfig:
         Current configuration object
     """
     return get_config_manager().get_config()
+
+
+def set_config(config: OCIOConfig) -> None:
+    """
+    Replace the current configuration.
+
+    Used to hand the parent's configuration, including changes made at
+    runtime, to worker processes that would otherwise reload it from disk.
+
+    Args:
+        config: Configuration to use
+    """
+    get_config_manager()._config = config
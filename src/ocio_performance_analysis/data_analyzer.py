@@ -5,34 +5,77 @@ Handles data processing, comparisons, and statistical analysis
 for OCIO performance test results.
 """
 
-from functools import lru_cache
+import copy
+import hashlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from . import __version__
+from ._kernels import pair_improvements
+from .config import get_config
 from .exceptions import AnalysisError, DataValidationError, FileNotFoundError as OCIOFileNotFoundError
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Columns the analysis methods read; Parquet inputs are projected to these
+_NEEDED_COLUMNS = [
+    'file_name', 'os_release', 'cpu_model', 'ocio_version',
+    'target_colorspace', 'avg_time', 'min_time', 'max_time'
+]
+
+# Sort order applied once after loading; the comparison groupbys share this prefix
+_SORT_COLUMNS = ['cpu_model', 'os_release', 'aces_version', 'ocio_version']
+
+_READ_DTYPES = {'avg_time': 'float64', 'min_time': 'float64', 'max_time': 'float64'}
+
+# Version of the on-disk cache contents; bump it whenever loading or any
+# cached analysis changes its results so older cache entries are not reused
+_CACHE_SCHEMA = 4
+
+# Finest grouping shared by the comparison methods; each comparison rolls these
+# per-group sums and counts up instead of regrouping the full data
+_GROUP_STATS_KEYS = _SORT_COLUMNS + ['file_name']
+
+ComparisonBundle = namedtuple(
+    'ComparisonBundle', ['cpu_os', 'ocio_version', 'all_ocio_version']
+)
+
 
 class OCIODataAnalyzer:
     """Handles data analysis and comparison operations for OCIO performance data."""
 
-    def __init__(self, csv_file: Optional[Path] = None):
+    def __init__(self, csv_file: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize the data analyzer.
 
         Args:
-            csv_file: Path to the CSV file containing test results (optional)
+            csv_file: Path to the CSV (or ``.parquet``) file containing test results (optional)
+            cache_dir: Directory for the on-disk results cache. Defaults to the
+                      configured ``cache_dir`` when caching is enabled.
             
         Raises:
             FileNotFoundError: If the CSV file doesn't exist
         """
         self.csv_file = csv_file
+        # In-memory results keyed by (method name, data version)
+        self._cache: Dict[Tuple[str, int], Any] = {}
+        self._data_version = 0
+        self._loaded_version = None
         self.data = None
-        self._summary_cache = None
+
+        if cache_dir is None:
+            config = get_config()
+            if config.enable_caching:
+                cache_dir = Path(config.cache_dir).expanduser()
+        self.cache_dir = cache_dir
         
         # Validate CSV file if provided
         if csv_file and not csv_file.exists():
@@ -54,12 +97,48 @@ class OCIODataAnalyzer:
         self.csv_file = csv_file
         # Clear cached data when CSV changes
         self.data = None
-        self._summary_cache = None
+        self._cache.clear()
+
+    @property
+    def data(self) -> Optional[pd.DataFrame]:
+        """The loaded test results, or None if no data has been loaded."""
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[pd.DataFrame]) -> None:
+        # Any reassignment invalidates memoized results computed from the old data
+        self._data = value
+        self._data_version += 1
+        self._data_fingerprint = None
+
+    def _fingerprint_data(self) -> Tuple[Any, ...]:
+        """
+        Fingerprint the columns the analyses read, to detect in-place edits.
+
+        Returns:
+            Tuple of the data's columns, row count and a hash of its contents
+        """
+        columns = [column for column in _NEEDED_COLUMNS + ['aces_version'] if column in self._data]
+        content_hash = int(pd.util.hash_pandas_object(self._data[columns]).sum())
+        return tuple(self._data.columns), len(self._data), content_hash
+
+    def _check_data_unchanged(self) -> None:
+        """Treat data modified in place since results were memoized as new data."""
+        fingerprint = self._fingerprint_data()
+        if self._data_fingerprint is not None and fingerprint != self._data_fingerprint:
+            logger.debug("Data modified in place, discarding memoized results")
+            self._data_version += 1
+        self._data_fingerprint = fingerprint
 
-    def load_data(self) -> pd.DataFrame:
+    def load_data(self, chunksize: Optional[int] = None) -> pd.DataFrame:
         """
         Load test results from CSV file.
 
+        Args:
+            chunksize: When set, stream the CSV in chunks of this many rows and
+                      keep only the columns the analysis methods use. This keeps
+                      peak memory low for CSVs too large to read in one go.
+
         Returns:
             DataFrame containing the test results
             
@@ -78,23 +157,10 @@ class OCIODataAnalyzer:
             return self.data
             
         try:
-            logger.info(f"Loading data from {self.csv_file}")
-            self.data = pd.read_csv(self.csv_file)
-            
-            if self.data.empty:
-                raise DataValidationError("CSV file contains no data")
-                
-            logger.info(f"Loaded {len(self.data)} test results")
-            
-            # Validate data quality
-            self._validate_data_quality()
-            
-            # Add ACES version categorization
-            self.data['aces_version'] = self.data['target_colorspace'].apply(
-                self._categorize_aces_version
-            )
-            
-            logger.info("Data loading and validation completed successfully")
+            cache_name = 'data' if chunksize is None else 'data.projected'
+            self.data = self._disk_cached(cache_name, lambda: self._read_data(chunksize))
+            self._loaded_version = self._data_version
+            self._data_fingerprint = self._fingerprint_data()
             return self.data
             
         except Exception as e:
@@ -102,15 +168,296 @@ class OCIODataAnalyzer:
                 raise
             raise AnalysisError(f"Failed to load data from {self.csv_file}: {e}")
 
-    def _validate_data_quality(self) -> None:
+    def _read_data(self, chunksize: Optional[int] = None) -> pd.DataFrame:
+        """
+        Read, validate and categorize the CSV file contents.
+
+        Parquet files (``.parquet`` suffix) are read with column projection,
+        loading only the columns the analysis methods need.
+
+        Args:
+            chunksize: Optional number of rows per chunk for streamed CSV reads
+
+        Returns:
+            DataFrame containing the test results
+        """
+        logger.info(f"Loading data from {self.csv_file}")
+        if self.csv_file.suffix == '.parquet':
+            data = pd.read_parquet(self.csv_file, columns=_NEEDED_COLUMNS)
+        elif chunksize:
+            data = self._read_csv_chunks(chunksize)
+        else:
+            data = pd.read_csv(self.csv_file)
+        
+        if data.empty:
+            raise DataValidationError("CSV file contains no data")
+            
+        logger.info(f"Loaded {len(data)} test results")
+        
+        data = self._prepare_data(data)
+        
+        logger.info("Data loading and validation completed successfully")
+        return data
+
+    def set_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Use already parsed test results instead of reading a file.
+
+        This accepts the DataFrame produced by ``OCIOTestParser.to_dataframe``
+        so results can be analyzed without a CSV round trip.
+
+        Args:
+            data: DataFrame of test results
+
+        Returns:
+            The validated and categorized DataFrame now held by the analyzer
+            
+        Raises:
+            DataValidationError: If data is empty or invalid
+        """
+        if data.empty:
+            raise DataValidationError("No test results provided")
+
+        self.data = self._prepare_data(data.copy())
+        return self.data
+
+    def _prepare_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validate, categorize and sort freshly loaded test results.
+
+        Args:
+            data: DataFrame of test results
+
+        Returns:
+            DataFrame ready for analysis
+        """
+        # Validate data quality
+        self._validate_data_quality(data)
+        
+        # Add ACES version categorization
+        if 'aces_version' not in data.columns:
+            data['aces_version'] = self._categorize_aces_versions(data['target_colorspace'])
+
+        # Group keys repeat a handful of values; as categoricals they are
+        # stored once and grouped and sorted by integer code
+        for column in _GROUP_STATS_KEYS:
+            if column in data.columns:
+                data[column] = data[column].astype('category')
+
+        # Sort once so the comparison groupbys see each group in consecutive rows
+        return data.sort_values(_SORT_COLUMNS, kind='stable', ignore_index=True)
+
+    def _read_csv_chunks(self, chunksize: int) -> pd.DataFrame:
+        """
+        Stream the CSV file in chunks, keeping only the analysis columns.
+
+        Each chunk is projected to the needed columns and categorized as it is
+        read, so the wide ``timing_values`` text column is never held in memory.
+
+        Args:
+            chunksize: Number of rows per chunk
+
+        Returns:
+            DataFrame containing the projected test results
+        """
+        chunks = []
+        reader = pd.read_csv(
+            self.csv_file,
+            chunksize=chunksize,
+            usecols=lambda column: column in _NEEDED_COLUMNS,
+            dtype=_READ_DTYPES,
+        )
+        for chunk in reader:
+            if 'target_colorspace' in chunk.columns:
+                chunk['aces_version'] = self._categorize_aces_versions(chunk['target_colorspace'])
+            chunks.append(chunk)
+            
+        logger.debug(f"Read {len(chunks)} chunks of up to {chunksize} rows")
+
+        if not chunks:
+            return pd.DataFrame(columns=_NEEDED_COLUMNS)
+        return pd.concat(chunks, ignore_index=True)
+
+    def to_parquet(self, path: Path) -> None:
+        """
+        Write the loaded test results to a Parquet file.
+
+        The Parquet file can be passed back to the analyzer in place of the
+        CSV to skip CSV tokenization on subsequent runs. Requires pyarrow
+        (``pip install ocio-performance-analysis[parquet]``).
+
+        Args:
+            path: Output path for the Parquet file
+            
+        Raises:
+            AnalysisError: If the Parquet file cannot be written
+        """
+        data = self.load_data()
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(path, index=False)
+            logger.info(f"Saved {len(data)} test results to {path}")
+        except Exception as e:
+            raise AnalysisError(f"Failed to write Parquet file {path}: {e}")
+
+    def _cache_prefix(self) -> str:
+        """
+        Build the cache file prefix shared by every version of the CSV file.
+
+        Returns:
+            Hex digest of the resolved CSV path
+        """
+        return hashlib.sha1(str(self.csv_file.resolve()).encode('utf-8')).hexdigest()[:20]
+
+    def _cache_key(self) -> str:
+        """
+        Build a key identifying the current contents of the CSV file.
+
+        The key combines the path prefix with the file's modification time and
+        size, the package version and the cache schema, so rewriting the CSV or
+        upgrading the analysis code invalidates previous cache entries.
+
+        Returns:
+            Cache file prefix of the form ``<path digest>-<content digest>``
+        """
+        stat = self.csv_file.stat()
+        identity = f"{__version__}:{_CACHE_SCHEMA}:{stat.st_mtime_ns}:{stat.st_size}"
+        return f"{self._cache_prefix()}-{hashlib.sha1(identity.encode('utf-8')).hexdigest()[:20]}"
+
+    def clear_cache(self) -> int:
+        """
+        Drop memoized results and remove this CSV file's on-disk cache entries.
+
+        Cache entries left behind by earlier versions of the file are removed
+        too. The loaded data itself is kept; call set_csv_file() to reload it.
+
+        Returns:
+            Number of cache files removed
+        """
+        self._cache.clear()
+        if self.cache_dir is None or self.csv_file is None or not self.cache_dir.is_dir():
+            return 0
+
+        removed = 0
+        for cache_path in self.cache_dir.glob(f"{self._cache_prefix()}-*"):
+            try:
+                cache_path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to remove cache file {cache_path}: {e}")
+
+        logger.info(f"Removed {removed} cache files for {self.csv_file}")
+        return removed
+
+    def _memoized(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a result memoized for the current data, computing it if needed.
+
+        Results are kept in memory per data version. Reassigning ``data`` or
+        editing it in place starts a new version. The on-disk cache is only
+        consulted while the data is exactly what load_data() read from the file;
+        data assigned directly is never matched against cache files.
+
+        Callers get their own copy of the result, so modifying it does not
+        affect later calls.
+
+        Args:
+            name: Name of the cached result
+            compute: Callable producing the result when it is not cached
+
+        Returns:
+            The cached or freshly computed result
+        """
+        self._check_data_unchanged()
+        key = (name, self._data_version)
+        if key in self._cache:
+            logger.debug(f"Using memoized {name}")
+            return self._copy_result(self._cache[key])
+
+        if self._data_version == self._loaded_version:
+            result = self._disk_cached(name, compute)
+        else:
+            result = compute()
+
+        self._cache[key] = result
+        return self._copy_result(result)
+
+    @staticmethod
+    def _copy_result(result: Any) -> Any:
+        """Copy a memoized result so callers cannot modify the memoized one."""
+        if isinstance(result, pd.DataFrame):
+            return result.copy()
+        return copy.deepcopy(result)
+
+    def _disk_cached(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a result from the on-disk cache, computing and storing it on a miss.
+
+        Args:
+            name: Name of the cached result (used in the cache file name)
+            compute: Callable producing the result when it is not cached
+
+        Returns:
+            The cached or freshly computed result
+        """
+        if self.cache_dir is None or self.csv_file is None:
+            return compute()
+
+        cache_key = self._cache_key()
+        cache_path = self.cache_dir / f"{cache_key}.{name}.pkl"
+        if cache_path.exists():
+            try:
+                result = pd.read_pickle(cache_path)
+                logger.debug(f"Loaded cached {name} from {cache_path}")
+                return result
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+
+        result = compute()
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a private temporary file first so concurrent readers never
+            # observe a partially written cache entry
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            pd.to_pickle(result, tmp_path)
+            os.replace(tmp_path, cache_path)
+            logger.debug(f"Cached {name} to {cache_path}")
+        except OSError as e:
+            logger.warning(f"Failed to write cache file {cache_path}: {e}")
+
+        self._remove_stale_cache_files(cache_key)
+        return result
+
+    def _remove_stale_cache_files(self, cache_key: str) -> None:
+        """
+        Remove cache files left by earlier versions of the CSV file or package.
+
+        Args:
+            cache_key: Key of the current cache entries, which are kept
+        """
+        for cache_path in self.cache_dir.glob(f"{self._cache_prefix()}-*.pkl"):
+            if cache_path.name.startswith(f"{cache_key}."):
+                continue
+            try:
+                cache_path.unlink()
+                logger.debug(f"Removed stale cache file {cache_path}")
+            except OSError as e:
+                logger.warning(f"Failed to remove stale cache file {cache_path}: {e}")
+
+    def _validate_data_quality(self, data: pd.DataFrame) -> None:
         """
         Validate the quality and completeness of loaded data.
+
+        Args:
+            data: DataFrame read from the CSV file
         
         Raises:
             DataValidationError: If data quality issues are found
         """
         required_columns = ['avg_time', 'min_time', 'max_time', 'file_name', 'cpu_model']
-        missing_columns = [col for col in required_columns if col not in self.data.columns]
+        missing_columns = [col for col in required_columns if col not in data.columns]
         
         if missing_columns:
             raise DataValidationError(f"Missing required columns: {missing_columns}")
@@ -118,23 +465,23 @@ class OCIODataAnalyzer:
         # Check for negative timing values
         timing_columns = ['avg_time', 'min_time', 'max_time']
         for col in timing_columns:
-            if col in self.data.columns:
-                negative_count = (self.data[col] < 0).sum()
+            if col in data.columns:
+                negative_count = (data[col] < 0).sum()
                 if negative_count > 0:
                     logger.warning(f"Found {negative_count} negative values in {col}")
         
         # Check for reasonable timing ranges (not too large)
         max_reasonable_time = 100000  # 100 seconds in ms
         for col in timing_columns:
-            if col in self.data.columns:
-                large_values = (self.data[col] > max_reasonable_time).sum()
+            if col in data.columns:
+                large_values = (data[col] > max_reasonable_time).sum()
                 if large_values > 0:
                     logger.warning(f"Found {large_values} unusually large values in {col} (>{max_reasonable_time}ms)")
         
         # Check data completeness
-        total_rows = len(self.data)
+        total_rows = len(data)
         for col in required_columns:
-            null_count = self.data[col].isnull().sum()
+            null_count = data[col].isnull().sum()
             if null_count > 0:
                 null_pct = (null_count / total_rows) * 100
                 if null_pct > 10:  # More than 10% missing
@@ -144,26 +491,26 @@ class OCIODataAnalyzer:
         
         logger.debug(f"Data quality validation completed for {total_rows} rows")
 
-    def _categorize_aces_version(self, target_colorspace: str) -> str:
+    @staticmethod
+    def _categorize_aces_versions(target_colorspace: pd.Series) -> pd.Series:
         """
-        Categorize target colorspace into ACES version.
+        Categorize target colorspaces into ACES versions.
 
         Args:
-            target_colorspace: The target colorspace string
+            target_colorspace: Series of target colorspace strings
 
         Returns:
-            ACES version ("ACES 1.0" or "ACES 2.0")
+            Series of ACES versions ("ACES 1.0", "ACES 2.0" or "Unknown")
         """
-        if pd.isna(target_colorspace):
-            return "Unknown"
-            
-        target_lower = target_colorspace.lower()
-        if "aces 1.0" in target_lower or "aces 1" in target_lower:
-            return "ACES 1.0"
-        elif "aces 2.0" in target_lower or "aces 2" in target_lower:
-            return "ACES 2.0"
-        else:
-            return "Unknown"
+        target_lower = target_colorspace.astype('string').str.lower()
+        conditions = [
+            target_lower.str.contains("aces 1", na=False, regex=False),
+            target_lower.str.contains("aces 2", na=False, regex=False),
+        ]
+        return pd.Series(
+            np.select(conditions, ["ACES 1.0", "ACES 2.0"], default="Unknown"),
+            index=target_colorspace.index,
+        )
 
     def summarize_by_filename(self) -> pd.DataFrame:
         """
@@ -178,38 +525,147 @@ class OCIODataAnalyzer:
         if self.data is None:
             raise AnalysisError("Data not loaded. Call load_data() first.")
             
-        # Return cached summary if available
-        if self._summary_cache is not None:
-            logger.debug("Using cached summary data")
-            return self._summary_cache
-            
         try:
-            summary = self.data.groupby([
-                'file_name', 'os_release', 'cpu_model', 'ocio_version', 
-                'aces_version'
-            ]).agg({
-                'avg_time': ['count', 'mean', 'std', 'min', 'max'],
-                'min_time': 'min',
-                'max_time': 'max'
-            }).round(3)
-
-            # Flatten column names
-            summary.columns = [
-                'operation_count', 'mean_avg_time', 'std_avg_time', 
-                'min_avg_time', 'max_avg_time', 'global_min_time', 'global_max_time'
-            ]
-
-            result = summary.reset_index()
-            
-            # Cache the result for future use
-            self._summary_cache = result
-            logger.debug("Summary data cached for future use")
-            
-            return result
+            return self._memoized('summary', self._compute_summary)
             
         except Exception as e:
             raise AnalysisError(f"Failed to create summary: {e}")
 
+    def _compute_summary(self) -> pd.DataFrame:
+        """Compute the result for summarize_by_filename()."""
+        summary = self.data.groupby([
+            'file_name', 'os_release', 'cpu_model', 'ocio_version', 
+            'aces_version'
+        ], observed=True).agg(
+            operation_count=('avg_time', 'count'),
+            mean_avg_time=('avg_time', 'mean'),
+            std_avg_time=('avg_time', 'std'),
+            min_avg_time=('avg_time', 'min'),
+            max_avg_time=('avg_time', 'max'),
+            global_min_time=('min_time', 'min'),
+            global_max_time=('max_time', 'max'),
+        )
+
+        return summary.round(3).reset_index()
+
+    def _group_stats(self) -> pd.DataFrame:
+        """
+        Return avg_time sums and counts per CPU, OS, ACES version, OCIO version and file.
+
+        This is the one pass over the full data shared by the comparison
+        methods. Groups keep the order in which they first appear in the data,
+        so rolling them up reproduces a direct groupby including its 'first'
+        aggregations.
+
+        Returns:
+            DataFrame with the group keys and ``time_sum``/``time_count`` columns
+        """
+        return self._memoized('group_stats', lambda: self.data.groupby(
+            _GROUP_STATS_KEYS, sort=False, observed=True, dropna=False
+        )['avg_time'].agg(time_sum='sum', time_count='count').reset_index())
+
+    def _rollup_group_stats(self, keys: List[str], first_columns: List[str]) -> pd.DataFrame:
+        """
+        Aggregate the shared group statistics to a coarser grouping.
+
+        Args:
+            keys: Columns to group by
+            first_columns: Columns to keep the first value of within each group
+
+        Returns:
+            DataFrame with the group keys, the mean ``avg_time`` and first values
+        """
+        aggregations = {'time_sum': ('time_sum', 'sum'), 'time_count': ('time_count', 'sum')}
+        aggregations.update({column: (column, 'first') for column in first_columns})
+
+        grouped = self._group_stats().groupby(
+            keys, sort=False, observed=True
+        ).agg(**aggregations).reset_index()
+        grouped['avg_time'] = grouped.pop('time_sum') / grouped.pop('time_count')
+        return grouped
+
+    @staticmethod
+    def _pair_comparisons(grouped: pd.DataFrame, group_keys: List[str], member_key: str,
+                          log_message: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pair up the rows of ``grouped`` that share the same ``group_keys``.
+
+        Groups are visited in order of first appearance of each key, one key
+        nested inside the previous one, and rows keep their order within each
+        group. Pairs whose times are not both positive are dropped.
+
+        Args:
+            grouped: Aggregated data with one row per group member and an
+                     ``avg_time`` column
+            group_keys: Columns identifying the groups to compare within
+            member_key: Column distinguishing the members of a group (logged)
+            log_message: %-style message logged for each group with several
+                         members, given the group keys and member values
+
+        Returns:
+            Tuple of (first row, second row, improvement percentage) arrays,
+            with rows as positions in ``grouped``
+        """
+        if grouped.empty:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.float64)
+
+        codes = [pd.factorize(grouped[key])[0] for key in group_keys]
+        # lexsort is stable and treats its last key as the primary one
+        order = np.lexsort(codes[::-1])
+        sorted_codes = np.column_stack([key_codes[order] for key_codes in codes])
+        boundaries = np.flatnonzero((np.diff(sorted_codes, axis=0) != 0).any(axis=1)) + 1
+        group_starts = np.concatenate(([0], boundaries)).astype(np.int64)
+        group_ends = np.concatenate((boundaries, [len(order)])).astype(np.int64)
+
+        if logger.isEnabledFor(logging.INFO):
+            for start, end in zip(group_starts, group_ends):
+                if end - start > 1:
+                    members = grouped.iloc[order[start:end]]
+                    logger.info(
+                        log_message,
+                        *members[group_keys].iloc[0], members[member_key].to_numpy()
+                    )
+
+        times = grouped['avg_time'].to_numpy(dtype=np.float64)[order]
+        first, second, improvement_pct = pair_improvements(
+            times, group_starts, group_ends, get_config().compute_engine
+        )
+        valid = ~np.isnan(improvement_pct)
+        return order[first[valid]], order[second[valid]], improvement_pct[valid]
+
+    @staticmethod
+    def _order_pairs(grouped: pd.DataFrame, first: np.ndarray,
+                     second: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Order compared rows by speed; on equal times the second row counts as faster.
+
+        Returns:
+            Tuple of (faster row, slower row) arrays
+        """
+        times = grouped['avg_time'].to_numpy()
+        first_faster = times[first] < times[second]
+        return np.where(first_faster, first, second), np.where(first_faster, second, first)
+
+    def find_all_comparisons(self) -> ComparisonBundle:
+        """
+        Find the CPU/OS, OCIO version and overall OCIO version comparisons together.
+
+        All three are derived from one shared aggregate of the data, so this is
+        cheaper than grouping the full data once per comparison.
+
+        Returns:
+            ComparisonBundle of the three comparison DataFrames
+
+        Raises:
+            AnalysisError: If comparison analysis fails
+        """
+        return ComparisonBundle(
+            cpu_os=self.find_cpu_os_comparisons(),
+            ocio_version=self.find_ocio_version_comparisons(),
+            all_ocio_version=self.find_all_ocio_version_comparisons()
+        )
+
     def find_cpu_os_comparisons(self) -> pd.DataFrame:
         """
         Find CPU/OS combinations that appear in both r7 and r9 releases.
@@ -224,79 +680,48 @@ class OCIODataAnalyzer:
             raise AnalysisError("Data not loaded. Call load_data() first.")
             
         try:
-            logger.info("Finding CPU/OS combinations with both r7 and r9 data")
-            
-            # Group by CPU model, ACES version, and OS release
-            grouped = self.data.groupby([
-                'cpu_model', 'aces_version', 'os_release'
-            ]).agg({
-                'avg_time': 'mean',
-                'file_name': 'first',
-                'ocio_version': 'first'
-            }).reset_index()
-
-            # Find CPUs that have both r7 and r9 data for each ACES version
-            comparisons = []
-            
-            for cpu_model in grouped['cpu_model'].unique():
-                for aces_version in grouped['aces_version'].unique():
-                    cpu_aces_data = grouped[
-                        (grouped['cpu_model'] == cpu_model) & 
-                        (grouped['aces_version'] == aces_version)
-                    ]
-                    
-                    os_releases = cpu_aces_data['os_release'].unique()
-                    
-                    if len(os_releases) > 1:
-                        logger.info(
-                            f"Found CPU '{cpu_model}' with ACES {aces_version} "
-                            f"having OS releases: {os_releases}"
-                        )
-                        
-                        # Create all pairwise comparisons
-                        for i, os1 in enumerate(os_releases):
-                            for os2 in os_releases[i+1:]:
-                                data1 = cpu_aces_data[cpu_aces_data['os_release'] == os1].iloc[0]
-                                data2 = cpu_aces_data[cpu_aces_data['os_release'] == os2].iloc[0]
-                                
-                                # Calculate performance difference
-                                if data1['avg_time'] > 0 and data2['avg_time'] > 0:
-                                    if data1['avg_time'] < data2['avg_time']:
-                                        faster_time, slower_time = data1['avg_time'], data2['avg_time']
-                                        faster_os, slower_os = os1, os2
-                                        faster_file, slower_file = data1['file_name'], data2['file_name']
-                                    else:
-                                        faster_time, slower_time = data2['avg_time'], data1['avg_time']
-                                        faster_os, slower_os = os2, os1
-                                        faster_file, slower_file = data2['file_name'], data1['file_name']
-                                    
-                                    improvement_pct = ((slower_time - faster_time) / slower_time) * 100
-                                    
-                                    comparisons.append({
-                                        'cpu_model': cpu_model,
-                                        'aces_version': aces_version,
-                                        'faster_os': faster_os,
-                                        'slower_os': slower_os,
-                                        'faster_time': faster_time,
-                                        'slower_time': slower_time,
-                                        'improvement_pct': improvement_pct,
-                                        'faster_file': faster_file,
-                                        'slower_file': slower_file,
-                                        'ocio_version': data1['ocio_version']
-                                    })
-
-            if not comparisons:
-                logger.warning("No CPU/OS comparisons found")
-                return pd.DataFrame()
-                
-            result = pd.DataFrame(comparisons)
-            logger.info(f"Found {len(result)} CPU/OS performance comparisons")
-            
-            return result.sort_values('improvement_pct', ascending=False)
+            return self._memoized('cpu_os_comparisons', self._compute_cpu_os_comparisons)
             
         except Exception as e:
             raise AnalysisError(f"Failed to find CPU/OS comparisons: {e}")
 
+    def _compute_cpu_os_comparisons(self) -> pd.DataFrame:
+        """Compute the result for find_cpu_os_comparisons()."""
+        logger.info("Finding CPU/OS combinations with both r7 and r9 data")
+        
+        # Group by CPU model, ACES version, and OS release
+        grouped = self._rollup_group_stats(
+            ['cpu_model', 'aces_version', 'os_release'],
+            first_columns=['file_name', 'ocio_version']
+        )
+
+        # Compare every pair of OS releases a CPU has for each ACES version
+        first, second, improvement_pct = self._pair_comparisons(
+            grouped, ['cpu_model', 'aces_version'], 'os_release',
+            "Found CPU '%s' with ACES %s having OS releases: %s"
+        )
+
+        if first.size == 0:
+            logger.warning("No CPU/OS comparisons found")
+            return pd.DataFrame()
+
+        faster, slower = self._order_pairs(grouped, first, second)
+        result = pd.DataFrame({
+            'cpu_model': grouped['cpu_model'].to_numpy()[first],
+            'aces_version': grouped['aces_version'].to_numpy()[first],
+            'faster_os': grouped['os_release'].to_numpy()[faster],
+            'slower_os': grouped['os_release'].to_numpy()[slower],
+            'faster_time': grouped['avg_time'].to_numpy()[faster],
+            'slower_time': grouped['avg_time'].to_numpy()[slower],
+            'improvement_pct': improvement_pct,
+            'faster_file': grouped['file_name'].to_numpy()[faster],
+            'slower_file': grouped['file_name'].to_numpy()[slower],
+            'ocio_version': grouped['ocio_version'].to_numpy()[first]
+        })
+        logger.info(f"Found {len(result)} CPU/OS performance comparisons")
+        
+        return result.sort_values('improvement_pct', ascending=False)
+
     def find_ocio_version_comparisons(self) -> pd.DataFrame:
         """
         Find systems with multiple OCIO versions for comparison.
@@ -311,79 +736,48 @@ class OCIODataAnalyzer:
             raise AnalysisError("Data not loaded. Call load_data() first.")
             
         try:
-            logger.info("Finding OCIO version comparisons")
-            
-            # Group by system configuration
-            grouped = self.data.groupby([
-                'cpu_model', 'os_release', 'aces_version', 'ocio_version'
-            ]).agg({
-                'avg_time': 'mean',
-                'file_name': 'first'
-            }).reset_index()
-
-            comparisons = []
-            
-            # Find systems with multiple OCIO versions
-            for cpu_model in grouped['cpu_model'].unique():
-                for os_release in grouped['os_release'].unique():
-                    for aces_version in grouped['aces_version'].unique():
-                        system_data = grouped[
-                            (grouped['cpu_model'] == cpu_model) & 
-                            (grouped['os_release'] == os_release) &
-                            (grouped['aces_version'] == aces_version)
-                        ]
-                        
-                        ocio_versions = system_data['ocio_version'].unique()
-                        
-                        if len(ocio_versions) > 1:
-                            logger.info(
-                                f"Found system CPU '{cpu_model}', OS '{os_release}', "
-                                f"ACES {aces_version} with OCIO versions: {ocio_versions}"
-                            )
-                            
-                            # Create pairwise comparisons
-                            for i, ver1 in enumerate(ocio_versions):
-                                for ver2 in ocio_versions[i+1:]:
-                                    data1 = system_data[system_data['ocio_version'] == ver1].iloc[0]
-                                    data2 = system_data[system_data['ocio_version'] == ver2].iloc[0]
-                                    
-                                    if data1['avg_time'] > 0 and data2['avg_time'] > 0:
-                                        if data1['avg_time'] < data2['avg_time']:
-                                            faster_time, slower_time = data1['avg_time'], data2['avg_time']
-                                            faster_ver, slower_ver = ver1, ver2
-                                            faster_file, slower_file = data1['file_name'], data2['file_name']
-                                        else:
-                                            faster_time, slower_time = data2['avg_time'], data1['avg_time']
-                                            faster_ver, slower_ver = ver2, ver1
-                                            faster_file, slower_file = data2['file_name'], data1['file_name']
-                                        
-                                        improvement_pct = ((slower_time - faster_time) / slower_time) * 100
-                                        
-                                        comparisons.append({
-                                            'cpu_model': cpu_model,
-                                            'os_release': os_release,
-                                            'aces_version': aces_version,
-                                            'faster_ocio_version': faster_ver,
-                                            'slower_ocio_version': slower_ver,
-                                            'faster_time': faster_time,
-                                            'slower_time': slower_time,
-                                            'improvement_pct': improvement_pct,
-                                            'faster_file': faster_file,
-                                            'slower_file': slower_file
-                                        })
-
-            if not comparisons:
-                logger.warning("No OCIO version comparisons found")
-                return pd.DataFrame()
-                
-            result = pd.DataFrame(comparisons)
-            logger.info(f"Found {len(result)} OCIO version performance comparisons")
-            
-            return result.sort_values('improvement_pct', ascending=False)
+            return self._memoized('ocio_version_comparisons', self._compute_ocio_version_comparisons)
             
         except Exception as e:
             raise AnalysisError(f"Failed to find OCIO version comparisons: {e}")
 
+    def _compute_ocio_version_comparisons(self) -> pd.DataFrame:
+        """Compute the result for find_ocio_version_comparisons()."""
+        logger.info("Finding OCIO version comparisons")
+        
+        # Group by system configuration
+        grouped = self._rollup_group_stats(
+            ['cpu_model', 'os_release', 'aces_version', 'ocio_version'],
+            first_columns=['file_name']
+        )
+
+        # Compare every pair of OCIO versions each system was tested with
+        first, second, improvement_pct = self._pair_comparisons(
+            grouped, ['cpu_model', 'os_release', 'aces_version'], 'ocio_version',
+            "Found system CPU '%s', OS '%s', ACES %s with OCIO versions: %s"
+        )
+
+        if first.size == 0:
+            logger.warning("No OCIO version comparisons found")
+            return pd.DataFrame()
+
+        faster, slower = self._order_pairs(grouped, first, second)
+        result = pd.DataFrame({
+            'cpu_model': grouped['cpu_model'].to_numpy()[first],
+            'os_release': grouped['os_release'].to_numpy()[first],
+            'aces_version': grouped['aces_version'].to_numpy()[first],
+            'faster_ocio_version': grouped['ocio_version'].to_numpy()[faster],
+            'slower_ocio_version': grouped['ocio_version'].to_numpy()[slower],
+            'faster_time': grouped['avg_time'].to_numpy()[faster],
+            'slower_time': grouped['avg_time'].to_numpy()[slower],
+            'improvement_pct': improvement_pct,
+            'faster_file': grouped['file_name'].to_numpy()[faster],
+            'slower_file': grouped['file_name'].to_numpy()[slower]
+        })
+        logger.info(f"Found {len(result)} OCIO version performance comparisons")
+        
+        return result.sort_values('improvement_pct', ascending=False)
+
     def find_all_ocio_version_comparisons(self) -> pd.DataFrame:
         """
         Find all OCIO version comparisons regardless of system configuration.
@@ -398,28 +792,32 @@ class OCIODataAnalyzer:
             raise AnalysisError("Data not loaded. Call load_data() first.")
             
         try:
-            logger.info("Finding all OCIO version comparisons")
-            
-            # Group by OCIO version and ACES version
-            grouped = self.data.groupby(['ocio_version', 'aces_version']).agg({
-                'avg_time': 'mean',
-                'cpu_model': 'nunique',
-                'os_release': 'nunique',
-                'file_name': 'nunique'
-            }).reset_index()
-
-            grouped.columns = [
-                'ocio_version', 'aces_version', 'mean_avg_time',
-                'cpu_count', 'os_count', 'file_count'
-            ]
-            
-            logger.info(f"Found {len(grouped)} OCIO version/ACES combinations")
-            
-            return grouped.sort_values(['aces_version', 'mean_avg_time'])
+            return self._memoized('all_ocio_version_comparisons', self._compute_all_ocio_version_comparisons)
             
         except Exception as e:
             raise AnalysisError(f"Failed to find all OCIO version comparisons: {e}")
 
+    def _compute_all_ocio_version_comparisons(self) -> pd.DataFrame:
+        """Compute the result for find_all_ocio_version_comparisons()."""
+        logger.info("Finding all OCIO version comparisons")
+        
+        # Group by OCIO version and ACES version
+        grouped = self._group_stats().groupby(
+            ['ocio_version', 'aces_version'], sort=False, observed=True
+        ).agg(
+            time_sum=('time_sum', 'sum'),
+            time_count=('time_count', 'sum'),
+            cpu_count=('cpu_model', 'nunique'),
+            os_count=('os_release', 'nunique'),
+            file_count=('file_name', 'nunique')
+        ).reset_index()
+
+        grouped.insert(2, 'mean_avg_time', grouped.pop('time_sum') / grouped.pop('time_count'))
+        
+        logger.info(f"Found {len(grouped)} OCIO version/ACES combinations")
+        
+        return grouped.sort_values(['aces_version', 'mean_avg_time'])
+
     def get_performance_summary(self) -> Dict[str, any]:
         """
         Get overall performance summary statistics.
@@ -434,27 +832,62 @@ class OCIODataAnalyzer:
             raise AnalysisError("Data not loaded. Call load_data() first.")
             
         try:
-            summary = {
-                'total_results': len(self.data),
-                'unique_files': self.data['file_name'].nunique(),
-                'unique_cpus': self.data['cpu_model'].nunique(),
-                'unique_os_releases': self.data['os_release'].nunique(),
-                'ocio_versions': sorted(self.data['ocio_version'].unique()),
-                'aces_versions': sorted(self.data['aces_version'].unique()),
-                'avg_time_stats': {
-                    'mean': self.data['avg_time'].mean(),
-                    'median': self.data['avg_time'].median(),
-                    'std': self.data['avg_time'].std(),
-                    'min': self.data['avg_time'].min(),
-                    'max': self.data['avg_time'].max()
-                }
-            }
-            
-            return summary
+            return self._memoized('performance_summary', self._compute_performance_summary)
             
         except Exception as e:
             raise AnalysisError(f"Failed to generate performance summary: {e}")
 
+    def _compute_performance_summary(self) -> Dict[str, Any]:
+        """Compute the result for get_performance_summary()."""
+        unique_counts = self.data[['file_name', 'cpu_model', 'os_release']].nunique()
+        avg_time_stats = self.data['avg_time'].agg(['mean', 'median', 'std', 'min', 'max'])
+
+        summary = {
+            'total_results': len(self.data),
+            'unique_files': int(unique_counts['file_name']),
+            'unique_cpus': int(unique_counts['cpu_model']),
+            'unique_os_releases': int(unique_counts['os_release']),
+            # Versions are stored as strings so reports can join them directly
+            'ocio_versions': [str(version) for version in sorted(self.data['ocio_version'].unique())],
+            'aces_versions': [str(version) for version in sorted(self.data['aces_version'].unique())],
+            'avg_time_stats': avg_time_stats.to_dict()
+        }
+        
+        return summary
+
+    def run_all_analyses(self) -> Dict[str, Any]:
+        """
+        Run the independent analysis methods concurrently.
+
+        The analyses only read ``self.data`` and spend most of their time in
+        pandas kernels that release the GIL, so a thread pool brings wall time
+        down towards that of the slowest analysis.
+
+        Returns:
+            Dictionary mapping analysis name to its result
+            
+        Raises:
+            AnalysisError: If data is not loaded or any analysis fails
+        """
+        if self.data is None:
+            raise AnalysisError("Data not loaded. Call load_data() first.")
+
+        analyses = {
+            'summary': self.summarize_by_filename,
+            'cpu_os_comparisons': self.find_cpu_os_comparisons,
+            'ocio_version_comparisons': self.find_ocio_version_comparisons,
+            'all_ocio_version_comparisons': self.find_all_ocio_version_comparisons,
+            'performance_summary': self.get_performance_summary,
+        }
+
+        # Build the aggregate shared by the comparisons once, before the
+        # comparison threads would each race to compute it
+        self._group_stats()
+
+        with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            futures = {name: executor.submit(method) for name, method in analyses.items()}
+            return {name: future.result() for name, future in futures.items()}
+
     # Statistical utility methods
     
     def get_outliers(self, column: str = 'avg_time', threshold: float = 2.0) -> pd.DataFrame:
@@ -558,7 +991,7 @@ class OCIODataAnalyzer:
             if value_column not in self.data.columns:
                 raise AnalysisError(f"Value column '{value_column}' not found in data")
                 
-            comparison = self.data.groupby(group_column)[value_column].agg([
+            comparison = self.data.groupby(group_column, observed=True)[value_column].agg([
                 'count', 'mean', 'median', 'std', 'min', 'max'
             ]).round(3)
             
@@ -574,19 +1007,6 @@ class OCIODataAnalyzer:
         except Exception as e:
             raise AnalysisError(f"Failed to compare groups: {e}")
     
-    @lru_cache(maxsize=128)
-    def _cached_categorize_aces_version(self, target_colorspace: str) -> str:
-        """
-        Cached version of ACES version categorization for better performance.
-        
-        Args:
-            target_colorspace: The target colorspace string
-
-        Returns:
-            ACES version ("ACES 1.0" or "ACES 2.0")
-        """
-        return self._categorize_aces_version(target_colorspace)
-    
     def get_data_info(self) -> Dict[str, any]:
         """
         Get comprehensive information about the loaded data.
@@ -605,7 +1025,7 @@ class OCIODataAnalyzer:
             "null_counts": self.data.isnull().sum().to_dict(),
             "data_types": self.data.dtypes.to_dict(),
             "csv_file": str(self.csv_file) if self.csv_file else None,
-            "cached_summary": self._summary_cache is not None
+            "cached_summary": ('summary', self._data_version) in self._cache
         }
         
         return info
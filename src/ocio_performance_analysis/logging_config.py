@@ -70,5 +70,5 @@ def get_logger(name: str = "ocio_performance_analysis") -> logging.Logger:
     return logging.getLogger(name)
 
 
-# Configure default logger on import
-default_logger = setup_logging()
+# Libraries should not configure output; entry points call setup_logging()
+logging.getLogger("ocio_performance_analysis").addHandler(logging.NullHandler())
@@ -2,46 +2,133 @@
 OCIO Test Results Parser
 
 This module parses OCIO test result files and converts them to CSV format.
-Each test run contains mult            # Split content by test runs (separated by OCIO Version)
-            test_runs = re.split(r'\n\nOCIO Version:', content)
-
-            for i, test_run in enumerate(test_runs):
-                if not test_run.strip():
-                    continue
-
-                # Add back the "OCIO Version:" prefix if it was split
-                if i > 0:
-                    test_run = "OCIO Version:" + test_run
-
-                try:
-                    test_results = self._parse_test_run(test_run, file_path.name, cpu_model)
-                    results.extend(test_results)
-                except Exception as e:
-                    logger.warning(f"Failed to parse test run {i} in {file_path}: {e}")
-                    continue
-
-            return results
-            
-        except Exception as e:
-            raise ParseError(f"Failed to parse content of {file_path}: {e}") with timing statistics.
+Each test run contains multiple timing measurements that are extracted
+along with timing statistics.
 """
 
 import csv
+import importlib.util
+import multiprocessing
+import os
 import re
-from dataclasses import asdict, dataclass
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from functools import lru_cache, partial
+from typing import Callable, Iterable, List, Optional, TextIO, Tuple, Union
 
+import numpy as np
+import pandas as pd
+
+from ._kernels import segment_timing_stats, timing_stats
+from .config import get_config
 from .exceptions import DataValidationError, FileNotFoundError, ParseError
-from .logging_config import get_logger
+from .logging_config import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
+# Column order used for every tabular export of parsed results
+RESULT_COLUMNS = [
+    'file_name', 'os_release', 'cpu_model', 'ocio_version', 'config_version', 'source_colorspace',
+    'target_colorspace', 'operation', 'iteration_count', 'min_time',
+    'max_time', 'avg_time', 'timing_values'
+]
+
+# Patterns are compiled once at import; the log format is pure ASCII. Timing
+# lines are anchored to the line start and the lazy operation name stops at
+# the line end, so long non-matching lines (e.g. cpuinfo flags) are tried
+# once rather than from every position. Operation names may contain ':'
+_VERSION_RE = re.compile(r'OCIO Version:\s*(.+)', re.ASCII)
+_CONFIG_VERSION_RE = re.compile(r'OCIO Config\. version:\s*(.+)', re.ASCII)
+_PROCESSING_RE = re.compile(r"Processing from '(.+)' to '(.+)'", re.ASCII)
+_TIMING_RE = re.compile(
+    r'^([^\n]+?):[ \t]+For (\d+) iterations, it took: \[([0-9.,\s]+)\] ms', re.ASCII | re.MULTILINE
+)
+# All per-run fields in one alternation so a test run is scanned only once;
+# the match's lastgroup identifies which field was found
+_TEST_RUN_RE = re.compile(
+    r"OCIO Version:\s*(?P<ocio_version>.+)"
+    r"|OCIO Config\. version:\s*(?P<config_version>.+)"
+    r"|Processing from '(?P<source>.+)' to '(?P<target>.+)'"
+    r"|^(?P<operation>[^\n]+?):[ \t]+For (?P<iterations>\d+) iterations, it took: \[(?P<timings>[0-9.,\s]+)\] ms",
+    re.ASCII | re.MULTILINE
+)
+# Fast path for timing lines: str.find locates the fixed text in the middle
+# of each line, and only the short pieces around it are checked with these
+_TIMING_ANCHOR = ' iterations, it took: ['
+_TIMING_HEAD_RE = re.compile(r'([^\n]+?):[ \t]+For (\d+)', re.ASCII)
+_TIMING_VALUES_RE = re.compile(r'[0-9.,\s]+', re.ASCII)
+_OS_RELEASE_RE = re.compile(r'_r(\d+)(?:_|\.)', re.ASCII)
+_CPU_MODEL_RE = re.compile(r'model name\s*:\s*(.+)', re.ASCII)
+
+# pyarrow (the 'parquet' extra) also provides a multithreaded C++ CSV writer
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Test logs are read sequentially end to end; a large buffer cuts read() calls
+_READ_BUFFER_SIZE = 1 << 17
+
+# Smallest directory parsed in a process pool; starting spawned workers costs
+# far more than parsing a few files in this process
+_MIN_POOL_FILES = 4
+
+
+def _scan_timings(content: str) -> List[Tuple[str, str, str]]:
+    """
+    Find the timing lines of a test run without running a regex over the whole run.
+
+    Matches the same lines as the timings branch of _TEST_RUN_RE.
+
+    Args:
+        content: Content of the test run
+
+    Returns:
+        List of (operation, iteration count, timing values) strings
+    """
+    timings = []
+    find = content.find
+    anchor_length = len(_TIMING_ANCHOR)
+    position = 0
+    while True:
+        anchor = find(_TIMING_ANCHOR, position)
+        if anchor < 0:
+            return timings
+        position = anchor + anchor_length
+        values_end = find(']', position)
+        if values_end < 0:
+            return timings
+        head = _TIMING_HEAD_RE.fullmatch(content, content.rfind('\n', 0, anchor) + 1, anchor)
+        if (head and content.startswith(' ms', values_end + 1)
+                and _TIMING_VALUES_RE.fullmatch(content, position, values_end)):
+            timings.append((head.group(1), head.group(2), content[position:values_end]))
+
+
+def _first_group(pattern: re.Pattern, content: str) -> Optional[str]:
+    """Return the stripped first group of the first match of pattern, or None."""
+    match = pattern.search(content)
+    return match.group(1).strip() if match else None
+
+
+@lru_cache(maxsize=256)
+def _os_release_from_file_name(file_name: str) -> str:
+    """Extract the OS release from a file name; see OCIOTestParser._extract_os_release."""
+    match = _OS_RELEASE_RE.search(file_name)
+    if match:
+        return f"r{match.group(1)}"
+    return "Unknown"
+
 
 @dataclass
 class OCIOTestResult:
     """Data class representing a single test result measurement."""
 
+    # Declared by hand (rather than dataclass(slots=True)) for Python 3.8 support
+    __slots__ = (
+        'file_name', 'os_release', 'cpu_model', 'ocio_version', 'config_version',
+        'source_colorspace', 'target_colorspace', 'operation', 'iteration_count',
+        'timing_values', 'min_time', 'max_time', 'avg_time'
+    )
+
     file_name: str
     os_release: str
     cpu_model: str
@@ -51,34 +138,38 @@ class OCIOTestResult:
     target_colorspace: str
     operation: str
     iteration_count: int
-    timing_values: List[float]
+    timing_values: np.ndarray
     min_time: float
     max_time: float
     avg_time: float
 
     def __post_init__(self):
-        """Calculate min, max, and average times from timing values."""
-        if self.timing_values:
-            self.min_time = min(self.timing_values)
-            self.max_time = max(self.timing_values)
-            self.avg_time = sum(self.timing_values) / len(self.timing_values)
-        else:
-            self.min_time = self.max_time = self.avg_time = 0.0
+        """
+        Calculate min, max, and average times from timing values.
+
+        Statistics passed in by the caller (e.g. when rebuilding results from
+        saved output) are kept; they are only computed when all three are 0.0.
+        """
+        self.timing_values = np.asarray(self.timing_values, dtype=np.float64)
+        if self.min_time == self.max_time == self.avg_time == 0.0 and self.timing_values.size:
+            self.min_time, self.max_time, self.avg_time = timing_stats(
+                self.timing_values, get_config().compute_engine
+            )
 
 
 class OCIOTestParser:
     """Parser for OCIO test result files."""
 
-    def __init__(self):
-        """Initialize the parser with regex patterns."""
-        self.version_pattern = re.compile(r'OCIO Version:\s*(.+)')
-        self.config_version_pattern = re.compile(r'OCIO Config\. version:\s*(.+)')
-        self.processing_pattern = re.compile(r"Processing from '(.+)' to '(.+)'")
-        self.timing_pattern = re.compile(
-            r'(.+?):\s+For (\d+) iterations, it took: \[([0-9.,\s]+)\] ms'
-        )
-        self.os_release_pattern = re.compile(r'_r(\d+)(?:_|\.)')
-        self.cpu_model_pattern = re.compile(r'model name\s*:\s*(.+)')
+    # Find timing lines with str.find rather than the combined regex; set to
+    # False on an instance to parse with the regex alone
+    use_fast_scan = True
+
+    version_pattern = _VERSION_RE
+    config_version_pattern = _CONFIG_VERSION_RE
+    processing_pattern = _PROCESSING_RE
+    timing_pattern = _TIMING_RE
+    os_release_pattern = _OS_RELEASE_RE
+    cpu_model_pattern = _CPU_MODEL_RE
 
     def _extract_os_release(self, file_name: str) -> str:
         """
@@ -90,10 +181,7 @@ class OCIOTestParser:
         Returns:
             OS release string (e.g., 'r7', 'r9') or 'Unknown' if not found
         """
-        match = self.os_release_pattern.search(file_name)
-        if match:
-            return f"r{match.group(1)}"
-        return "Unknown"
+        return _os_release_from_file_name(file_name)
 
     def _extract_cpu_model(self, content: str) -> str:
         """
@@ -110,12 +198,14 @@ class OCIOTestParser:
             return match.group(1).strip()
         return "Unknown"
 
-    def parse_file(self, file_path: Path) -> List[OCIOTestResult]:
+    def parse_file(self, file_path: Union[Path, TextIO]) -> List[OCIOTestResult]:
         """
         Parse a single OCIO test result file.
 
         Args:
-            file_path: Path to the test result file
+            file_path: Path to the test result file, or an open text stream such
+                      as io.StringIO. Results from a stream take their file name
+                      from its ``name`` attribute, or "stream" if it has none.
 
         Returns:
             List of OCIOTestResult objects
@@ -124,61 +214,140 @@ class OCIOTestParser:
             FileNotFoundError: If the file doesn't exist
             ParseError: If the file cannot be parsed
         """
+        if hasattr(file_path, 'read'):
+            return self._parse_text_stream(file_path)
+
         if not file_path.exists():
             raise FileNotFoundError(f"Test result file not found: {file_path}")
             
         if not file_path.is_file():
             raise ParseError(f"Path is not a file: {file_path}")
             
-        results = []
-
         try:
-            # Try UTF-8 encoding first
-            with open(file_path, encoding='utf-8') as file:
-                content = file.read()
-        except UnicodeDecodeError:
-            # Try with different encoding if UTF-8 fails
             try:
-                with open(file_path, encoding='latin-1') as file:
-                    content = file.read()
+                # Try UTF-8 encoding first
+                results, has_content = self._parse_stream(file_path, 'utf-8')
+            except UnicodeDecodeError:
+                # Re-parse with a different encoding if UTF-8 fails
+                results, has_content = self._parse_stream(file_path, 'latin-1')
                 logger.warning(f"File {file_path} required latin-1 encoding")
-            except Exception as e:
-                raise ParseError(f"Failed to read file {file_path}: {e}")
+        except OSError as e:
+            raise ParseError(f"Failed to read file {file_path}: {e}")
         except Exception as e:
-            raise ParseError(f"Unexpected error reading file {file_path}: {e}")
+            raise ParseError(f"Failed to parse content of {file_path}: {e}")
 
-        if not content.strip():
+        if not has_content:
             logger.warning(f"File {file_path} is empty")
-            return results
 
+        return results
+
+    def _parse_text_stream(self, stream: TextIO) -> List[OCIOTestResult]:
+        """
+        Parse test results from an open text stream.
+
+        Args:
+            stream: Text stream positioned at the start of the test results
+
+        Returns:
+            List of OCIOTestResult objects
+
+        Raises:
+            ParseError: If the stream cannot be parsed
+        """
+        file_name = Path(getattr(stream, 'name', None) or "stream").name
         try:
-            # Extract CPU model information from the entire file content
-            cpu_model = self._extract_cpu_model(content)
+            results, has_content = self._parse_lines(stream, file_name, file_name)
+        except Exception as e:
+            raise ParseError(f"Failed to parse content of {file_name}: {e}")
+
+        if not has_content:
+            logger.warning(f"Stream {file_name} is empty")
+
+        return results
 
-            # Split content by test runs (separated by OCIO Version)
-            test_runs = re.split(r'\n\nOCIO Version:', content)
+    def _parse_stream(self, file_path: Path, encoding: str) -> Tuple[List[OCIOTestResult], bool]:
+        """
+        Parse a test result file line by line, one test run at a time.
 
-            for i, test_run in enumerate(test_runs):
-                if not test_run.strip():
-                    continue
+        Args:
+            file_path: Path to the test result file
+            encoding: Text encoding used to read the file
 
-                # Add back the "OCIO Version:" prefix if it was split
-                if i > 0:
-                    test_run = "OCIO Version:" + test_run
+        Returns:
+            Tuple of the parsed results and whether the file had any content
+        """
+        with open(file_path, encoding=encoding, buffering=_READ_BUFFER_SIZE) as file:
+            return self._parse_lines(file, file_path.name, file_path)
+
+    def _parse_lines(
+        self,
+        lines: Iterable[str],
+        file_name: str,
+        source: Union[Path, str]
+    ) -> Tuple[List[OCIOTestResult], bool]:
+        """
+        Parse test result lines, one test run at a time.
 
-                try:
-                    test_results = self._parse_test_run(test_run, file_path.name, cpu_model)
-                    results.extend(test_results)
-                except Exception as e:
-                    logger.warning(f"Failed to parse test run {i} in {file_path}: {e}")
-                    continue
+        Test runs are delimited by an "OCIO Version:" line following a blank
+        line. Each run is handed to _parse_test_run as soon as it is complete,
+        so the whole file is never held in memory.
 
-            return results
-            
-        except Exception as e:
-            raise ParseError(f"Failed to parse content of {file_path}: {e}")
+        Args:
+            lines: Lines of the test results, each ending in a newline
+            file_name: File name recorded in the results
+            source: File or stream the lines come from, for log messages
 
-    def _parse_test_run(self, content: str, file_name: str, cpu_model: str) -> List[OCIOTestResult]:
+        Returns:
+            Tuple of the parsed results and whether there was any content
+        """
+        results = []
+        has_content = False
+        cpu_model = None
+        os_release = self._extract_os_release(file_name)
+        run_lines: List[str] = []
+        run_index = 0
+        prev_blank = False
+
+        def flush() -> None:
+            nonlocal has_content, run_index
+            test_run = ''.join(run_lines)
+            if test_run.strip():
+                has_content = True
+                try:
+                    results.extend(self._parse_test_run(
+                        test_run, file_name, "Unknown", os_release
+                    ))
+                except Exception as e:
+                    logger.warning(f"Failed to parse test run {run_index} in {source}: {e}")
+            run_index += 1
+
+        for line in lines:
+            if prev_blank and line.startswith('OCIO Version:'):
+                flush()
+                run_lines = []
+            run_lines.append(line)
+            prev_blank = line == '\n'
+
+            # The CPU details can appear anywhere in the file
+            if cpu_model is None and 'model name' in line:
+                match = self.cpu_model_pattern.search(line)
+                if match:
+                    cpu_model = match.group(1).strip()
+        flush()
+
+        if cpu_model is not None:
+            for result in results:
+                result.cpu_model = cpu_model
+
+        return results, has_content
+
+    def _parse_test_run(
+        self,
+        content: str,
+        file_name: str,
+        cpu_model: str,
+        os_release: Optional[str] = None
+    ) -> List[OCIOTestResult]:
         """
         Parse a single test run within a file.
 
@@ -186,63 +355,133 @@ class OCIOTestParser:
             content: Content of the test run
             file_name: Name of the file being parsed
             cpu_model: CPU model name extracted from the file
+            os_release: OS release for the file; extracted from file_name if not given
 
         Returns:
             List of OCIOTestResult objects for this test run
         """
         results = []
+        if os_release is None:
+            os_release = self._extract_os_release(file_name)
+        ocio_version = config_version = None
+        source_colorspace = target_colorspace = None
+        timing_matches = []
+
+        if self.use_fast_scan:
+            # The header fields are single lines near the start of the run
+            timing_matches = _scan_timings(content)
+            ocio_version = _first_group(_VERSION_RE, content)
+            config_version = _first_group(_CONFIG_VERSION_RE, content)
+            processing = _PROCESSING_RE.search(content)
+            if processing:
+                source_colorspace, target_colorspace = processing.groups()
+        else:
+            # Single pass over the run; the first version/config/processing line wins
+            for match in _TEST_RUN_RE.finditer(content):
+                field = match.lastgroup
+                if field == 'timings':
+                    timing_matches.append(match.group('operation', 'iterations', 'timings'))
+                elif field == 'ocio_version':
+                    if ocio_version is None:
+                        ocio_version = match.group('ocio_version').strip()
+                elif field == 'config_version':
+                    if config_version is None:
+                        config_version = match.group('config_version').strip()
+                elif source_colorspace is None:
+                    source_colorspace, target_colorspace = match.group('source', 'target')
+
+        ocio_version = ocio_version or "Unknown"
+        config_version = config_version or "Unknown"
+        source_colorspace = source_colorspace or "Unknown"
+        target_colorspace = target_colorspace or "Unknown"
+
+        measurements = []
+        for operation, iteration_count, timing_str in timing_matches:
+            timing_values = self._parse_timing_values(timing_str)
+            if timing_values.size:
+                measurements.append((operation, iteration_count, timing_values))
+        if not measurements:
+            return results
 
-        # Extract OCIO version
-        version_match = self.version_pattern.search(content)
-        ocio_version = version_match.group(1).strip() if version_match else "Unknown"
+        # Statistics for every measurement of the run in one call, rather than
+        # one small reduction per result in OCIOTestResult.__post_init__
+        sizes = [timing_values.size for _, _, timing_values in measurements]
+        offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        min_times, max_times, avg_times = segment_timing_stats(
+            np.concatenate([timing_values for _, _, timing_values in measurements]),
+            offsets, get_config().compute_engine
+        )
 
-        # Extract config version
-        config_match = self.config_version_pattern.search(content)
-        config_version = config_match.group(1).strip() if config_match else "Unknown"
+        for (operation, iteration_count, timing_values), min_time, max_time, avg_time in zip(
+            measurements, min_times.tolist(), max_times.tolist(), avg_times.tolist()
+        ):
+            result = OCIOTestResult(
+                file_name=file_name,
+                os_release=os_release,
+                cpu_model=cpu_model,
+                ocio_version=ocio_version,
+                config_version=config_version,
+                source_colorspace=source_colorspace,
+                target_colorspace=target_colorspace,
+                operation=operation.strip(),
+                iteration_count=int(iteration_count),
+                timing_values=timing_values,
+                min_time=min_time,
+                max_time=max_time,
+                avg_time=avg_time
+            )
+            results.append(result)
 
-        # Extract processing information (source and target colorspaces)
-        processing_match = self.processing_pattern.search(content)
-        source_colorspace = processing_match.group(1) if processing_match else "Unknown"
-        target_colorspace = processing_match.group(2) if processing_match else "Unknown"
+        return results
 
-        # Extract all timing measurements
-        timing_matches = self.timing_pattern.findall(content)
+    def _parse_timing_values(self, timing_str: str) -> np.ndarray:
+        """
+        Parse a comma separated list of timing values.
 
-        for operation, iteration_count, timing_str in timing_matches:
-            # Parse timing values
-            timing_values = []
-            for value_str in timing_str.split(','):
-                try:
-                    timing_values.append(float(value_str.strip()))
-                except ValueError:
-                    logger.warning(f"Could not parse timing value: {value_str}")
-
-            if timing_values:
-                result = OCIOTestResult(
-                    file_name=file_name,
-                    os_release=self._extract_os_release(file_name),
-                    cpu_model=cpu_model,
-                    ocio_version=ocio_version,
-                    config_version=config_version,
-                    source_colorspace=source_colorspace,
-                    target_colorspace=target_colorspace,
-                    operation=operation.strip(),
-                    iteration_count=int(iteration_count),
-                    timing_values=timing_values,
-                    min_time=0.0,  # Will be calculated in __post_init__
-                    max_time=0.0,
-                    avg_time=0.0
-                )
-                results.append(result)
+        Args:
+            timing_str: Timing values as captured from the log, e.g. "1.2, 3.4"
 
-        return results
+        Returns:
+            Array of the timing values that could be parsed
+        """
+        # A trailing separator would otherwise be read as a spurious -1.0
+        timing_str = timing_str.strip().rstrip(',')
+        expected_count = timing_str.count(',') + 1 if timing_str else 0
+        try:
+            # On malformed input NumPy 2 raises, while NumPy 1.x warns and
+            # returns the values parsed so far; the count check covers both
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)
+                timing_values = np.fromstring(timing_str, dtype=np.float64, sep=',')
+            if timing_values.size == expected_count:
+                return timing_values
+        except ValueError:
+            pass
+
+        # Fall back to parsing value by value, skipping malformed entries
+        timing_values = []
+        for value_str in timing_str.split(','):
+            try:
+                timing_values.append(float(value_str.strip()))
+            except ValueError:
+                logger.warning(f"Could not parse timing value: {value_str}")
+        return np.array(timing_values, dtype=np.float64)
 
-    def parse_directory(self, directory_path: Path) -> List[OCIOTestResult]:
+    def parse_directory(self, directory_path: Path, max_workers: Optional[int] = None) -> List[OCIOTestResult]:
         """
         Parse all OCIO test result files in a directory.
 
+        Files are independent, so they are parsed in a process pool when
+        parallel processing is enabled in the config or max_workers is given,
+        and more than one worker is allowed. Directories with fewer than four
+        files are always parsed in this process.
+
         Args:
             directory_path: Path to the directory containing test files
+            max_workers: Maximum number of worker processes. When None, files are
+                        parsed in a pool of config.max_workers processes only if
+                        config.parallel_processing is enabled.
 
         Returns:
             List of all OCIOTestResult objects from all files
@@ -257,21 +496,72 @@ class OCIOTestParser:
         if not directory_path.is_dir():
             raise ParseError(f"Path is not a directory: {directory_path}")
 
-        all_results = []
-        failed_files = []
-
-        # Find all .txt files in the directory
-        txt_files = list(directory_path.glob("*.txt"))
+        # Find all .txt files in the directory, in a stable order
+        with os.scandir(directory_path) as entries:
+            txt_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.txt') and entry.is_file()
+            )
 
         if not txt_files:
             raise ParseError(f"No .txt files found in directory: {directory_path}")
 
         logger.info(f"Found {len(txt_files)} .txt files to parse")
 
-        for file_path in txt_files:
+        if max_workers is None:
+            config = get_config()
+            max_workers = config.max_workers if config.parallel_processing else 1
+        if len(txt_files) < _MIN_POOL_FILES:
+            max_workers = 1
+        max_workers = min(max_workers, len(txt_files))
+        if max_workers > 1:
+            logger.info(f"Parsing files with {max_workers} worker processes")
+            # Spawn rather than fork: forked children inherit the parent's
+            # thread state (e.g. JIT runtime threads) and can hang at exit
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            with executor:
+                futures = [executor.submit(_parse_file_worker, file_path) for file_path in txt_files]
+                all_results, failed_files = self._collect_file_results(
+                    txt_files, [future.result for future in futures]
+                )
+        else:
+            all_results, failed_files = self._collect_file_results(
+                txt_files, [partial(self.parse_file, file_path) for file_path in txt_files]
+            )
+
+        if failed_files:
+            logger.warning(f"Failed to parse {len(failed_files)} files: {failed_files}")
+            
+        if not all_results:
+            raise ParseError(f"No valid test results found in any files in {directory_path}")
+
+        logger.info(f"Successfully parsed {len(all_results)} total test results from {len(txt_files) - len(failed_files)}/{len(txt_files)} files")
+        return all_results
+
+    def _collect_file_results(
+        self,
+        txt_files: List[Path],
+        parse_jobs: List[Callable[[], List[OCIOTestResult]]]
+    ) -> Tuple[List[OCIOTestResult], List[str]]:
+        """
+        Gather per-file parse results in file order, logging failed files.
+
+        Args:
+            txt_files: Files being parsed
+            parse_jobs: Callables returning each file's results, in the same order
+
+        Returns:
+            Tuple of all results and the names of files that failed to parse
+        """
+        all_results = []
+        failed_files = []
+
+        for file_path, parse_job in zip(txt_files, parse_jobs):
             try:
                 logger.info(f"Parsing file: {file_path.name}")
-                file_results = self.parse_file(file_path)
+                file_results = parse_job()
                 all_results.extend(file_results)
                 logger.info(f"Extracted {len(file_results)} test results from {file_path.name}")
             except Exception as e:
@@ -279,69 +569,155 @@ class OCIOTestParser:
                 failed_files.append(file_path.name)
                 continue
 
-        if failed_files:
-            logger.warning(f"Failed to parse {len(failed_files)} files: {failed_files}")
-            
-        if not all_results:
-            raise ParseError(f"No valid test results found in any files in {directory_path}")
+        return all_results, failed_files
 
-        logger.info(f"Successfully parsed {len(all_results)} total test results from {len(txt_files) - len(failed_files)}/{len(txt_files)} files")
-        return all_results
+    def to_dataframe(self, results: List[OCIOTestResult]) -> pd.DataFrame:
+        """
+        Convert test results into a columnar DataFrame.
 
-    def save_to_csv(self, results: List[OCIOTestResult], output_file: Path) -> None:
+        The DataFrame has the same columns as the CSV output, with
+        ``timing_values`` kept as one float array per row. It can be handed
+        straight to the analysis code instead of round-tripping through CSV.
+
+        Args:
+            results: List of OCIOTestResult objects
+
+        Returns:
+            DataFrame with one row per test result
         """
-        Save test results to a CSV file.
+        columns = {
+            column: [getattr(result, column) for result in results]
+            for column in RESULT_COLUMNS
+        }
+        return pd.DataFrame(columns, columns=RESULT_COLUMNS)
+
+    def _validate_results(self, results: List[OCIOTestResult]) -> None:
+        """
+        Check that there are results to save and that they are all OCIOTestResult.
 
         Args:
             results: List of OCIOTestResult objects
-            output_file: Path to the output CSV file
-            
+
         Raises:
             DataValidationError: If results list is empty or invalid
-            ParseError: If CSV writing fails
         """
         if not results:
             raise DataValidationError("No results provided to save")
             
-        # Validate results
         for i, result in enumerate(results):
             if not isinstance(result, OCIOTestResult):
                 raise DataValidationError(f"Invalid result type at index {i}: {type(result)}")
 
+    def save_to_csv(self, results: List[OCIOTestResult], output_file: Path) -> None:
+        """
+        Save test results to a CSV file.
+
+        Uses pyarrow's CSV writer when pyarrow is installed, and the csv module
+        otherwise. Both write the same values; pyarrow quotes every string field.
+
+        Args:
+            results: List of OCIOTestResult objects
+            output_file: Path to the output CSV file
+            
+        Raises:
+            DataValidationError: If results list is empty or invalid
+            ParseError: If CSV writing fails
+        """
+        self._validate_results(results)
+
         try:
             # Ensure output directory exists
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
             logger.info(f"Saving {len(results)} results to {output_file}")
 
-            fieldnames = [
-                'file_name', 'os_release', 'cpu_model', 'ocio_version', 'config_version', 'source_colorspace',
-                'target_colorspace', 'operation', 'iteration_count', 'min_time',
-                'max_time', 'avg_time', 'timing_values'
-            ]
+            if PYARROW_AVAILABLE:
+                self._write_csv_arrow(results, output_file)
+                logger.info(f"Successfully saved results to {output_file}")
+                return
+
+            rows = (
+                (
+                    r.file_name, r.os_release, r.cpu_model, r.ocio_version, r.config_version,
+                    r.source_colorspace, r.target_colorspace, r.operation, r.iteration_count,
+                    r.min_time, r.max_time, r.avg_time,
+                    # Timing values are stored as a single comma separated field
+                    ','.join(map(str, r.timing_values.tolist()))
+                )
+                for r in results
+            )
 
             with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for result in results:
-                    try:
-                        row = asdict(result)
-                        # Convert timing_values list to string for CSV
-                        row['timing_values'] = ','.join(map(str, result.timing_values))
-                        writer.writerow(row)
-                    except Exception as e:
-                        logger.warning(f"Failed to write result row: {e}")
-                        continue
+                writer = csv.writer(csvfile)
+                writer.writerow(RESULT_COLUMNS)
+                writer.writerows(rows)
 
             logger.info(f"Successfully saved results to {output_file}")
             
         except Exception as e:
             raise ParseError(f"Failed to save results to CSV: {e}")
 
+    def _write_csv_arrow(self, results: List[OCIOTestResult], output_file: Path) -> None:
+        """
+        Write test results to a CSV file with pyarrow's CSV writer.
+
+        Args:
+            results: List of OCIOTestResult objects
+            output_file: Path to the output CSV file
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        columns = {
+            column: (
+                # Timing values are stored as a single comma separated field
+                [','.join(map(str, r.timing_values.tolist())) for r in results]
+                if column == 'timing_values' else [getattr(r, column) for r in results]
+            )
+            for column in RESULT_COLUMNS
+        }
+        pa_csv.write_csv(pa.Table.from_pydict(columns), str(output_file))
+
+    def save_to_parquet(self, results: List[OCIOTestResult], output_file: Path) -> None:
+        """
+        Save test results to a Snappy-compressed Parquet file.
+
+        Column types are preserved, including ``timing_values`` as a list of
+        floats, so OCIODataAnalyzer reloads the file much faster than CSV.
+        Requires the optional ``pyarrow`` dependency.
+
+        Args:
+            results: List of OCIOTestResult objects
+            output_file: Path to the output Parquet file
+            
+        Raises:
+            DataValidationError: If results list is empty or invalid
+            ParseError: If Parquet writing fails
+        """
+        self._validate_results(results)
+
+        try:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            logger.info(f"Saving {len(results)} results to {output_file}")
+            self.to_dataframe(results).to_parquet(
+                output_file, engine='pyarrow', compression='snappy', index=False
+            )
+            logger.info(f"Successfully saved results to {output_file}")
+            
+        except Exception as e:
+            raise ParseError(f"Failed to save results to Parquet: {e}")
+
+
+def _parse_file_worker(file_path: Path) -> List[OCIOTestResult]:
+    """Parse a single file in a worker process."""
+    return OCIOTestParser().parse_file(file_path)
+
 
 def main():
     """Main function to run the parser."""
+    setup_logging()
+
     # Set up paths
     script_dir = Path(__file__).parent
     ocio_tests_dir = script_dir / "OCIO_tests"
@@ -6,18 +6,21 @@ using focused, single-responsibility components.
 """
 
 import concurrent.futures
+import multiprocessing
+from itertools import repeat
 from pathlib import Path
 from typing import Optional, List, Callable, Dict
 
-from .chart_generator import OCIOChartGenerator
-from .config import get_config
-from .data_analyzer import OCIODataAnalyzer
+from .config import get_config, set_config
+from .data_analyzer import ComparisonBundle, OCIODataAnalyzer
 from .exceptions import AnalysisError, ConfigurationError
 from .logging_config import get_logger
-from .report_generator import OCIOReportGenerator
 
 logger = get_logger(__name__)
 
+# Charts drawn by run_parallel_analysis(), which sizes its process pool to match
+_CHART_COUNT = 5
+
 
 class OCIOPerformanceAnalyzer:
     """
@@ -41,19 +44,45 @@ class OCIOPerformanceAnalyzer:
         """
         self.csv_file = csv_file
         self.data_analyzer = OCIODataAnalyzer(csv_file) if csv_file else None
-        self.chart_generator = OCIOChartGenerator()
-        self.report_generator = OCIOReportGenerator()
+        # Chart and report generators are created on first use so callers that
+        # only need data (e.g. get_quick_summary) never import matplotlib
+        self._chart_generator = None
+        self._report_generator = None
         
         # Initialize data
         self.data = None
         self.summary_data = None
+        self._loaded_mtime_ns = None
+        # Results shared by run_full_analysis() and get_quick_summary()
+        self._performance_stats = None
+        self._comparisons = None
+
+    @property
+    def chart_generator(self):
+        """The OCIOChartGenerator, imported and created on first use."""
+        if self._chart_generator is None:
+            from .chart_generator import OCIOChartGenerator
+            self._chart_generator = OCIOChartGenerator()
+        return self._chart_generator
+
+    @property
+    def report_generator(self):
+        """The OCIOReportGenerator, imported and created on first use."""
+        if self._report_generator is None:
+            from .report_generator import OCIOReportGenerator
+            self._report_generator = OCIOReportGenerator()
+        return self._report_generator
 
-    def run_full_analysis(self, output_dir: Path) -> None:
+    def run_full_analysis(self, output_dir: Path, force_recompute: bool = False) -> None:
         """
         Run the complete analysis pipeline.
 
+        Loaded data and comparison results are cached on disk per CSV file, so
+        re-running after changing only chart or report code skips the analysis.
+
         Args:
             output_dir: Directory to save all output files
+            force_recompute: Discard cached data and results and recompute them
             
         Raises:
             AnalysisError: If analysis fails
@@ -65,20 +94,20 @@ class OCIOPerformanceAnalyzer:
                 
             logger.info("Starting full OCIO performance analysis")
             
+            if force_recompute:
+                self.clear_cache()
+            
             # Ensure output directory exists
             output_dir.mkdir(parents=True, exist_ok=True)
             
             # 1. Load and analyze data
             logger.info("Step 1: Loading and analyzing data")
-            self.data = self.data_analyzer.load_data()
-            self.summary_data = self.data_analyzer.summarize_by_filename()
+            self._load_data()
             
             # 2. Generate comparisons
             logger.info("Step 2: Generating performance comparisons")
-            cpu_os_comparisons = self.data_analyzer.find_cpu_os_comparisons()
-            ocio_comparisons = self.data_analyzer.find_ocio_version_comparisons()
-            all_ocio_comparisons = self.data_analyzer.find_all_ocio_version_comparisons()
-            performance_stats = self.data_analyzer.get_performance_summary()
+            cpu_os_comparisons, ocio_comparisons, all_ocio_comparisons = self._get_comparisons()
+            performance_stats = self._get_performance_stats()
             
             # 3. Create visualizations
             logger.info("Step 3: Creating charts and visualizations")
@@ -95,6 +124,38 @@ class OCIOPerformanceAnalyzer:
         except Exception as e:
             raise AnalysisError(f"Full analysis failed: {e}")
 
+    def _load_data(self) -> None:
+        """
+        Load the data and per-file summary, reusing previously loaded results.
+
+        Comparison and summary results are memoized by the data analyzer, so
+        repeated runs reuse them. If the CSV file has been modified since it
+        was loaded, a fresh data analyzer is created to pick up the changes.
+        """
+        mtime_ns = self.csv_file.stat().st_mtime_ns
+        if self.data is not None and mtime_ns != self._loaded_mtime_ns:
+            logger.info(f"{self.csv_file} changed since it was loaded, reloading")
+            self.load_csv_file(self.csv_file)
+
+        if self.data is None:
+            self.data = self.data_analyzer.load_data()
+            self._loaded_mtime_ns = mtime_ns
+
+        if self.summary_data is None:
+            self.summary_data = self.data_analyzer.summarize_by_filename()
+
+    def _get_performance_stats(self) -> dict:
+        """Overall performance statistics, computed once per loaded CSV file."""
+        if self._performance_stats is None:
+            self._performance_stats = self.data_analyzer.get_performance_summary()
+        return self._performance_stats
+
+    def _get_comparisons(self) -> ComparisonBundle:
+        """All comparison tables, computed once per loaded CSV file."""
+        if self._comparisons is None:
+            self._comparisons = self.data_analyzer.find_all_comparisons()
+        return self._comparisons
+
     def load_csv_file(self, csv_file: Path) -> None:
         """
         Load a CSV file for analysis.
@@ -109,6 +170,25 @@ class OCIOPerformanceAnalyzer:
         self.data_analyzer = OCIODataAnalyzer(csv_file)
         self.data = None
         self.summary_data = None
+        self._performance_stats = None
+        self._comparisons = None
+
+    def clear_cache(self) -> int:
+        """
+        Discard loaded and cached results so the next run re-reads the CSV file.
+
+        Returns:
+            Number of on-disk cache files removed
+
+        Raises:
+            ConfigurationError: If no CSV file was provided
+        """
+        if not self.data_analyzer:
+            raise ConfigurationError("No CSV file provided. Initialize with a CSV file to clear its cache.")
+
+        removed = self.data_analyzer.clear_cache()
+        self.load_csv_file(self.csv_file)
+        return removed
 
     def _create_all_charts(self, output_dir: Path, 
                           cpu_os_comparisons, ocio_comparisons, 
@@ -158,35 +238,9 @@ class OCIOPerformanceAnalyzer:
                            performance_stats) -> None:
         """Create all text reports."""
         try:
-            # Summary report
-            summary_report_path = output_dir / "analysis_summary.txt"
-            self.report_generator.create_summary_report(
-                self.summary_data, performance_stats, summary_report_path
-            )
-            
-            # CPU/OS comparison report
-            if not cpu_os_comparisons.empty:
-                cpu_os_report_path = output_dir / "cpu_os_comparison_report.txt"
-                self.report_generator.create_comparison_report(
-                    cpu_os_comparisons, 
-                    "CPU/OS Performance Comparison Report",
-                    cpu_os_report_path
-                )
-            
-            # OCIO version comparison report
-            if not ocio_comparisons.empty:
-                ocio_report_path = output_dir / "ocio_version_comparison_report.txt"
-                self.report_generator.create_comparison_report(
-                    ocio_comparisons, 
-                    "OCIO Version Performance Comparison Report",
-                    ocio_report_path
-                )
-            
-            # Detailed findings report
-            findings_report_path = output_dir / "detailed_findings.txt"
-            self.report_generator.create_detailed_findings_report(
-                cpu_os_comparisons, ocio_comparisons, 
-                self.summary_data, findings_report_path
+            self.report_generator.create_all_reports(
+                self.summary_data, performance_stats,
+                cpu_os_comparisons, ocio_comparisons, output_dir
             )
             
         except Exception as e:
@@ -204,15 +258,10 @@ class OCIOPerformanceAnalyzer:
             AnalysisError: If summary generation fails
         """
         try:
-            if self.data is None:
-                self.data = self.data_analyzer.load_data()
+            self._load_data()
             
-            if self.summary_data is None:
-                self.summary_data = self.data_analyzer.summarize_by_filename()
-            
-            performance_stats = self.data_analyzer.get_performance_summary()
-            cpu_os_comparisons = self.data_analyzer.find_cpu_os_comparisons()
-            ocio_comparisons = self.data_analyzer.find_ocio_version_comparisons()
+            performance_stats = self._get_performance_stats()
+            cpu_os_comparisons, ocio_comparisons, _ = self._get_comparisons()
             
             return {
                 'total_results': performance_stats['total_results'],
@@ -222,12 +271,13 @@ class OCIOPerformanceAnalyzer:
                 'avg_performance': performance_stats['avg_time_stats']['mean'],
                 'cpu_os_comparisons_found': len(cpu_os_comparisons),
                 'ocio_comparisons_found': len(ocio_comparisons),
+                # Comparisons are sorted by improvement, best first
                 'best_cpu_os_improvement': (
-                    cpu_os_comparisons.iloc[0]['improvement_pct'] 
+                    cpu_os_comparisons['improvement_pct'].iat[0]
                     if not cpu_os_comparisons.empty else 0
                 ),
                 'best_ocio_improvement': (
-                    ocio_comparisons.iloc[0]['improvement_pct'] 
+                    ocio_comparisons['improvement_pct'].iat[0]
                     if not ocio_comparisons.empty else 0
                 )
             }
@@ -235,129 +285,119 @@ class OCIOPerformanceAnalyzer:
         except Exception as e:
             raise AnalysisError(f"Quick summary generation failed: {e}")
 
-    def run_parallel_analysis(self, output_dir: Path, max_workers: Optional[int] = None) -> None:
+    def run_parallel_analysis(self, output_dir: Path, max_workers: Optional[int] = None,
+                              force_recompute: bool = False) -> None:
         """
         Run analysis with parallel processing for better performance.
         
         Args:
             output_dir: Directory to save all output files
             max_workers: Maximum number of worker threads (uses config default if None)
+            force_recompute: Discard cached data and results and recompute them
+
+        Raises:
+            AnalysisError: If any step fails; outputs that have not started yet are cancelled
+            ConfigurationError: If no CSV file was provided
         """
         try:
             config = get_config()
             if not config.parallel_processing:
                 logger.info("Parallel processing disabled, falling back to sequential analysis")
-                return self.run_full_analysis(output_dir)
+                return self.run_full_analysis(output_dir, force_recompute=force_recompute)
                 
             if not self.data_analyzer:
                 raise ConfigurationError("No CSV file provided. Initialize with a CSV file to run analysis.")
                 
+            if force_recompute:
+                self.clear_cache()
+                
             max_workers = max_workers or config.max_workers
-            logger.info(f"Starting parallel OCIO performance analysis with {max_workers} workers")
+            logger.info(
+                f"Starting parallel OCIO performance analysis with {max_workers} workers "
+                f"and the {config.compute_engine} compute engine"
+            )
             
             # Ensure output directory exists
             output_dir.mkdir(parents=True, exist_ok=True)
             
             # Step 1: Load and analyze data (sequential - shared state)
             logger.info("Step 1: Loading and analyzing data")
-            self.data = self.data_analyzer.load_data()
-            self.summary_data = self.data_analyzer.summarize_by_filename()
-            
-            # Step 2: Generate comparisons (can be parallelized)
-            logger.info("Step 2: Generating performance comparisons (parallel)")
-            
-            comparison_tasks = [
-                ('cpu_os', self.data_analyzer.find_cpu_os_comparisons),
-                ('ocio', self.data_analyzer.find_ocio_version_comparisons),
-                ('all_ocio', self.data_analyzer.find_all_ocio_version_comparisons)
-            ]
-            
-            comparison_results = {}
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_name = {
-                    executor.submit(task): name 
-                    for name, task in comparison_tasks
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_name):
-                    name = future_to_name[future]
-                    try:
-                        comparison_results[name] = future.result()
-                        logger.info(f"Completed {name} comparisons")
-                    except Exception as e:
-                        logger.error(f"Failed to generate {name} comparisons: {e}")
-                        comparison_results[name] = None
-            
-            # Step 3: Generate outputs in parallel
-            logger.info("Step 3: Generating charts and reports (parallel)")
-            
-            output_tasks = []
-            
-            # Chart generation tasks
-            chart_tasks = [
-                ('summary_chart', self._create_summary_chart, (output_dir,)),
-                ('comparison_charts', self._create_comparison_charts, 
-                 (output_dir, comparison_results['cpu_os'], comparison_results['ocio'], 
-                  comparison_results['all_ocio']))
-            ]
-            
-            # Report generation tasks  
-            report_tasks = [
-                ('summary_report', self._create_summary_report, (output_dir,)),
-                ('comparison_reports', self._create_comparison_reports,
-                 (output_dir, comparison_results['cpu_os'], comparison_results['ocio']))
-            ]
-            
-            output_tasks.extend(chart_tasks + report_tasks)
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_task = {
-                    executor.submit(task_func, *args): task_name
-                    for task_name, task_func, args in output_tasks
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_task):
+            self._load_data()
+            
+            # Steps 2 and 3 overlap: outputs that only need the per-file
+            # summary are started right away, while the comparisons are
+            # computed, and the rest as soon as the comparisons are ready.
+            # Chart rendering and PNG encoding hold the GIL, so each chart is
+            # drawn in its own worker process from picklable data; reports are
+            # I/O bound and stay on threads. Spawned workers get this
+            # process's config, so chart settings changed at runtime apply.
+            chart_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(max_workers, _CHART_COUNT),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=set_config, initargs=(config,)
+            )
+            report_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            with chart_executor, report_executor:
+                future_to_task = {}
+
+                def submit_chart(name, kind, file_name, data, title=None):
+                    if not data.empty:
+                        future = chart_executor.submit(
+                            _render_chart, kind, output_dir / file_name, data, title
+                        )
+                        future_to_task[future] = name
+
+                logger.info("Step 3: Generating summary charts and report (parallel)")
+                submit_chart('summary_chart', 'summary', "summary_analysis.png", self.summary_data)
+                submit_chart('heatmap', 'heatmap', "performance_heatmap.png", self.summary_data)
+                future_to_task[report_executor.submit(self._create_summary_report, output_dir)] = 'summary_report'
+
+                # Step 2: Generate comparisons from one shared aggregate of the data
+                logger.info("Step 2: Generating performance comparisons")
+                try:
+                    comparisons = self._get_comparisons()
+                    logger.info("Completed comparisons")
+                except Exception:
+                    _cancel_pending(future_to_task)
+                    raise
+
+                logger.info("Step 3: Generating comparison charts and reports (parallel)")
+                submit_chart('cpu_os_chart', 'comparison', "cpu_os_comparison.png",
+                             comparisons.cpu_os, "CPU/OS Performance Comparison")
+                submit_chart('ocio_chart', 'comparison', "ocio_version_comparison.png",
+                             comparisons.ocio_version, "OCIO Version Performance Comparison")
+                submit_chart('aces_chart', 'aces', "comprehensive_aces_comparison.png",
+                             comparisons.all_ocio_version)
+                future_to_task[report_executor.submit(
+                    self._create_comparison_reports, output_dir,
+                    comparisons.cpu_os, comparisons.ocio_version
+                )] = 'comparison_reports'
+
+                # Stop at the first failure rather than finishing the other
+                # outputs: tasks that have not started are cancelled, and the
+                # executors wait only for the ones already running
+                done, not_done = concurrent.futures.wait(
+                    future_to_task, return_when=concurrent.futures.FIRST_EXCEPTION
+                )
+                _cancel_pending(not_done)
+                for future in done:
                     task_name = future_to_task[future]
-                    try:
-                        future.result()
-                        logger.info(f"Completed {task_name}")
-                    except Exception as e:
-                        logger.error(f"Failed to generate {task_name}: {e}")
+                    error = future.exception()
+                    if error is not None:
+                        raise AnalysisError(f"Failed to generate {task_name}: {error}") from error
+                    logger.info(f"Completed {task_name}")
             
             logger.info(f"✅ Parallel analysis complete. Results saved to: {output_dir}")
             
         except Exception as e:
             raise AnalysisError(f"Parallel analysis failed: {e}")
     
-    def _create_summary_chart(self, output_dir: Path) -> None:
-        """Create summary chart (helper for parallel execution)."""
-        summary_plot_path = output_dir / "summary_analysis.png"
-        self.chart_generator.create_summary_plot(self.summary_data, summary_plot_path)
-    
-    def _create_comparison_charts(self, output_dir: Path, cpu_os_comparisons, 
-                                ocio_comparisons, all_ocio_comparisons) -> None:
-        """Create comparison charts (helper for parallel execution)."""
-        if cpu_os_comparisons is not None and not cpu_os_comparisons.empty:
-            cpu_os_plot_path = output_dir / "cpu_os_comparison.png"
-            self.chart_generator.create_comparison_plot(
-                cpu_os_comparisons, "CPU/OS Performance Comparison", cpu_os_plot_path
-            )
-        
-        if ocio_comparisons is not None and not ocio_comparisons.empty:
-            ocio_plot_path = output_dir / "ocio_version_comparison.png"
-            self.chart_generator.create_comparison_plot(
-                ocio_comparisons, "OCIO Version Performance Comparison", ocio_plot_path
-            )
-        
-        if all_ocio_comparisons is not None and not all_ocio_comparisons.empty:
-            aces_plot_path = output_dir / "comprehensive_aces_comparison.png"
-            self.chart_generator.create_aces_comparison_plot(all_ocio_comparisons, aces_plot_path)
-    
     def _create_summary_report(self, output_dir: Path) -> None:
         """Create summary report (helper for parallel execution)."""
         summary_report_path = output_dir / "analysis_summary.txt"
-        summary_stats = self.data_analyzer.get_performance_summary()
-        self.report_generator.create_summary_report(summary_stats, summary_report_path)
+        self.report_generator.create_summary_report(
+            self.summary_data, self._get_performance_stats(), summary_report_path
+        )
     
     def _create_comparison_reports(self, output_dir: Path, cpu_os_comparisons, ocio_comparisons) -> None:
         """Create comparison reports (helper for parallel execution)."""
@@ -381,7 +421,7 @@ class OCIOPerformanceAnalyzer:
         Args:
             csv_files: List of CSV files to process
             output_base_dir: Base directory for output (subdirs created per file)
-            max_workers: Maximum number of worker threads
+            max_workers: Maximum number of worker processes
             
         Returns:
             Dictionary mapping file names to success status
@@ -394,39 +434,33 @@ class OCIOPerformanceAnalyzer:
             
             results = {}
             
-            def process_single_file(csv_file: Path) -> tuple:
-                """Process a single CSV file."""
+            # Hand files out in chunks to amortize per-task overhead, with
+            # large and small files paired up so chunks are similar in size
+            ordered_files = _balance_by_size(csv_files)
+            chunksize = max(1, len(ordered_files) // (4 * max_workers))
+            
+            # Spawned workers would reload the config from disk, so hand them
+            # this process's config, including any changes made at runtime
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=set_config, initargs=(config,)
+            ) as executor:
+                outcomes = executor.map(
+                    _process_single_file, ordered_files, repeat(output_base_dir),
+                    repeat(config.parallel_processing), chunksize=chunksize
+                )
                 try:
-                    file_analyzer = OCIOPerformanceAnalyzer(csv_file)
-                    output_dir = output_base_dir / csv_file.stem
-                    
-                    if config.parallel_processing:
-                        file_analyzer.run_parallel_analysis(output_dir)
-                    else:
-                        file_analyzer.run_full_analysis(output_dir)
-                        
-                    return (csv_file.name, True, None)
-                except Exception as e:
-                    return (csv_file.name, False, str(e))
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_file = {
-                    executor.submit(process_single_file, csv_file): csv_file
-                    for csv_file in csv_files
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_file):
-                    csv_file = future_to_file[future]
-                    try:
-                        file_name, success, error = future.result()
+                    for file_name, success, error in outcomes:
                         results[file_name] = success
                         if success:
                             logger.info(f"✅ Successfully processed {file_name}")
                         else:
                             logger.error(f"❌ Failed to process {file_name}: {error}")
-                    except Exception as e:
-                        results[csv_file.name] = False
-                        logger.error(f"❌ Unexpected error processing {csv_file.name}: {e}")
+                except Exception as e:
+                    # A worker died; files without a result count as failed
+                    logger.error(f"❌ Unexpected error in batch worker: {e}")
+                    for csv_file in ordered_files:
+                        results.setdefault(csv_file.name, False)
             
             successful = sum(1 for success in results.values() if success)
             logger.info(f"Batch processing complete: {successful}/{len(csv_files)} files processed successfully")
@@ -437,5 +471,71 @@ class OCIOPerformanceAnalyzer:
             raise AnalysisError(f"Batch processing failed: {e}")
 
 
-# Backward compatibility alias
-OCIOAnalyzer = OCIOPerformanceAnalyzer
+def _balance_by_size(csv_files: List[Path]) -> List[Path]:
+    """
+    Order files largest, smallest, second largest, second smallest, and so on.
+
+    Consecutive files then pair a large file with a small one, so chunks of
+    the list hold similar amounts of data, and the largest files start first.
+    """
+    by_size = sorted(csv_files, key=lambda csv_file: csv_file.stat().st_size, reverse=True)
+    ordered = []
+    low, high = 0, len(by_size) - 1
+    while low <= high:
+        ordered.append(by_size[low])
+        if low != high:
+            ordered.append(by_size[high])
+        low += 1
+        high -= 1
+    return ordered
+
+
+def _cancel_pending(futures) -> None:
+    """Cancel futures that have not started running yet."""
+    for future in futures:
+        future.cancel()
+
+
+def _process_single_file(csv_file: Path, output_base_dir: Path, parallel_processing: bool) -> tuple:
+    """Analyze a single CSV file in a worker process (see batch_process_files)."""
+    try:
+        file_analyzer = OCIOPerformanceAnalyzer(csv_file)
+        output_dir = output_base_dir / csv_file.stem
+        
+        if parallel_processing:
+            file_analyzer.run_parallel_analysis(output_dir)
+        else:
+            file_analyzer.run_full_analysis(output_dir)
+            
+        return (csv_file.name, True, None)
+    except Exception as e:
+        return (csv_file.name, False, str(e))
+
+
+def _render_chart(kind: str, output_path: Path, data, title: Optional[str] = None) -> None:
+    """
+    Render one chart in a worker process (see run_parallel_analysis).
+
+    Args:
+        kind: One of 'summary', 'comparison', 'aces' or 'heatmap'
+        output_path: Path to save the chart to
+        data: DataFrame to plot
+        title: Chart title, used by comparison charts
+    """
+    # Workers only write files, so use the non-interactive backend before
+    # pyplot is imported
+    import matplotlib
+    matplotlib.use("Agg")
+    from .chart_generator import OCIOChartGenerator
+
+    chart_generator = OCIOChartGenerator()
+    if kind == 'summary':
+        chart_generator.create_summary_plot(data, output_path)
+    elif kind == 'comparison':
+        chart_generator.create_comparison_plot(data, title, output_path)
+    elif kind == 'aces':
+        chart_generator.create_aces_comparison_plot(data, output_path)
+    elif kind == 'heatmap':
+        chart_generator.create_performance_heatmap(data, output_path)
+    else:
+        raise ValueError(f"Unknown chart kind: {kind}")
@@ -5,23 +5,73 @@ Handles creation of text reports and analysis summaries
 for OCIO performance data.
 """
 
+import concurrent.futures
+import hashlib
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
+from ._kernels import group_means
+from .config import get_config
 from .exceptions import AnalysisError
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Section underlines, built once rather than for every report
+_TITLE_RULE = "=" * 50 + "\n\n"
+_RULE_15 = "-" * 15 + "\n"
+_RULE_18 = "-" * 18 + "\n"
+_RULE_20 = "-" * 20 + "\n"
+_RULE_25 = "-" * 25 + "\n"
+_RULE_35 = "-" * 35 + "\n"
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Version of the report layout, hashed with the report inputs; bump it whenever
+# the report text changes so reports written by older versions are regenerated
+_REPORT_FORMAT = 1
+
+# Columns listed for each of the top performing systems in the summary report
+_TOP_SYSTEM_COLUMNS = [
+    'file_name', 'cpu_model', 'os_release', 'ocio_version', 'aces_version', 'mean_avg_time'
+]
+
+# Columns the comparison report can show for each top improvement
+_COMPARISON_COLUMNS = [
+    'improvement_pct', 'cpu_model', 'faster_time', 'slower_time',
+    'faster_os', 'slower_os', 'faster_ocio_version', 'slower_ocio_version'
+]
+
+
+def _now_str() -> str:
+    """Return the current local time formatted for the 'Report generated' line."""
+    return datetime.now().strftime(_TIMESTAMP_FORMAT)
+
+
+def _meta_path(output_path: Path) -> Path:
+    """Return the sidecar recording the input digest of a report."""
+    return output_path.with_suffix('.meta')
+
 
 class OCIOReportGenerator:
     """Handles text report generation for OCIO performance analysis."""
 
-    def __init__(self):
-        """Initialize the report generator."""
-        pass
+    __slots__ = ('timestamp',)
+
+    def __init__(self, timestamp: Optional[str] = None):
+        """
+        Initialize the report generator.
+
+        Args:
+            timestamp: 'Report generated' time shared by every report, so that
+                reports from one analysis run carry the same time. Defaults to
+                the time each report is written.
+        """
+        self.timestamp = timestamp
 
     def create_summary_report(self, summary_data: pd.DataFrame, 
                             performance_stats: Dict, 
@@ -31,59 +81,82 @@ class OCIOReportGenerator:
 
         Args:
             summary_data: DataFrame with summary statistics
-            performance_stats: Dictionary with performance statistics
+            performance_stats: Dictionary with performance statistics, as returned by
+                OCIODataAnalyzer.get_performance_summary() (version lists hold strings)
             output_path: Path to save the report
             
         Raises:
             AnalysisError: If report creation fails
         """
         try:
+            digest = self._inputs_digest([summary_data], sorted(performance_stats.items()))
+            if self._is_up_to_date(output_path, digest):
+                logger.info(f"Summary report {output_path} is up to date, skipping")
+                return
+            
             logger.info("Creating summary report")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("OCIO Performance Analysis Summary Report\n")
-                f.write("=" * 50 + "\n\n")
-                
+            # Look each statistic up once, then build each section as one string
+            total_results = performance_stats.get('total_results', 0)
+            unique_files = performance_stats.get('unique_files', 0)
+            unique_cpus = performance_stats.get('unique_cpus', 0)
+            unique_os_releases = performance_stats.get('unique_os_releases', 0)
+            ocio_versions = ', '.join(performance_stats.get('ocio_versions', []))
+            aces_versions = ', '.join(performance_stats.get('aces_versions', []))
+            
+            parts: List[str] = [
+                "OCIO Performance Analysis Summary Report\n"
+                f"{_TITLE_RULE}"
                 # Overall statistics
-                f.write("OVERALL STATISTICS\n")
-                f.write("-" * 20 + "\n")
-                f.write(f"Total test results: {performance_stats.get('total_results', 0)}\n")
-                f.write(f"Unique files analyzed: {performance_stats.get('unique_files', 0)}\n")
-                f.write(f"Unique CPU models: {performance_stats.get('unique_cpus', 0)}\n")
-                f.write(f"Unique OS releases: {performance_stats.get('unique_os_releases', 0)}\n")
-                
-                ocio_versions = performance_stats.get('ocio_versions', [])
-                f.write(f"OCIO versions tested: {', '.join(map(str, ocio_versions))}\n")
-                
-                aces_versions = performance_stats.get('aces_versions', [])
-                f.write(f"ACES versions: {', '.join(aces_versions)}\n\n")
-                
-                # Performance statistics
-                avg_stats = performance_stats.get('avg_time_stats', {})
-                if avg_stats:
-                    f.write("PERFORMANCE STATISTICS\n")
-                    f.write("-" * 25 + "\n")
-                    f.write(f"Mean execution time: {avg_stats.get('mean', 0):.3f} ms\n")
-                    f.write(f"Median execution time: {avg_stats.get('median', 0):.3f} ms\n")
-                    f.write(f"Standard deviation: {avg_stats.get('std', 0):.3f} ms\n")
-                    f.write(f"Minimum time: {avg_stats.get('min', 0):.3f} ms\n")
-                    f.write(f"Maximum time: {avg_stats.get('max', 0):.3f} ms\n\n")
-                
-                # Top performing systems
-                if not summary_data.empty and 'mean_avg_time' in summary_data.columns:
-                    f.write("TOP PERFORMING SYSTEMS\n")
-                    f.write("-" * 25 + "\n")
-                    top_systems = summary_data.nsmallest(5, 'mean_avg_time')
-                    
-                    for idx, system in top_systems.iterrows():
-                        f.write(f"{idx + 1}. {system.get('file_name', 'Unknown')}\n")
-                        f.write(f"   CPU: {system.get('cpu_model', 'Unknown')}\n")
-                        f.write(f"   OS: {system.get('os_release', 'Unknown')}\n")
-                        f.write(f"   OCIO: {system.get('ocio_version', 'Unknown')}\n")
-                        f.write(f"   ACES: {system.get('aces_version', 'Unknown')}\n")
-                        f.write(f"   Avg Time: {system.get('mean_avg_time', 0):.3f} ms\n\n")
+                "OVERALL STATISTICS\n"
+                f"{_RULE_20}"
+                f"Total test results: {total_results}\n"
+                f"Unique files analyzed: {unique_files}\n"
+                f"Unique CPU models: {unique_cpus}\n"
+                f"Unique OS releases: {unique_os_releases}\n"
+                f"OCIO versions tested: {ocio_versions}\n"
+                f"ACES versions: {aces_versions}\n\n"
+            ]
+            
+            # Performance statistics
+            avg_stats = performance_stats.get('avg_time_stats', {})
+            if avg_stats:
+                mean_time = avg_stats.get('mean', 0)
+                median_time = avg_stats.get('median', 0)
+                std_time = avg_stats.get('std', 0)
+                min_time = avg_stats.get('min', 0)
+                max_time = avg_stats.get('max', 0)
+                parts.append(
+                    "PERFORMANCE STATISTICS\n"
+                    f"{_RULE_25}"
+                    f"Mean execution time: {mean_time:.3f} ms\n"
+                    f"Median execution time: {median_time:.3f} ms\n"
+                    f"Standard deviation: {std_time:.3f} ms\n"
+                    f"Minimum time: {min_time:.3f} ms\n"
+                    f"Maximum time: {max_time:.3f} ms\n\n"
+                )
+            
+            # Top performing systems
+            if not summary_data.empty and 'mean_avg_time' in summary_data.columns:
+                parts.append("TOP PERFORMING SYSTEMS\n")
+                parts.append(_RULE_25)
+                present_columns = [column for column in _TOP_SYSTEM_COLUMNS if column in summary_data.columns]
+                top_systems = summary_data[present_columns].nsmallest(5, 'mean_avg_time').reindex(
+                    columns=_TOP_SYSTEM_COLUMNS, fill_value='Unknown'
+                )
                 
-                f.write(f"Report generated: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                for rank, system in enumerate(top_systems.itertuples(index=False), 1):
+                    parts.append(
+                        f"{rank}. {system.file_name}\n"
+                        f"   CPU: {system.cpu_model}\n"
+                        f"   OS: {system.os_release}\n"
+                        f"   OCIO: {system.ocio_version}\n"
+                        f"   ACES: {system.aces_version}\n"
+                        f"   Avg Time: {system.mean_avg_time:.3f} ms\n\n"
+                    )
+            
+            parts.append(self._generated_line())
+            self._write_report(output_path, parts, digest)
             
             logger.info(f"Summary report saved to {output_path}")
             
@@ -105,58 +178,83 @@ class OCIOReportGenerator:
             AnalysisError: If report creation fails
         """
         try:
+            digest = self._inputs_digest([comparison_data], report_title)
+            if self._is_up_to_date(output_path, digest):
+                logger.info(f"Comparison report {output_path} is up to date, skipping")
+                return
+            
             logger.info(f"Creating comparison report: {report_title}")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"{report_title}\n")
-                f.write("=" * len(report_title) + "\n\n")
+            parts: List[str] = []
+            parts.append(f"{report_title}\n")
+            parts.append("=" * len(report_title) + "\n\n")
+            
+            if comparison_data.empty:
+                parts.append("No comparison data available.\n")
+                self._write_report(output_path, parts, digest)
+                return
+            
+            parts.append(f"Total comparisons found: {len(comparison_data)}\n\n")
+            
+            # Top improvements
+            if 'improvement_pct' in comparison_data.columns:
+                parts.append("TOP PERFORMANCE IMPROVEMENTS\n")
+                parts.append(_RULE_35)
                 
-                if comparison_data.empty:
-                    f.write("No comparison data available.\n")
-                    return
+                # Which details to show depends only on the columns, so check once
+                columns = comparison_data.columns
+                has_cpu = 'cpu_model' in columns
+                has_times = 'faster_time' in columns and 'slower_time' in columns
+                has_os = 'faster_os' in columns
+                has_ocio = 'faster_ocio_version' in columns
                 
-                f.write(f"Total comparisons found: {len(comparison_data)}\n\n")
+                # Only sort the columns the report shows
+                present_columns = [column for column in _COMPARISON_COLUMNS if column in columns]
+                top_improvements = comparison_data[present_columns].nlargest(10, 'improvement_pct')
                 
-                # Top improvements
-                if 'improvement_pct' in comparison_data.columns:
-                    f.write("TOP PERFORMANCE IMPROVEMENTS\n")
-                    f.write("-" * 35 + "\n")
+                if has_cpu:
+                    cpu_labels = self._truncate_series(top_improvements['cpu_model'], 50).tolist()
+                
+                for rank, comparison in enumerate(top_improvements.itertuples(index=False), 1):
+                    parts.append(f"{rank}. Improvement: {comparison.improvement_pct:.1f}%\n")
                     
-                    top_improvements = comparison_data.nlargest(10, 'improvement_pct')
+                    if has_cpu:
+                        parts.append(f"   CPU: {cpu_labels[rank - 1]}\n")
                     
-                    for idx, comparison in top_improvements.iterrows():
-                        f.write(f"{idx + 1}. Improvement: {comparison['improvement_pct']:.1f}%\n")
-                        
-                        if 'cpu_model' in comparison:
-                            f.write(f"   CPU: {self._truncate_text(comparison['cpu_model'], 50)}\n")
-                        
-                        if 'faster_time' in comparison and 'slower_time' in comparison:
-                            f.write(f"   Faster: {comparison['faster_time']:.3f} ms\n")
-                            f.write(f"   Slower: {comparison['slower_time']:.3f} ms\n")
-                        
-                        # Add specific comparison details based on columns
-                        if 'faster_os' in comparison:
-                            f.write(f"   Faster OS: {comparison['faster_os']}\n")
-                            f.write(f"   Slower OS: {comparison['slower_os']}\n")
-                        
-                        if 'faster_ocio_version' in comparison:
-                            f.write(f"   Faster OCIO: {comparison['faster_ocio_version']}\n")
-                            f.write(f"   Slower OCIO: {comparison['slower_ocio_version']}\n")
-                        
-                        f.write("\n")
-                
-                # Summary statistics
-                if 'improvement_pct' in comparison_data.columns:
-                    f.write("IMPROVEMENT STATISTICS\n")
-                    f.write("-" * 25 + "\n")
-                    improvements = comparison_data['improvement_pct']
-                    f.write(f"Average improvement: {improvements.mean():.1f}%\n")
-                    f.write(f"Median improvement: {improvements.median():.1f}%\n")
-                    f.write(f"Maximum improvement: {improvements.max():.1f}%\n")
-                    f.write(f"Minimum improvement: {improvements.min():.1f}%\n")
-                    f.write(f"Standard deviation: {improvements.std():.1f}%\n\n")
-                
-                f.write(f"Report generated: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    if has_times:
+                        parts.append(
+                            f"   Faster: {comparison.faster_time:.3f} ms\n"
+                            f"   Slower: {comparison.slower_time:.3f} ms\n"
+                        )
+                    
+                    # Add specific comparison details based on columns
+                    if has_os:
+                        parts.append(
+                            f"   Faster OS: {comparison.faster_os}\n"
+                            f"   Slower OS: {comparison.slower_os}\n"
+                        )
+                    
+                    if has_ocio:
+                        parts.append(
+                            f"   Faster OCIO: {comparison.faster_ocio_version}\n"
+                            f"   Slower OCIO: {comparison.slower_ocio_version}\n"
+                        )
+                    
+                    parts.append("\n")
+            
+            # Summary statistics
+            if 'improvement_pct' in comparison_data.columns:
+                parts.append("IMPROVEMENT STATISTICS\n")
+                parts.append(_RULE_25)
+                improvements = comparison_data['improvement_pct'].agg(['mean', 'median', 'max', 'min', 'std'])
+                parts.append(f"Average improvement: {improvements['mean']:.1f}%\n")
+                parts.append(f"Median improvement: {improvements['median']:.1f}%\n")
+                parts.append(f"Maximum improvement: {improvements['max']:.1f}%\n")
+                parts.append(f"Minimum improvement: {improvements['min']:.1f}%\n")
+                parts.append(f"Standard deviation: {improvements['std']:.1f}%\n\n")
+            
+            parts.append(self._generated_line())
+            self._write_report(output_path, parts, digest)
             
             logger.info(f"Comparison report saved to {output_path}")
             
@@ -181,105 +279,266 @@ class OCIOReportGenerator:
             AnalysisError: If report creation fails
         """
         try:
+            digest = self._inputs_digest([cpu_os_comparisons, ocio_comparisons, summary_data])
+            if self._is_up_to_date(output_path, digest):
+                logger.info(f"Detailed findings report {output_path} is up to date, skipping")
+                return
+            
             logger.info("Creating detailed findings report")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("OCIO Performance Analysis - Detailed Findings\n")
-                f.write("=" * 50 + "\n\n")
-                
-                # Key Findings Section
-                f.write("KEY FINDINGS\n")
-                f.write("-" * 15 + "\n")
-                
-                findings = []
-                
-                # CPU/OS Analysis
-                if not cpu_os_comparisons.empty:
-                    best_cpu_os = cpu_os_comparisons.iloc[0]
-                    findings.append(
-                        f"• Best CPU/OS performance improvement: "
-                        f"{best_cpu_os['improvement_pct']:.1f}% "
-                        f"(OS {best_cpu_os['faster_os']} vs {best_cpu_os['slower_os']})"
-                    )
-                    
-                    avg_improvement = cpu_os_comparisons['improvement_pct'].mean()
-                    findings.append(
-                        f"• Average OS performance improvement: {avg_improvement:.1f}%"
-                    )
-                
-                # OCIO Version Analysis
-                if not ocio_comparisons.empty:
-                    best_ocio = ocio_comparisons.iloc[0]
-                    findings.append(
-                        f"• Best OCIO version improvement: "
-                        f"{best_ocio['improvement_pct']:.1f}% "
-                        f"(OCIO {best_ocio['faster_ocio_version']} vs "
-                        f"{best_ocio['slower_ocio_version']})"
-                    )
-                
-                # ACES Version Analysis
-                if not summary_data.empty and 'aces_version' in summary_data.columns:
-                    aces_perf = summary_data.groupby('aces_version')['mean_avg_time'].mean()
-                    if len(aces_perf) > 1:
-                        fastest_aces = aces_perf.idxmin()
-                        slowest_aces = aces_perf.idxmax()
-                        improvement = ((aces_perf[slowest_aces] - aces_perf[fastest_aces]) / 
-                                     aces_perf[slowest_aces]) * 100
-                        findings.append(
-                            f"• ACES version performance: {fastest_aces} is "
-                            f"{improvement:.1f}% faster than {slowest_aces}"
-                        )
-                
-                if not findings:
-                    findings.append("• No significant performance differences found")
-                
-                for finding in findings:
-                    f.write(f"{finding}\n")
-                
-                f.write("\n")
-                
-                # Recommendations Section
-                f.write("RECOMMENDATIONS\n")
-                f.write("-" * 18 + "\n")
-                
-                recommendations = []
-                
-                if not cpu_os_comparisons.empty:
-                    top_os = cpu_os_comparisons.iloc[0]['faster_os']
-                    recommendations.append(
-                        f"• Consider using OS release {top_os} for optimal performance"
-                    )
-                
-                if not ocio_comparisons.empty:
-                    top_ocio = ocio_comparisons.iloc[0]['faster_ocio_version']
-                    recommendations.append(
-                        f"• OCIO version {top_ocio} shows the best performance characteristics"
-                    )
-                
-                if not summary_data.empty:
-                    # Find best performing CPU
-                    if 'cpu_model' in summary_data.columns and 'mean_avg_time' in summary_data.columns:
-                        best_cpu_idx = summary_data['mean_avg_time'].idxmin()
-                        best_cpu = summary_data.loc[best_cpu_idx, 'cpu_model']
-                        recommendations.append(
-                            f"• Top performing CPU: {self._truncate_text(best_cpu, 60)}"
-                        )
-                
-                if not recommendations:
-                    recommendations.append("• Further analysis recommended with more data")
-                
-                for rec in recommendations:
-                    f.write(f"{rec}\n")
-                
-                f.write("\n")
-                f.write(f"Report generated: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            parts: List[str] = []
+            parts.append("OCIO Performance Analysis - Detailed Findings\n")
+            parts.append(_TITLE_RULE)
+            
+            # Key Findings Section
+            parts.append("KEY FINDINGS\n")
+            parts.append(_RULE_15)
+            
+            # Best comparisons by improvement, whatever order the frames arrive in
+            cpu_os_best = self._best_comparison(cpu_os_comparisons)
+            ocio_best = self._best_comparison(ocio_comparisons)
+            
+            parts.extend(self._iter_findings(cpu_os_comparisons, cpu_os_best, ocio_best, summary_data))
+            parts.append("\n")
+            
+            # Recommendations Section
+            parts.append("RECOMMENDATIONS\n")
+            parts.append(_RULE_18)
+            parts.extend(self._iter_recommendations(cpu_os_best, ocio_best, summary_data))
+            
+            parts.append("\n")
+            parts.append(self._generated_line())
+            self._write_report(output_path, parts, digest)
             
             logger.info(f"Detailed findings report saved to {output_path}")
             
         except Exception as e:
             raise AnalysisError(f"Failed to create detailed findings report: {e}")
 
-    def _truncate_text(self, text: str, max_length: int) -> str:
+    def create_all_reports(self, summary_data: pd.DataFrame,
+                           performance_stats: Dict,
+                           cpu_os_comparisons: pd.DataFrame,
+                           ocio_comparisons: pd.DataFrame,
+                           output_dir: Path) -> None:
+        """
+        Create the summary, comparison and detailed findings reports concurrently.
+
+        The reports only read their inputs and write separate files, so each is
+        written on its own thread. Comparison reports are skipped when there are
+        no comparisons.
+
+        Args:
+            summary_data: DataFrame with summary statistics
+            performance_stats: Dictionary with performance statistics
+            cpu_os_comparisons: DataFrame with CPU/OS comparison data
+            ocio_comparisons: DataFrame with OCIO version comparison data
+            output_dir: Directory to save the reports in
+
+        Raises:
+            AnalysisError: If any report fails; reports not yet started are cancelled
+        """
+        tasks = [(self.create_summary_report, summary_data, performance_stats,
+                  output_dir / "analysis_summary.txt")]
+        if not cpu_os_comparisons.empty:
+            tasks.append((self.create_comparison_report, cpu_os_comparisons,
+                          "CPU/OS Performance Comparison Report",
+                          output_dir / "cpu_os_comparison_report.txt"))
+        if not ocio_comparisons.empty:
+            tasks.append((self.create_comparison_report, ocio_comparisons,
+                          "OCIO Version Performance Comparison Report",
+                          output_dir / "ocio_version_comparison_report.txt"))
+        tasks.append((self.create_detailed_findings_report, cpu_os_comparisons, ocio_comparisons,
+                      summary_data, output_dir / "detailed_findings.txt"))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(*task) for task in tasks]
+            _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+
+        # Re-raise the first failure, in report order
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+
+    @staticmethod
+    def _best_comparison(comparisons: pd.DataFrame) -> Optional[Dict]:
+        """
+        Return the comparison with the largest improvement as a dict.
+
+        Args:
+            comparisons: DataFrame with an 'improvement_pct' column
+
+        Returns:
+            The best comparison row, or None if there are no comparisons
+        """
+        if comparisons.empty:
+            return None
+        best = comparisons.nlargest(1, 'improvement_pct')
+        return best.iloc[0].to_dict() if not best.empty else None
+
+    def _iter_findings(self, cpu_os_comparisons: pd.DataFrame,
+                       cpu_os_best: Optional[Dict],
+                       ocio_best: Optional[Dict],
+                       summary_data: pd.DataFrame) -> Iterator[str]:
+        """
+        Yield the key findings lines of the detailed findings report.
+
+        Args:
+            cpu_os_comparisons: DataFrame with CPU/OS comparison data
+            cpu_os_best: Best CPU/OS comparison, or None
+            ocio_best: Best OCIO version comparison, or None
+            summary_data: DataFrame with summary statistics
+
+        Yields:
+            Report lines, each ending in a newline
+        """
+        found = False
+        
+        # CPU/OS Analysis
+        if cpu_os_best is not None:
+            yield (
+                f"• Best CPU/OS performance improvement: "
+                f"{cpu_os_best['improvement_pct']:.1f}% "
+                f"(OS {cpu_os_best['faster_os']} vs {cpu_os_best['slower_os']})\n"
+            )
+            
+            avg_improvement = cpu_os_comparisons['improvement_pct'].mean()
+            yield f"• Average OS performance improvement: {avg_improvement:.1f}%\n"
+            found = True
+        
+        # OCIO Version Analysis
+        if ocio_best is not None:
+            yield (
+                f"• Best OCIO version improvement: "
+                f"{ocio_best['improvement_pct']:.1f}% "
+                f"(OCIO {ocio_best['faster_ocio_version']} vs "
+                f"{ocio_best['slower_ocio_version']})\n"
+            )
+            found = True
+        
+        # ACES Version Analysis
+        if not summary_data.empty and 'aces_version' in summary_data.columns:
+            # Mean time per ACES version, from integer codes rather than a groupby;
+            # with a single version there is nothing to compare, so skip the means
+            codes, aces_versions = pd.factorize(summary_data['aces_version'], sort=True)
+            if len(aces_versions) > 1:
+                valid = codes >= 0
+                aces_perf = group_means(
+                    codes[valid].astype(np.int64),
+                    summary_data['mean_avg_time'].to_numpy(dtype=np.float64)[valid],
+                    len(aces_versions), get_config().compute_engine
+                )
+                fastest, slowest = np.nanargmin(aces_perf), np.nanargmax(aces_perf)
+                fastest_aces, slowest_aces = aces_versions[fastest], aces_versions[slowest]
+                improvement = ((aces_perf[slowest] - aces_perf[fastest]) / 
+                             aces_perf[slowest]) * 100
+                yield (
+                    f"• ACES version performance: {fastest_aces} is "
+                    f"{improvement:.1f}% faster than {slowest_aces}\n"
+                )
+                found = True
+        
+        if not found:
+            yield "• No significant performance differences found\n"
+
+    def _iter_recommendations(self, cpu_os_best: Optional[Dict],
+                              ocio_best: Optional[Dict],
+                              summary_data: pd.DataFrame) -> Iterator[str]:
+        """
+        Yield the recommendation lines of the detailed findings report.
+
+        Args:
+            cpu_os_best: Best CPU/OS comparison, or None
+            ocio_best: Best OCIO version comparison, or None
+            summary_data: DataFrame with summary statistics
+
+        Yields:
+            Report lines, each ending in a newline
+        """
+        found = False
+        
+        if cpu_os_best is not None:
+            yield f"• Consider using OS release {cpu_os_best['faster_os']} for optimal performance\n"
+            found = True
+        
+        if ocio_best is not None:
+            top_ocio = ocio_best['faster_ocio_version']
+            yield f"• OCIO version {top_ocio} shows the best performance characteristics\n"
+            found = True
+        
+        if not summary_data.empty:
+            # Find best performing CPU
+            if 'cpu_model' in summary_data.columns and 'mean_avg_time' in summary_data.columns:
+                best_pos = np.nanargmin(summary_data['mean_avg_time'].to_numpy(dtype=np.float64))
+                best_cpu = summary_data['cpu_model'].iat[best_pos]
+                yield f"• Top performing CPU: {self._truncate_text(best_cpu, 60)}\n"
+                found = True
+        
+        if not found:
+            yield "• Further analysis recommended with more data\n"
+
+    def _generated_line(self) -> str:
+        """Return the closing 'Report generated' line with the report time."""
+        return f"Report generated: {self.timestamp or _now_str()}\n"
+
+    def _inputs_digest(self, frames: Sequence[pd.DataFrame], *values: Any) -> str:
+        """
+        Hash everything a report is generated from.
+
+        Args:
+            frames: DataFrames the report reads
+            *values: Other report inputs, hashed by their repr()
+
+        Returns:
+            Hex digest of the report layout version, timestamp and inputs
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((_REPORT_FORMAT, self.timestamp) + values).encode('utf-8'))
+        for frame in frames:
+            digest.update(repr(list(frame.columns)).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _is_up_to_date(output_path: Path, digest: str) -> bool:
+        """
+        Check whether a report was already written from the same inputs.
+
+        Args:
+            output_path: Path of the report
+            digest: Digest of the current report inputs
+
+        Returns:
+            True if the report exists and its sidecar records the same digest
+        """
+        try:
+            return output_path.exists() and _meta_path(output_path).read_text(encoding='utf-8') == digest
+        except OSError:
+            return False
+
+    @staticmethod
+    def _write_report(output_path: Path, parts: List[str], digest: str) -> None:
+        """
+        Write a report assembled from string parts in a single call.
+
+        The digest of the report inputs is recorded in a '.meta' sidecar so an
+        unchanged report is not regenerated.
+
+        Args:
+            output_path: Path to save the report
+            parts: Report text, in order
+            digest: Digest of the report inputs
+        """
+        # Encode the whole report up front and hand it to the OS in one write,
+        # bypassing the text layer's chunked encoding
+        data = "".join(parts).encode('utf-8')
+        with open(output_path, 'wb') as f:
+            f.write(data)
+        _meta_path(output_path).write_text(digest, encoding='utf-8')
+
+    @staticmethod
+    def _truncate_text(text: str, max_length: int) -> str:
         """
         Truncate text to specified length with ellipsis.
 
@@ -290,6 +549,23 @@ class OCIOReportGenerator:
         Returns:
             Truncated text
         """
-        if pd.isna(text) or len(str(text)) <= max_length:
-            return str(text)
-        return str(text)[:max_length-3] + "..."
+        text = str(text)
+        if len(text) <= max_length:
+            return text
+        return text[:max_length-3] + "..."
+
+    @staticmethod
+    def _truncate_series(values: pd.Series, max_length: int) -> pd.Series:
+        """
+        Truncate every value of a Series like _truncate_text(), using string methods.
+
+        Args:
+            values: Values to truncate
+            max_length: Maximum length
+
+        Returns:
+            Series of truncated strings
+        """
+        # str() every value, as astype(str) keeps missing values missing
+        text = values.astype(object).map(str)
+        return text.where(text.str.len() <= max_length, text.str.slice(0, max_length - 3) + "...")
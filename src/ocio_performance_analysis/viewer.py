@@ -5,56 +5,19 @@ Provides a unified interface to view all generated analysis plots
 with detailed descriptions and explanations for each chart type.
 """
 
+import os
+import webbrowser
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
-
-import matplotlib.image as mpimg
-import matplotlib.pyplot as plt
+from typing import Any, Dict, Optional, Set
 
 from .logging_config import get_logger
 
 
 logger = get_logger(__name__)
 
-
-class OCIOChartViewer:
-    """Unified viewer for all OCIO analysis charts."""
-
-    def __init__(self, analysis_dir: Path = None):
-        """
-        Initialize the chart viewer.
-
-        Args:
-            analysis_dir: Directory containing analysis results.
-                         Defaults to "analysis_results" in current directory.
-        """
-        self.analysis_dir = analysis_dir or Path("analysis_results")
-        self.charts = {
-            'comprehensive_aces_comparison.png': {
-                'name': 'Comprehensive ACES Comparison',
-                'description': self._get_aces_comparison_description(),
-                'size': (16, 10)
-            },
-            'ocio_241_vs_242_cpu_os_aces_comparison.png': {
-                'name': 'Merged OCIO 2.4.1 vs 2.4.2 Comparison',
-                'description': self._get_merged_ocio_description(),
-                'size': (20, 12)
-            },
-            'summary_analysis.png': {
-                'name': 'Summary Analysis Overview',
-                'description': self._get_summary_analysis_description(),
-                'size': (15, 12)
-            },
-            'ocio_version_comparison.png': {
-                'name': 'OCIO Version Performance Comparison',
-                'description': self._get_ocio_version_description(),
-                'size': (15, 10)
-            }
-        }
-
-    def _get_aces_comparison_description(self) -> str:
-        """Get description for ACES comparison chart."""
-        return """Comprehensive ACES Version Comparison Chart
+# Descriptions shown alongside each chart
+_ACES_COMPARISON_DESCRIPTION = """Comprehensive ACES Version Comparison Chart
 This chart shows ACES 1.0 vs ACES 2.0 performance across:
    • Overall performance
    • OS releases (r7, r9)
@@ -72,9 +35,7 @@ Look for:
    • Green percentages indicate ACES 2.0 is faster
    • Overall performance difference in the stats box"""
 
-    def _get_merged_ocio_description(self) -> str:
-        """Get description for merged OCIO chart."""
-        return """Merged OCIO 2.4.1 vs 2.4.2 Comparison Chart
+_MERGED_OCIO_DESCRIPTION = """Merged OCIO 2.4.1 vs 2.4.2 Comparison Chart
 This chart shows:
    • OCIO 2.4.1 vs 2.4.2 performance for both ACES versions
    • All four combinations on the same scale:
@@ -92,9 +53,7 @@ Key insights:
    • Green percentages indicate OCIO 2.4.2 is faster
    • Red percentages indicate OCIO 2.4.2 is slower"""
 
-    def _get_summary_analysis_description(self) -> str:
-        """Get description for summary analysis chart."""
-        return """Summary Analysis Overview
+_SUMMARY_ANALYSIS_DESCRIPTION = """Summary Analysis Overview
 This multi-panel chart shows:
    • Performance by OS release and ACES version
    • CPU model performance distribution
@@ -108,9 +67,7 @@ Key insights:
    • Histograms show performance distribution patterns
    • Direct ACES version comparison"""
 
-    def _get_ocio_version_description(self) -> str:
-        """Get description for OCIO version comparison chart."""
-        return """OCIO Version Performance Comparison
+_OCIO_VERSION_DESCRIPTION = """OCIO Version Performance Comparison
 This multi-panel chart shows:
    • Performance by OCIO version and ACES version
    • File count distributions
@@ -123,29 +80,111 @@ Key insights:
    • Reveals version-specific performance patterns
    • Includes overall performance statistics"""
 
+# Known chart files and how to display them
+_CHARTS = {
+    'comprehensive_aces_comparison.png': {
+        'name': 'Comprehensive ACES Comparison',
+        'description': _ACES_COMPARISON_DESCRIPTION,
+        'size': (16, 10)
+    },
+    'ocio_241_vs_242_cpu_os_aces_comparison.png': {
+        'name': 'Merged OCIO 2.4.1 vs 2.4.2 Comparison',
+        'description': _MERGED_OCIO_DESCRIPTION,
+        'size': (20, 12)
+    },
+    'summary_analysis.png': {
+        'name': 'Summary Analysis Overview',
+        'description': _SUMMARY_ANALYSIS_DESCRIPTION,
+        'size': (15, 12)
+    },
+    'ocio_version_comparison.png': {
+        'name': 'OCIO Version Performance Comparison',
+        'description': _OCIO_VERSION_DESCRIPTION,
+        'size': (15, 10)
+    }
+}
+
+
+@lru_cache(maxsize=8)
+def _load_image(chart_path: str, mtime_ns: int):
+    """
+    Decode a chart PNG, reusing the decoded image while the file is unchanged.
+
+    Args:
+        chart_path: Path of the chart PNG
+        mtime_ns: Modification time of the file, so rewritten charts are decoded again
+
+    Returns:
+        The decoded image array
+    """
+    import matplotlib.image as mpimg
+
+    return mpimg.imread(chart_path)
+
+
+class OCIOChartViewer:
+    """Unified viewer for all OCIO analysis charts."""
+
+    __slots__ = ('analysis_dir', 'use_matplotlib', 'charts', '_search_index')
+
+    def __init__(self, analysis_dir: Path = None, use_matplotlib: bool = False):
+        """
+        Initialize the chart viewer.
+
+        Args:
+            analysis_dir: Directory containing analysis results.
+                         Defaults to "analysis_results" in current directory.
+            use_matplotlib: Show charts in a matplotlib window instead of
+                           opening the PNG files in the system image viewer.
+        """
+        self.analysis_dir = analysis_dir or Path("analysis_results")
+        self.use_matplotlib = use_matplotlib
+        # Chart descriptions never change, so every viewer shares one table
+        self.charts = _CHARTS
+        # Lowercased file and display names, for case-insensitive lookups
+        self._search_index = [
+            (chart_file, chart_file.lower(), chart_info['name'].lower(), chart_info)
+            for chart_file, chart_info in self.charts.items()
+        ]
+
+    def _existing_files(self) -> Optional[Set[str]]:
+        """
+        List the analysis directory once, instead of checking each chart file.
+
+        Returns:
+            Names of the files in the analysis directory, or None if it does not exist
+        """
+        try:
+            with os.scandir(self.analysis_dir) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return None
+
     def view_all_charts(self) -> None:
         """Display all available charts."""
-        if not self.analysis_dir.exists():
+        existing_files = self._existing_files()
+        if existing_files is None:
             logger.error("❌ Analysis results directory not found.")
             logger.info("Please run the analysis first to generate the charts.")
             return
 
-        available_charts = []
-        for chart_file, chart_info in self.charts.items():
-            chart_path = self.analysis_dir / chart_file
-            if chart_path.exists():
-                available_charts.append((chart_file, chart_info))
+        available_charts = [
+            (chart_file, chart_info) for chart_file, chart_info in self.charts.items()
+            if chart_file in existing_files
+        ]
 
         if not available_charts:
             logger.error("❌ No charts found in analysis_results directory.")
             logger.info("Please run the analysis first to generate the charts.")
             return
 
-        logger.info(f"📊 Found {len(available_charts)} charts to display:")
-        for i, (_chart_file, chart_info) in enumerate(available_charts):
-            logger.info(f"  {i+1}. {chart_info['name']}")
-
-        logger.info("\\n" + "=" * 70)
+        # One log record per block keeps the listing together in the output
+        lines = [f"📊 Found {len(available_charts)} charts to display:"]
+        lines.extend(
+            f"  {i+1}. {chart_info['name']}" for i, (_chart_file, chart_info) in enumerate(available_charts)
+        )
+        lines.append("\n" + "=" * 70)
+        logger.info("\n".join(lines))
 
         # Display each chart
         for chart_file, chart_info in available_charts:
@@ -158,30 +197,32 @@ Key insights:
         Args:
             chart_name: Name or partial name of the chart to display
         """
-        if not self.analysis_dir.exists():
+        existing_files = self._existing_files()
+        if existing_files is None:
             logger.error("❌ Analysis results directory not found.")
             logger.info("Please run the analysis first to generate the charts.")
             return
 
         # Find chart by partial name match
-        matching_charts = []
-        for chart_file, chart_info in self.charts.items():
-            if (chart_name.lower() in chart_file.lower() or
-                chart_name.lower() in chart_info['name'].lower()):
-                chart_path = self.analysis_dir / chart_file
-                if chart_path.exists():
-                    matching_charts.append((chart_file, chart_info))
+        query = chart_name.lower()
+        matching_charts = [
+            (chart_file, chart_info)
+            for chart_file, file_lower, name_lower, chart_info in self._search_index
+            if (query in file_lower or query in name_lower) and chart_file in existing_files
+        ]
 
         if not matching_charts:
             logger.error(f"❌ Chart '{chart_name}' not found.")
-            self._list_available_charts()
+            self._list_available_charts(existing_files)
             return
 
         if len(matching_charts) > 1:
             logger.warning(f"🔍 Multiple charts found matching '{chart_name}':")
-            for i, (_chart_file, chart_info) in enumerate(matching_charts):
-                logger.info(f"  {i+1}. {chart_info['name']}")
-            logger.info("Please be more specific.")
+            lines = [
+                f"  {i+1}. {chart_info['name']}" for i, (_chart_file, chart_info) in enumerate(matching_charts)
+            ]
+            lines.append("Please be more specific.")
+            logger.info("\n".join(lines))
             return
 
         chart_file, chart_info = matching_charts[0]
@@ -197,11 +238,46 @@ Key insights:
         """
         chart_path = self.analysis_dir / chart_file
 
-        logger.info(f"\\n{chart_info['description']}")
-        logger.info("=" * 60)
+        logger.info(f"\n{chart_info['description']}\n" + "=" * 60)
+
+        if self.use_matplotlib:
+            self._show_with_matplotlib(chart_path, chart_info)
+        else:
+            self._open_in_system_viewer(chart_path)
+
+    def _open_in_system_viewer(self, chart_path: Path) -> None:
+        """
+        Open a chart PNG in the system image viewer.
+
+        The PNG is already rendered, so it is handed over as a file instead of
+        being decoded and drawn again in a matplotlib figure.
+
+        Args:
+            chart_path: Path of the chart PNG
+        """
+        try:
+            if not webbrowser.open(chart_path.resolve().as_uri()):
+                logger.error(f"❌ No viewer available to open {chart_path}")
+        except Exception as e:
+            logger.error(f"❌ Error displaying chart: {e}")
+
+    def _show_with_matplotlib(self, chart_path: Path, chart_info: Dict[str, Any]) -> None:
+        """
+        Show a chart in a matplotlib window, titled and sized for its chart type.
+
+        Args:
+            chart_path: Path of the chart PNG
+            chart_info: Chart information dictionary
+        """
+        if os.environ.get('CI'):
+            logger.info(f"Not showing {chart_path} in a CI environment")
+            return
 
         try:
-            img = mpimg.imread(chart_path)
+            # matplotlib is only needed to show a chart, not to list them
+            import matplotlib.pyplot as plt
+
+            img = _load_image(str(chart_path), chart_path.stat().st_mtime_ns)
             plt.figure(figsize=chart_info['size'])
             plt.imshow(img)
             plt.axis('off')
@@ -211,19 +287,27 @@ Key insights:
         except Exception as e:
             logger.error(f"❌ Error displaying chart: {e}")
 
-    def _list_available_charts(self) -> None:
-        """List all available charts."""
-        logger.info("\\n📋 Available charts:")
+    def _list_available_charts(self, existing_files: Optional[Set[str]] = None) -> None:
+        """
+        List all available charts.
+
+        Args:
+            existing_files: Files already listed by _existing_files(); listed here if None
+        """
+        if existing_files is None:
+            existing_files = self._existing_files() or set()
+        lines = ["\n📋 Available charts:"]
         for chart_file, chart_info in self.charts.items():
-            chart_path = self.analysis_dir / chart_file
-            status = "✅" if chart_path.exists() else "❌"
-            logger.info(f"  {status} {chart_info['name']}")
+            status = "✅" if chart_file in existing_files else "❌"
+            lines.append(f"  {status} {chart_info['name']}")
+        logger.info("\n".join(lines))
 
     def list_charts(self) -> None:
         """List all charts with their availability status."""
-        logger.info("📊 OCIO Performance Analysis Charts")
-        logger.info("=" * 50)
+        logger.info("📊 OCIO Performance Analysis Charts\n" + "=" * 50)
         self._list_available_charts()
-        logger.info("\\nTo generate missing charts, run the analysis script")
-        logger.info("To view a specific chart, use view_specific_chart(<chart_name>)")
-        logger.info("To view all charts, use view_all_charts()")
+        logger.info(
+            "\nTo generate missing charts, run the analysis script\n"
+            "To view a specific chart, use view_specific_chart(<chart_name>)\n"
+            "To view all charts, use view_all_charts()"
+        )
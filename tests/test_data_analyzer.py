@@ -0,0 +1,293 @@
+"""
+Unit tests for OCIO Data Analyzer
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src.ocio_performance_analysis import data_analyzer
+from src.ocio_performance_analysis.data_analyzer import OCIODataAnalyzer
+
+
+class TestOCIODataAnalyzer:
+    """Test suite for OCIODataAnalyzer class."""
+
+    @pytest.fixture
+    def sample_csv(self, tmp_path):
+        """Create a small results CSV covering two OS releases and OCIO versions."""
+        rows = []
+        for host, cpu_model, os_release, ocio_version, base_time in [
+            ("sys1", "Intel(R) Xeon(R) W-2295 CPU @ 3.00GHz", "r7", "2.4.1", 100.0),
+            ("sys2", "Intel(R) Xeon(R) W-2295 CPU @ 3.00GHz", "r9", "2.4.1", 80.0),
+            ("sys2", "Intel(R) Xeon(R) W-2295 CPU @ 3.00GHz", "r9", "2.4.2", 70.0),
+            ("sys3", "Intel(R) Core(TM) i9-9900K CPU @ 3.60GHz", "r7", "2.4.1", 60.0),
+        ]:
+            file_name = f"OCIO_2.4_ACES_tests_{os_release}_{host}.txt"
+            for target, offset in [
+                ("(sRGB - Display, ACES 1.0 - SDR Video)", 0.0),
+                ("(sRGB - Display, ACES 2.0 - SDR Video)", 20.0),
+            ]:
+                for operation in ["Create the config identifier", "Process the complete image (in place)"]:
+                    avg_time = base_time + offset
+                    rows.append({
+                        'file_name': file_name,
+                        'os_release': os_release,
+                        'cpu_model': cpu_model,
+                        'ocio_version': ocio_version,
+                        'config_version': '2.4',
+                        'source_colorspace': 'ACES2065-1',
+                        'target_colorspace': target,
+                        'operation': operation,
+                        'iteration_count': 10,
+                        'min_time': avg_time - 1.0,
+                        'max_time': avg_time + 1.0,
+                        'avg_time': avg_time,
+                        'timing_values': f"{avg_time - 1.0},{avg_time},{avg_time + 1.0}",
+                    })
+
+        csv_file = tmp_path / "results.csv"
+        pd.DataFrame(rows).to_csv(csv_file, index=False)
+        return csv_file
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        """Directory used for the on-disk results cache."""
+        return tmp_path / "cache"
+
+    def test_load_data_categorizes_aces_versions(self, sample_csv, cache_dir):
+        """Test loading data adds the ACES version column."""
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        data = analyzer.load_data()
+
+        assert len(data) == 16
+        assert set(data['aces_version']) == {"ACES 1.0", "ACES 2.0"}
+
+    def test_load_data_stores_group_keys_as_categoricals(self, sample_csv, cache_dir):
+        """Test the columns the comparisons group by are loaded as categoricals."""
+        data = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir).load_data()
+
+        for column in ['file_name', 'cpu_model', 'os_release', 'aces_version', 'ocio_version']:
+            assert isinstance(data[column].dtype, pd.CategoricalDtype), column
+
+    def test_categorize_aces_versions_handles_missing_values(self):
+        """Test ACES categorization maps unmatched and missing targets to Unknown."""
+        targets = pd.Series(["(sRGB, ACES 1.0 - SDR Video)", "(P3, aces 2.0 - HDR)", "Linear", None])
+
+        result = OCIODataAnalyzer._categorize_aces_versions(targets)
+
+        assert result.tolist() == ["ACES 1.0", "ACES 2.0", "Unknown", "Unknown"]
+
+    def test_load_data_in_chunks(self, sample_csv, cache_dir):
+        """Test chunked loading matches a full load on the analysis columns."""
+        full = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        chunked = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+
+        data = chunked.load_data(chunksize=3)
+
+        assert 'timing_values' not in data.columns
+        assert len(data) == 16
+        full.load_data()
+        pd.testing.assert_frame_equal(chunked.summarize_by_filename(), full.summarize_by_filename())
+
+    def test_set_data_matches_csv_load(self, sample_csv, cache_dir):
+        """Test analyzing an in-memory DataFrame gives the same results as the CSV."""
+        from_csv = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        from_csv.load_data()
+
+        in_memory = OCIODataAnalyzer()
+        in_memory.set_data(pd.read_csv(sample_csv))
+
+        pd.testing.assert_frame_equal(in_memory.summarize_by_filename(), from_csv.summarize_by_filename())
+
+    def test_comparisons(self, sample_csv, cache_dir):
+        """Test CPU/OS and OCIO version comparisons are found."""
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        analyzer.load_data()
+
+        cpu_os = analyzer.find_cpu_os_comparisons()
+        assert len(cpu_os) == 2
+        assert set(cpu_os['faster_os']) == {"r9"}
+
+        ocio = analyzer.find_ocio_version_comparisons()
+        assert len(ocio) == 2
+        assert set(ocio['faster_ocio_version']) == {"2.4.2"}
+
+    def test_find_all_comparisons_matches_individual_methods(self, sample_csv, cache_dir):
+        """Test the shared-aggregate bundle matches each comparison method."""
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        analyzer.load_data()
+
+        bundle = analyzer.find_all_comparisons()
+
+        pd.testing.assert_frame_equal(bundle.cpu_os, analyzer.find_cpu_os_comparisons())
+        pd.testing.assert_frame_equal(bundle.ocio_version, analyzer.find_ocio_version_comparisons())
+        all_ocio = bundle.all_ocio_version.set_index(['ocio_version', 'aces_version'])
+        assert all_ocio.loc[("2.4.1", "ACES 1.0"), 'mean_avg_time'] == pytest.approx(80.0)
+        assert all_ocio.loc[("2.4.1", "ACES 1.0"), 'file_count'] == 3
+        assert all_ocio.loc[("2.4.2", "ACES 2.0"), 'cpu_count'] == 1
+
+    def test_get_performance_summary(self, sample_csv, cache_dir):
+        """Test overall summary counts and avg_time statistics."""
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        analyzer.load_data()
+
+        summary = analyzer.get_performance_summary()
+
+        assert summary['total_results'] == 16
+        assert summary['unique_files'] == 3
+        assert summary['unique_cpus'] == 2
+        assert summary['unique_os_releases'] == 2
+        assert summary['ocio_versions'] == ["2.4.1", "2.4.2"]
+        for key in ['total_results', 'unique_files', 'unique_cpus', 'unique_os_releases']:
+            assert type(summary[key]) is int, key
+        assert summary['avg_time_stats']['min'] == 60.0
+        assert summary['avg_time_stats']['max'] == 120.0
+        assert summary['avg_time_stats']['mean'] == pytest.approx(87.5)
+
+    def test_performance_summary_versions_are_strings(self, sample_csv, cache_dir):
+        """Test versions read as numbers are sorted numerically and stored as strings."""
+        data = pd.read_csv(sample_csv)
+        data['ocio_version'] = data['ocio_version'].map({"2.4.1": "10", "2.4.2": "9"})
+        data.to_csv(sample_csv, index=False)
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        analyzer.load_data()
+
+        summary = analyzer.get_performance_summary()
+
+        assert summary['ocio_versions'] == ["9", "10"]
+        assert summary['aces_versions'] == ["ACES 1.0", "ACES 2.0"]
+
+    def test_run_all_analyses(self, sample_csv, cache_dir):
+        """Test the concurrent driver returns the same results as individual calls."""
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        analyzer.load_data()
+
+        results = analyzer.run_all_analyses()
+
+        assert set(results) == {
+            'summary', 'cpu_os_comparisons', 'ocio_version_comparisons',
+            'all_ocio_version_comparisons', 'performance_summary',
+        }
+        pd.testing.assert_frame_equal(results['summary'], analyzer.summarize_by_filename())
+        assert len(results['cpu_os_comparisons']) == 2
+        assert results['performance_summary']['total_results'] == 16
+
+    @pytest.fixture
+    def counted_summary(self, monkeypatch):
+        """Count how often the per-file summary is computed."""
+        calls = []
+        compute = OCIODataAnalyzer._compute_summary
+
+        def counting_compute(analyzer):
+            calls.append(1)
+            return compute(analyzer)
+
+        monkeypatch.setattr(OCIODataAnalyzer, "_compute_summary", counting_compute)
+        return calls
+
+    def test_results_memoized_until_data_reassigned(self, sample_csv, counted_summary):
+        """Test repeated calls reuse results and reassigning data invalidates them."""
+        analyzer = OCIODataAnalyzer(sample_csv)
+        analyzer.cache_dir = None
+        analyzer.load_data()
+
+        first = analyzer.summarize_by_filename()
+        pd.testing.assert_frame_equal(analyzer.summarize_by_filename(), first)
+        assert len(counted_summary) == 1
+
+        analyzer.data = analyzer.data[analyzer.data['ocio_version'] == "2.4.2"]
+        assert len(analyzer.summarize_by_filename()) == 2
+        assert len(counted_summary) == 2
+        assert analyzer.get_performance_summary()['total_results'] == 4
+
+    def test_results_invalidated_by_in_place_edits(self, sample_csv, cache_dir):
+        """Test editing the data in place is detected and memoized results are not shared."""
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        analyzer.load_data()
+
+        summary = analyzer.summarize_by_filename()
+        summary.loc[:, 'mean_avg_time'] = -1.0
+        assert (analyzer.summarize_by_filename()['mean_avg_time'] > 0).all()
+
+        analyzer.data.loc[analyzer.data['ocio_version'] == "2.4.2", 'avg_time'] = 1.0
+        assert analyzer.get_performance_summary()['avg_time_stats']['min'] == 1.0
+
+        analyzer.data.drop(analyzer.data.index[:8], inplace=True)
+        assert analyzer.get_performance_summary()['total_results'] == 8
+
+    def test_disk_cache_reused_across_instances(self, sample_csv, cache_dir, monkeypatch):
+        """Test a second analyzer reads cached results instead of the CSV."""
+        first = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        first.load_data()
+        expected_summary = first.summarize_by_filename()
+
+        def fail_read_csv(*args, **kwargs):
+            raise AssertionError("CSV should not be re-read on a cache hit")
+
+        monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+
+        second = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(second.load_data(), first.data)
+        pd.testing.assert_frame_equal(second.summarize_by_filename(), expected_summary)
+
+    def test_disk_cache_invalidated_when_csv_changes(self, sample_csv, cache_dir):
+        """Test rewriting the CSV invalidates previously cached results."""
+        OCIODataAnalyzer(sample_csv, cache_dir=cache_dir).load_data()
+
+        data = pd.read_csv(sample_csv)
+        data.iloc[:4].to_csv(sample_csv, index=False)
+        stat = sample_csv.stat()
+        os.utime(sample_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir).load_data()
+        assert len(reloaded) == 4
+        # Entries for the previous contents are removed once the new ones are written
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_disk_cache_invalidated_by_package_upgrade(self, sample_csv, cache_dir, monkeypatch):
+        """Test cached results are not reused across package or cache schema versions."""
+        OCIODataAnalyzer(sample_csv, cache_dir=cache_dir).load_data()
+        monkeypatch.setattr(data_analyzer, "__version__", "999.0.0")
+
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        read_csv = pd.read_csv
+        reads = []
+        monkeypatch.setattr(pd, "read_csv", lambda *args, **kwargs: reads.append(1) or read_csv(*args, **kwargs))
+        analyzer.load_data()
+
+        assert reads == [1]
+
+    def test_clear_cache_removes_cache_files(self, sample_csv, cache_dir, counted_summary):
+        """Test clear_cache drops memoized results and this file's cache entries."""
+        analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        analyzer.load_data()
+        analyzer.summarize_by_filename()
+        assert list(cache_dir.iterdir())
+
+        assert analyzer.clear_cache() == 2
+        assert not list(cache_dir.iterdir())
+        analyzer.summarize_by_filename()
+        assert len(counted_summary) == 2
+
+    def test_parquet_round_trip(self, sample_csv, cache_dir, tmp_path):
+        """Test results written to Parquet load back with the same analysis output."""
+        pytest.importorskip("pyarrow")
+
+        csv_analyzer = OCIODataAnalyzer(sample_csv, cache_dir=cache_dir)
+        parquet_file = tmp_path / "results.parquet"
+        csv_analyzer.to_parquet(parquet_file)
+
+        parquet_analyzer = OCIODataAnalyzer(parquet_file, cache_dir=cache_dir)
+        data = parquet_analyzer.load_data()
+
+        assert 'timing_values' not in data.columns
+        pd.testing.assert_frame_equal(
+            parquet_analyzer.summarize_by_filename(),
+            csv_analyzer.summarize_by_filename(),
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,194 @@
+"""
+Unit tests for OCIO numeric kernels
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.ocio_performance_analysis import _kernels
+
+
+class TestTimingStats:
+    """Test suite for the timing statistics kernel."""
+
+    def test_timing_stats(self):
+        """Test min, max and mean of a timing array."""
+        values = np.array([11.1952, 0.000477791, 1.11995])
+
+        min_time, max_time, avg_time = _kernels.timing_stats(values)
+
+        assert min_time == 0.000477791
+        assert max_time == 11.1952
+        assert avg_time == pytest.approx(4.10521, abs=1e-4)
+
+    def test_numba_matches_numpy(self):
+        """Test the Numba kernel agrees with the NumPy fallback."""
+        if not _kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        values = np.random.default_rng(0).random(257)
+
+        numba_stats = _kernels._timing_stats_kernel._compile()(values)
+        numpy_stats = _kernels._timing_stats_numpy(values)
+
+        assert numba_stats == pytest.approx(numpy_stats)
+
+    def test_failing_kernel_falls_back_to_numpy(self, monkeypatch):
+        """Test a kernel that fails to compile or run uses the NumPy implementation."""
+        def broken(timing_values):
+            raise RuntimeError("cannot load cached kernel")
+
+        kernel = _kernels._Kernel(_kernels._timing_stats_loop, _kernels._timing_stats_numpy)
+        monkeypatch.setattr(kernel, "_compile", lambda: broken)
+
+        assert kernel(np.array([1.0, 3.0])) == (1.0, 3.0, 2.0)
+        assert kernel._impl is kernel.numpy_impl
+
+    def test_numpy_engine_skips_numba(self):
+        """Test the 'numpy' engine does not import Numba."""
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from src.ocio_performance_analysis import _kernels\n"
+            "assert _kernels.timing_stats(np.array([1.0, 3.0]), engine='numpy') == (1.0, 3.0, 2.0)\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_auto_engine_skips_numba(self):
+        """Test the default engine uses NumPy for a single timing array."""
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from src.ocio_performance_analysis import _kernels\n"
+            "assert _kernels.timing_stats(np.array([1.0, 3.0])) == (1.0, 3.0, 2.0)\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_numba_not_imported_with_package(self):
+        """Test importing the parser and analyzer does not import Numba."""
+        code = (
+            "import sys\n"
+            "import src.ocio_performance_analysis.parser\n"
+            "import src.ocio_performance_analysis.data_analyzer\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestSegmentTimingStats:
+    """Test suite for the segmented timing statistics kernel."""
+
+    def test_matches_timing_stats(self):
+        """Test each segment gets the statistics of its own timing array."""
+        arrays = [np.array([11.1952, 0.000477791, 1.11995]), np.array([2.0]), np.array([4.0, 6.0])]
+        offsets = np.array([0, 3, 4, 6], dtype=np.int64)
+
+        stats = _kernels.segment_timing_stats(np.concatenate(arrays), offsets)
+
+        for segment, values in enumerate(arrays):
+            assert tuple(output[segment] for output in stats) == _kernels.timing_stats(values, engine='numpy')
+
+    def test_engines_match(self):
+        """Test the Numba kernel agrees with the NumPy implementation."""
+        rng = np.random.default_rng(0)
+        offsets = np.concatenate([[0], np.cumsum(rng.integers(1, 20, 50))]).astype(np.int64)
+        values = rng.random(offsets[-1])
+
+        for numba_output, numpy_output in zip(
+            _kernels.segment_timing_stats(values, offsets, engine='numba'),
+            _kernels.segment_timing_stats(values, offsets, engine='numpy')
+        ):
+            np.testing.assert_allclose(numba_output, numpy_output)
+
+
+class TestPairImprovements:
+    """Test suite for the pairwise comparison kernel."""
+
+    def test_pairs_within_groups(self):
+        """Test every pair within each group is compared in nested-loop order."""
+        times = np.array([100.0, 80.0, 50.0, 10.0, 0.0])
+        starts = np.array([0, 3], dtype=np.int64)
+        ends = np.array([3, 5], dtype=np.int64)
+
+        first, second, improvement_pct = _kernels.pair_improvements(times, starts, ends)
+
+        assert first.tolist() == [0, 0, 1, 3]
+        assert second.tolist() == [1, 2, 2, 4]
+        assert improvement_pct[:3] == pytest.approx([20.0, 50.0, 37.5])
+        assert np.isnan(improvement_pct[3])
+
+    def test_numba_matches_numpy(self):
+        """Test the Numba kernel agrees with the NumPy fallback."""
+        if not _kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        times = np.random.default_rng(0).random(20)
+        starts = np.array([0, 4, 5, 12], dtype=np.int64)
+        ends = np.array([4, 5, 12, 20], dtype=np.int64)
+
+        results = []
+        numba_kernel = _kernels._pair_improvements_kernel._compile()
+        for kernel in (numba_kernel, _kernels._pair_improvements_numpy):
+            pair_count = 6 + 0 + 21 + 28
+            outputs = (np.empty(pair_count, np.int64), np.empty(pair_count, np.int64),
+                       np.empty(pair_count))
+            kernel(times, starts, ends, np.array([0, 6, 6, 27]), *outputs)
+            results.append(outputs)
+
+        for numba_output, numpy_output in zip(*results):
+            np.testing.assert_allclose(numba_output, numpy_output)
+
+    def test_small_inputs_skip_numba(self):
+        """Test comparing a few groups does not import or compile Numba."""
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from src.ocio_performance_analysis import _kernels\n"
+            "_kernels.pair_improvements(np.array([2.0, 1.0]), np.array([0]), np.array([2]))\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_engines_match(self):
+        """Test every compute engine gives the same pairs."""
+        times = np.random.default_rng(0).random(20)
+        starts = np.array([0, 4, 5, 12], dtype=np.int64)
+        ends = np.array([4, 5, 12, 20], dtype=np.int64)
+
+        expected = _kernels.pair_improvements(times, starts, ends, engine='numpy')
+        for engine in ('auto', 'numba'):
+            outputs = _kernels.pair_improvements(times, starts, ends, engine=engine)
+            for output, expected_output in zip(outputs, expected):
+                np.testing.assert_allclose(output, expected_output)
+
+
+class TestGroupMeans:
+    """Test suite for the group means kernel."""
+
+    def test_group_means(self):
+        """Test means per group skip NaN values and empty groups are NaN."""
+        codes = np.array([0, 1, 0, 1, 0], dtype=np.int64)
+        values = np.array([1.0, 10.0, 3.0, np.nan, np.nan])
+
+        means = _kernels.group_means(codes, values, 3)
+
+        assert means[:2].tolist() == [2.0, 10.0]
+        assert np.isnan(means[2])
+
+    def test_engines_match(self):
+        """Test the Numba kernel agrees with the NumPy implementation."""
+        rng = np.random.default_rng(0)
+        codes = rng.integers(0, 4, 100)
+        values = rng.random(100)
+
+        np.testing.assert_allclose(
+            _kernels.group_means(codes, values, 5, engine='numba'),
+            _kernels.group_means(codes, values, 5, engine='numpy')
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
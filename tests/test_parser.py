@@ -3,24 +3,28 @@ Unit tests for OCIO Test Results Parser
 """
 
 import csv
+import io
 import tempfile
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from src.ocio_performance_analysis import parser as parser_module
 from src.ocio_performance_analysis.exceptions import DataValidationError
-from src.ocio_performance_analysis.parser import OCIOTestParser, OCIOTestResult
+from src.ocio_performance_analysis.parser import RESULT_COLUMNS, OCIOTestParser, OCIOTestResult
 
 
 class TestOCIOTestParser:
     """Test suite for OCIOTestParser class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self):
-        """Create a parser instance for testing."""
+        """Create a parser instance shared by the tests; it holds no state."""
         return OCIOTestParser()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_test_data(self):
         """Create sample test data for testing."""
         return """
@@ -43,7 +47,7 @@ Process the complete image (in place):				For 10 iterations, it took: [1739.95,
 Process the complete image (two buffers):			For 10 iterations, it took: [1731.68, 1732.46, 1732.38] ms
 """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_multi_run_data(self):
         """Create sample data with multiple test runs."""
         return """
@@ -133,7 +137,7 @@ Create the config identifier:		For 5 iterations, it took: [5.1, 5.2, 5.3, 5.4, 5
         assert first_result.operation == "Create the config identifier"
         assert first_result.iteration_count == 10
         assert len(first_result.timing_values) == 3
-        assert first_result.timing_values == [11.1952, 0.000477791, 1.11995]
+        assert first_result.timing_values.tolist() == [11.1952, 0.000477791, 1.11995]
 
         # Check calculated statistics
         assert first_result.min_time == 0.000477791
@@ -142,28 +146,65 @@ Create the config identifier:		For 5 iterations, it took: [5.1, 5.2, 5.3, 5.4, 5
 
     def test_parse_multi_run_data(self, parser, sample_multi_run_data):
         """Test parsing data with multiple test runs."""
-        # Create a temporary file to test the full parsing flow
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp_file:
-            tmp_file.write(sample_multi_run_data)
-            tmp_file_path = Path(tmp_file.name)
-
-        try:
-            results = parser.parse_file(tmp_file_path)
+        # Parse from a stream to test the full parsing flow without a file
+        results = parser.parse_file(io.StringIO(sample_multi_run_data))
+
+        # Should have results from both OCIO versions
+        version_241_results = [r for r in results if r.ocio_version == "2.4.1"]
+        version_242_results = [r for r in results if r.ocio_version == "2.4.2"]
+
+        assert len(version_241_results) == 1
+        assert len(version_242_results) == 1
+        assert all(r.file_name == "stream" for r in results)
+
+        # Check version 2.4.2 result
+        v242_result = version_242_results[0]
+        assert v242_result.target_colorspace == "(Rec.709 - Display, ACES 1.0 - SDR Video)"
+        assert v242_result.iteration_count == 5
+        assert len(v242_result.timing_values) == 5
+
+    def test_parse_file_cpu_model_after_test_runs(self, parser, sample_multi_run_data):
+        """Test a CPU model listed after the test runs applies to every result."""
+        content = sample_multi_run_data + "\nmodel name\t: Intel(R) Xeon(R) W-2295 CPU @ 3.00GHz\n"
+
+        results = parser.parse_file(io.StringIO(content))
+
+        assert len(results) == 2
+        assert all(r.cpu_model == "Intel(R) Xeon(R) W-2295 CPU @ 3.00GHz" for r in results)
+
+    def test_fast_scan_matches_regex(self, parser, sample_test_data, sample_multi_run_data):
+        """Test the str.find timing scan finds the same results as the combined regex."""
+        regex_parser = OCIOTestParser()
+        regex_parser.use_fast_scan = False
+        odd_lines = (
+            "Not a timing line: For 3 iterations, it took: [1.0, 2.0] seconds\n"
+            "Bad values:\tFor 2 iterations, it took: [1.0, x] ms\n"
+            "No colon\tFor 2 iterations, it took: [1.0, 2.0] ms\n"
+            "Wrapped values:\tFor 2 iterations, it took: [1.0,\n 2.0] ms\n"
+            "Two: colons:\tFor 2 iterations, it took: [1.0, 2.0] ms\n"
+            "Unterminated:\tFor 2 iterations, it took: [1.0, 2.0\n"
+        )
 
-            # Should have results from both OCIO versions
-            version_241_results = [r for r in results if r.ocio_version == "2.4.1"]
-            version_242_results = [r for r in results if r.ocio_version == "2.4.2"]
+        for content in [sample_test_data, sample_multi_run_data, sample_test_data + odd_lines]:
+            fast = parser._parse_test_run(content, "test_r7.txt", "Unknown")
+            slow = regex_parser._parse_test_run(content, "test_r7.txt", "Unknown")
+            pd.testing.assert_frame_equal(parser.to_dataframe(fast), parser.to_dataframe(slow))
+
+    @pytest.mark.parametrize("use_fast_scan", [True, False])
+    def test_operation_name_with_colon(self, use_fast_scan):
+        """Test an operation name containing a colon is kept whole."""
+        parser = OCIOTestParser()
+        parser.use_fast_scan = use_fast_scan
+        content = (
+            "OCIO Version: 2.4.1\n"
+            "Processing from 'ACES2065-1' to '(sRGB - Display, ACES 1.0 - SDR Video)'\n"
+            "Create the proc: cpu:\t\tFor 10 iterations, it took: [1.0, 2.0, 3.0] ms\n"
+        )
 
-            assert len(version_241_results) == 1
-            assert len(version_242_results) == 1
+        results = parser._parse_test_run(content, "test_r7.txt", "Unknown")
 
-            # Check version 2.4.2 result
-            v242_result = version_242_results[0]
-            assert v242_result.target_colorspace == "(Rec.709 - Display, ACES 1.0 - SDR Video)"
-            assert v242_result.iteration_count == 5
-            assert len(v242_result.timing_values) == 5
-        finally:
-            tmp_file_path.unlink()
+        assert [r.operation for r in results] == ["Create the proc: cpu"]
+        assert results[0].timing_values.tolist() == [1.0, 2.0, 3.0]
 
     def test_empty_content(self, parser):
         """Test parsing empty content."""
@@ -184,6 +225,19 @@ Create the config identifier:		For 10 iterations, it took: [invalid, 1.23, text]
         assert len(results) == 0
         #assert results[0].timing_values == [1.23]
 
+    def test_parse_timing_values(self, parser):
+        """Test timing value parsing, including the per-value fallback."""
+        assert parser._parse_timing_values("1.5, 2.5, 3.5").tolist() == [1.5, 2.5, 3.5]
+        assert parser._parse_timing_values("1.5, 2.5,").tolist() == [1.5, 2.5]
+        assert parser._parse_timing_values("1.5,, 2.5").tolist() == [1.5, 2.5]
+        assert parser._parse_timing_values("1.5, 2.5.1").tolist() == [1.5]
+
+    def test_parse_timing_values_truncated_fast_path(self, parser, monkeypatch):
+        """Test a short read from np.fromstring (NumPy 1.x behaviour) falls back per value."""
+        monkeypatch.setattr(np, "fromstring", lambda *args, **kwargs: np.array([1.5]))
+
+        assert parser._parse_timing_values("1.5,, 2.5").tolist() == [1.5, 2.5]
+
     def test_parse_file_with_temp_file(self, parser, sample_test_data):
         """Test parsing a file from disk."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp_file:
@@ -220,6 +274,32 @@ Create the config identifier:		For 10 iterations, it took: [invalid, 1.23, text]
             assert len(file1_results) == 5
             assert len(file2_results) == 5
 
+    def test_parse_directory_in_worker_processes(self, parser, sample_test_data, tmp_path, monkeypatch):
+        """Test an explicit worker count parses in a pool with the same results."""
+        for name in ["test1.txt", "test2.txt", "test3.txt", "test4.txt"]:
+            (tmp_path / name).write_text(sample_test_data)
+        pools = []
+        executor_class = parser_module.ProcessPoolExecutor
+        monkeypatch.setattr(
+            parser_module, "ProcessPoolExecutor", lambda **kwargs: pools.append(1) or executor_class(**kwargs)
+        )
+
+        serial = parser.parse_directory(tmp_path)
+        pooled = parser.parse_directory(tmp_path, max_workers=2)
+
+        assert pools == [1]
+        pd.testing.assert_frame_equal(parser.to_dataframe(pooled), parser.to_dataframe(serial))
+
+    def test_small_directory_parsed_serially(self, parser, sample_test_data, tmp_path, monkeypatch):
+        """Test a directory with few files does not start a process pool."""
+        for name in ["test1.txt", "test2.txt"]:
+            (tmp_path / name).write_text(sample_test_data)
+        monkeypatch.setattr(parser_module, "ProcessPoolExecutor", None)
+
+        results = parser.parse_directory(tmp_path, max_workers=2)
+
+        assert len(results) == 10
+
     def test_save_to_csv(self, parser, sample_test_data):
         """Test saving results to CSV file."""
         results = parser._parse_test_run(sample_test_data, "test.txt", "Unknown")
@@ -251,6 +331,41 @@ Create the config identifier:		For 10 iterations, it took: [invalid, 1.23, text]
         finally:
             tmp_file_path.unlink()
 
+    def test_save_to_csv_writers_match(self, parser, sample_test_data, tmp_path, monkeypatch):
+        """Test the pyarrow and csv module writers save the same values."""
+        pytest.importorskip("pyarrow")
+        results = parser._parse_test_run(sample_test_data, "test_r7.txt", "Unknown")
+
+        parser.save_to_csv(results, tmp_path / "arrow.csv")
+        monkeypatch.setattr(parser_module, "PYARROW_AVAILABLE", False)
+        parser.save_to_csv(results, tmp_path / "csv.csv")
+
+        pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "arrow.csv"), pd.read_csv(tmp_path / "csv.csv"))
+
+    def test_to_dataframe(self, parser, sample_test_data):
+        """Test converting results into a columnar DataFrame."""
+        results = parser._parse_test_run(sample_test_data, "test.txt", "Unknown")
+
+        df = parser.to_dataframe(results)
+
+        assert list(df.columns) == RESULT_COLUMNS
+        assert len(df) == 5
+        assert df['avg_time'].tolist() == [r.avg_time for r in results]
+        assert df['timing_values'].iloc[0].tolist() == [11.1952, 0.000477791, 1.11995]
+
+    def test_save_to_parquet(self, parser, sample_test_data, tmp_path):
+        """Test saving results to Parquet preserves timing value arrays."""
+        pytest.importorskip("pyarrow")
+        results = parser._parse_test_run(sample_test_data, "test.txt", "Unknown")
+        output_file = tmp_path / "results.parquet"
+
+        parser.save_to_parquet(results, output_file)
+
+        df = pd.read_parquet(output_file)
+        assert list(df.columns) == RESULT_COLUMNS
+        assert len(df) == 5
+        assert list(df['timing_values'].iloc[0]) == [11.1952, 0.000477791, 1.11995]
+
     def test_save_empty_results(self, parser):
         """Test saving empty results list raises DataValidationError."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as tmp_file:
@@ -313,6 +428,28 @@ class TestOCIOTestResult:
         assert result.max_time == 0.0
         assert result.avg_time == 0.0
 
+    def test_known_statistics_are_kept(self):
+        """Test statistics passed by the caller are not recomputed."""
+        result = OCIOTestResult(
+            file_name="test.txt",
+            os_release="r7",
+            cpu_model="Intel(R) Core(TM) i7-8700K CPU @ 3.70GHz",
+            ocio_version="2.4.1",
+            config_version="2.4",
+            source_colorspace="ACES2065-1",
+            target_colorspace="sRGB",
+            operation="Test operation",
+            iteration_count=10,
+            timing_values=[1.0, 2.0, 3.0],
+            min_time=0.5,
+            max_time=3.5,
+            avg_time=2.5
+        )
+
+        assert result.min_time == 0.5
+        assert result.max_time == 3.5
+        assert result.avg_time == 2.5
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
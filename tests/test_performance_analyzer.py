@@ -0,0 +1,201 @@
+"""
+Unit tests for OCIO Performance Analyzer
+"""
+
+import os
+
+import pandas as pd
+import pytest
+from PIL import Image
+
+from src.ocio_performance_analysis.config import get_config
+from src.ocio_performance_analysis.data_analyzer import OCIODataAnalyzer
+from src.ocio_performance_analysis.exceptions import AnalysisError, ConfigurationError
+from src.ocio_performance_analysis.performance_analyzer import OCIOPerformanceAnalyzer, _balance_by_size
+
+
+class TestOCIOPerformanceAnalyzer:
+    """Test suite for OCIOPerformanceAnalyzer class."""
+
+    @pytest.fixture
+    def sample_csv(self, tmp_path):
+        """Create a small results CSV with one CPU on two OS releases."""
+        rows = []
+        for host, os_release, ocio_version, avg_time in [
+            ("sys1", "r7", "2.4.1", 100.0),
+            ("sys2", "r9", "2.4.1", 80.0),
+            ("sys2", "r9", "2.4.2", 70.0),
+        ]:
+            for target in ["(sRGB - Display, ACES 1.0 - SDR Video)", "(sRGB - Display, ACES 2.0 - SDR Video)"]:
+                rows.append({
+                    'file_name': f"OCIO_2.4_ACES_tests_{os_release}_{host}.txt",
+                    'os_release': os_release,
+                    'cpu_model': "Intel(R) Xeon(R) W-2295 CPU @ 3.00GHz",
+                    'ocio_version': ocio_version,
+                    'config_version': '2.4',
+                    'source_colorspace': 'ACES2065-1',
+                    'target_colorspace': target,
+                    'operation': "Process the complete image (in place)",
+                    'iteration_count': 10,
+                    'min_time': avg_time - 1.0,
+                    'max_time': avg_time + 1.0,
+                    'avg_time': avg_time,
+                    'timing_values': f"{avg_time - 1.0},{avg_time},{avg_time + 1.0}",
+                })
+
+        csv_file = tmp_path / "results.csv"
+        pd.DataFrame(rows).to_csv(csv_file, index=False)
+        return csv_file
+
+    @pytest.fixture
+    def config(self, tmp_path, monkeypatch):
+        """Current configuration, with the results cache under tmp_path."""
+        config = get_config()
+        monkeypatch.setattr(config, "cache_dir", str(tmp_path / "cache"))
+        return config
+
+    def test_quick_summary_reuses_loaded_data(self, sample_csv, config):
+        """Test repeated quick summaries reuse the data loaded by the first call."""
+        analyzer = OCIOPerformanceAnalyzer(sample_csv)
+
+        first = analyzer.get_quick_summary()
+        data = analyzer.data
+
+        assert analyzer.get_quick_summary() == first
+        assert analyzer.data is data
+        assert first['total_results'] == 6
+        assert first['cpu_os_comparisons_found'] == 2
+
+    def test_quick_summary_reloads_changed_csv(self, sample_csv, config):
+        """Test rewriting the CSV after a run is picked up by the next one."""
+        analyzer = OCIOPerformanceAnalyzer(sample_csv)
+        assert analyzer.get_quick_summary()['total_results'] == 6
+
+        pd.read_csv(sample_csv).iloc[:2].to_csv(sample_csv, index=False)
+        stat = sample_csv.stat()
+        os.utime(sample_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        summary = analyzer.get_quick_summary()
+        assert summary['total_results'] == 2
+        assert summary['cpu_os_comparisons_found'] == 0
+        assert set(analyzer.summary_data['file_name']) == {"OCIO_2.4_ACES_tests_r7_sys1.txt"}
+
+    def test_run_full_analysis_reuses_cached_comparisons(self, sample_csv, tmp_path, config, monkeypatch):
+        """Test a re-run reads cached comparisons unless recomputation is forced."""
+        calls = []
+        compute = OCIODataAnalyzer._compute_cpu_os_comparisons
+        monkeypatch.setattr(
+            OCIODataAnalyzer, "_compute_cpu_os_comparisons",
+            lambda analyzer: calls.append(1) or compute(analyzer)
+        )
+        monkeypatch.setattr(OCIOPerformanceAnalyzer, "_create_all_charts", lambda *args: None)
+        output_dir = tmp_path / "output"
+
+        OCIOPerformanceAnalyzer(sample_csv).run_full_analysis(output_dir)
+        OCIOPerformanceAnalyzer(sample_csv).run_full_analysis(output_dir)
+        assert len(calls) == 1
+
+        OCIOPerformanceAnalyzer(sample_csv).run_full_analysis(output_dir, force_recompute=True)
+        assert len(calls) == 2
+        assert (output_dir / "cpu_os_comparison_report.txt").exists()
+
+    def test_quick_summary_reuses_full_analysis_results(self, sample_csv, tmp_path, config, monkeypatch):
+        """Test a quick summary after a full run reuses its comparisons and statistics."""
+        calls = []
+        find_all_comparisons = OCIODataAnalyzer.find_all_comparisons
+        monkeypatch.setattr(
+            OCIODataAnalyzer, "find_all_comparisons",
+            lambda analyzer: calls.append(1) or find_all_comparisons(analyzer)
+        )
+        monkeypatch.setattr(OCIOPerformanceAnalyzer, "_create_all_charts", lambda *args: None)
+        analyzer = OCIOPerformanceAnalyzer(sample_csv)
+
+        analyzer.run_full_analysis(tmp_path / "output")
+        summary = analyzer.get_quick_summary()
+
+        assert len(calls) == 1
+        assert summary['cpu_os_comparisons_found'] == 2
+
+        analyzer.load_csv_file(sample_csv)
+        analyzer.get_quick_summary()
+        assert len(calls) == 2
+
+    def test_run_parallel_analysis(self, sample_csv, tmp_path, config, monkeypatch):
+        """Test the parallel pipeline renders charts in worker processes and writes reports."""
+        monkeypatch.setattr(config, "parallel_processing", True)
+        output_dir = tmp_path / "output"
+
+        OCIOPerformanceAnalyzer(sample_csv).run_parallel_analysis(output_dir, max_workers=2)
+
+        for name in [
+            "summary_analysis.png", "cpu_os_comparison.png", "ocio_version_comparison.png",
+            "comprehensive_aces_comparison.png", "performance_heatmap.png",
+            "analysis_summary.txt", "os_comparison_report.txt", "ocio_version_comparison_report.txt",
+        ]:
+            assert (output_dir / name).stat().st_size > 0, name
+
+    def test_run_parallel_analysis_fails_fast(self, sample_csv, tmp_path, config, monkeypatch):
+        """Test a failing output task makes the parallel pipeline raise."""
+        monkeypatch.setattr(config, "parallel_processing", True)
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(OCIOPerformanceAnalyzer, "_create_comparison_reports", fail)
+
+        with pytest.raises(AnalysisError, match="comparison_reports: disk full"):
+            OCIOPerformanceAnalyzer(sample_csv).run_parallel_analysis(tmp_path / "output", max_workers=2)
+
+    def test_chart_workers_use_parent_config(self, sample_csv, tmp_path, config, monkeypatch):
+        """Test chart workers follow chart settings changed in the parent process."""
+        monkeypatch.setattr(config, "parallel_processing", True)
+        monkeypatch.setattr(config.chart, "png_compress_level", 0)
+        output_dir = tmp_path / "output"
+
+        OCIOPerformanceAnalyzer(sample_csv).run_parallel_analysis(output_dir, max_workers=2)
+
+        # Uncompressed PNG data is at least as large as the raw pixels
+        chart_path = output_dir / "summary_analysis.png"
+        with Image.open(chart_path) as image:
+            raw_size = image.width * image.height * len(image.getbands())
+        assert chart_path.stat().st_size > raw_size
+
+    def test_batch_workers_use_parent_config(self, sample_csv, tmp_path, config, monkeypatch):
+        """Test batch workers follow config changes made in the parent process."""
+        monkeypatch.setattr(config, "parallel_processing", True)
+        output_dir = tmp_path / "output"
+
+        results = OCIOPerformanceAnalyzer().batch_process_files([sample_csv], output_dir, max_workers=1)
+
+        assert results == {sample_csv.name: True}
+        assert (output_dir / sample_csv.stem / "analysis_summary.txt").exists()
+        # The worker cached its results in the parent's cache_dir, not the one on disk
+        assert list((tmp_path / "cache").iterdir())
+
+    def test_batch_files_balanced_by_size(self, tmp_path):
+        """Test batch files alternate between the largest and smallest remaining."""
+        files = []
+        for size in [3, 1, 5, 2, 4]:
+            csv_file = tmp_path / f"results_{size}.csv"
+            csv_file.write_text("x" * size)
+            files.append(csv_file)
+
+        ordered = _balance_by_size(files)
+
+        assert [csv_file.stat().st_size for csv_file in ordered] == [5, 1, 4, 2, 3]
+
+    def test_clear_cache(self, sample_csv, tmp_path, config):
+        """Test clear_cache removes cached results and requires a CSV file."""
+        analyzer = OCIOPerformanceAnalyzer(sample_csv)
+        analyzer.get_quick_summary()
+
+        assert analyzer.clear_cache() > 0
+        assert analyzer.data is None
+        assert not list((tmp_path / "cache").iterdir())
+
+        with pytest.raises(ConfigurationError):
+            OCIOPerformanceAnalyzer().clear_cache()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
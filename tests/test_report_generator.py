@@ -0,0 +1,214 @@
+"""
+Unit tests for OCIO Report Generator
+"""
+
+import pandas as pd
+import pytest
+
+from src.ocio_performance_analysis import report_generator
+from src.ocio_performance_analysis.exceptions import AnalysisError
+from src.ocio_performance_analysis.report_generator import OCIOReportGenerator
+
+
+class TestOCIOReportGenerator:
+    """Test suite for OCIOReportGenerator class."""
+
+    @pytest.fixture
+    def comparison_data(self):
+        """CPU/OS comparisons, sorted by improvement like the data analyzer's."""
+        return pd.DataFrame({
+            'cpu_model': ["Intel(R) Xeon(R) W-2295 CPU @ 3.00GHz", "AMD Ryzen 9 5950X 16-Core Processor"],
+            'aces_version': ["ACES 1.0", "ACES 2.0"],
+            'ocio_version': ["2.4.1", "2.4.1"],
+            'faster_os': ["r9", "r9"],
+            'slower_os': ["r7", "r8"],
+            'faster_time': [80.0, 45.0],
+            'slower_time': [100.0, 50.0],
+            'improvement_pct': [20.0, 10.0],
+        })
+
+    def test_create_comparison_report(self, comparison_data, tmp_path):
+        """Test the comparison report lists each comparison and the statistics."""
+        output_path = tmp_path / "report.txt"
+
+        OCIOReportGenerator().create_comparison_report(comparison_data, "CPU/OS Report", output_path)
+
+        report = output_path.read_text(encoding='utf-8')
+        assert report.startswith("CPU/OS Report\n=============\n\nTotal comparisons found: 2\n")
+        assert (
+            "1. Improvement: 20.0%\n"
+            "   CPU: Intel(R) Xeon(R) W-2295 CPU @ 3.00GHz\n"
+            "   Faster: 80.000 ms\n"
+            "   Slower: 100.000 ms\n"
+            "   Faster OS: r9\n"
+            "   Slower OS: r7\n\n"
+            "2. Improvement: 10.0%\n"
+        ) in report
+        assert "Average improvement: 15.0%\nMedian improvement: 15.0%\n" in report
+        assert "Standard deviation: 7.1%\n" in report
+
+    def test_comparison_report_ranks_by_position(self, comparison_data, tmp_path):
+        """Test top improvements are numbered by rank, not by DataFrame index."""
+        output_path = tmp_path / "report.txt"
+        comparison_data.index = [7, 3]
+
+        OCIOReportGenerator().create_comparison_report(comparison_data, "CPU/OS Report", output_path)
+
+        report = output_path.read_text(encoding='utf-8')
+        assert "1. Improvement: 20.0%\n" in report
+        assert "2. Improvement: 10.0%\n" in report
+
+    def test_create_summary_report(self, tmp_path):
+        """Test the summary report ranks the fastest systems and tolerates missing columns."""
+        summary_data = pd.DataFrame({
+            'file_name': ["slow.txt", "fast.txt"],
+            'cpu_model': ["CPU A", "CPU B"],
+            'mean_avg_time': [200.0, 100.0],
+        })
+        performance_stats = {'total_results': 4, 'ocio_versions': ["2.4.1", "2.4.2"], 'aces_versions': ["ACES 1.0"]}
+        output_path = tmp_path / "summary.txt"
+
+        OCIOReportGenerator().create_summary_report(summary_data, performance_stats, output_path)
+
+        report = output_path.read_text(encoding='utf-8')
+        assert "Total test results: 4\n" in report
+        assert "OCIO versions tested: 2.4.1, 2.4.2\n" in report
+        assert (
+            "1. fast.txt\n"
+            "   CPU: CPU B\n"
+            "   OS: Unknown\n"
+            "   OCIO: Unknown\n"
+            "   ACES: Unknown\n"
+            "   Avg Time: 100.000 ms\n\n"
+            "2. slow.txt\n"
+        ) in report
+
+    def test_truncate_series_matches_truncate_text(self):
+        """Test vectorized truncation gives the same text as the scalar helper."""
+        values = pd.Series(["short", "x" * 50, "y" * 51, None, float("nan")], dtype=object)
+
+        truncated = OCIOReportGenerator._truncate_series(values, 50)
+
+        assert truncated.tolist() == [OCIOReportGenerator._truncate_text(value, 50) for value in values]
+        assert truncated[2] == "y" * 47 + "..."
+
+    def test_create_comparison_report_without_data(self, tmp_path):
+        """Test an empty comparison still produces a report."""
+        output_path = tmp_path / "report.txt"
+
+        OCIOReportGenerator().create_comparison_report(pd.DataFrame(), "Empty", output_path)
+
+        assert output_path.read_text(encoding='utf-8') == "Empty\n=====\n\nNo comparison data available.\n"
+
+    def test_create_detailed_findings_report(self, comparison_data, tmp_path):
+        """Test the findings report summarizes the best OS comparison."""
+        output_path = tmp_path / "findings.txt"
+
+        OCIOReportGenerator().create_detailed_findings_report(
+            comparison_data, pd.DataFrame(), pd.DataFrame(), output_path
+        )
+
+        report = output_path.read_text(encoding='utf-8')
+        assert "• Best CPU/OS performance improvement: 20.0% (OS r9 vs r7)\n" in report
+        assert "• Average OS performance improvement: 15.0%\n" in report
+        assert "• Consider using OS release r9 for optimal performance\n" in report
+
+    def test_detailed_findings_use_best_comparison(self, comparison_data, tmp_path):
+        """Test the findings report picks the largest improvement from unsorted comparisons."""
+        output_path = tmp_path / "findings.txt"
+        summary_data = pd.DataFrame({'cpu_model': ["CPU A", "CPU B"], 'mean_avg_time': [200.0, 100.0]}, index=[5, 2])
+
+        OCIOReportGenerator().create_detailed_findings_report(
+            comparison_data.iloc[::-1], pd.DataFrame(), summary_data, output_path
+        )
+
+        report = output_path.read_text(encoding='utf-8')
+        assert "• Best CPU/OS performance improvement: 20.0% (OS r9 vs r7)\n" in report
+        assert "• Top performing CPU: CPU B\n" in report
+
+    def test_detailed_findings_compare_aces_versions(self, tmp_path):
+        """Test the findings report compares the mean time of each ACES version."""
+        summary_data = pd.DataFrame({
+            'aces_version': ["ACES 2.0", "ACES 1.0", "ACES 2.0", None],
+            'mean_avg_time': [90.0, 100.0, 70.0, 1.0],
+        })
+        output_path = tmp_path / "findings.txt"
+
+        OCIOReportGenerator().create_detailed_findings_report(
+            pd.DataFrame(), pd.DataFrame(), summary_data, output_path
+        )
+
+        report = output_path.read_text(encoding='utf-8')
+        assert "• ACES version performance: ACES 2.0 is 20.0% faster than ACES 1.0\n" in report
+
+    def test_detailed_findings_skip_single_aces_version(self, tmp_path, monkeypatch):
+        """Test a single ACES version is not compared and falls back to the default finding."""
+        monkeypatch.setattr(report_generator, "group_means", None)
+        summary_data = pd.DataFrame({'aces_version': ["ACES 2.0", "ACES 2.0"], 'mean_avg_time': [90.0, 70.0]})
+        output_path = tmp_path / "findings.txt"
+
+        OCIOReportGenerator().create_detailed_findings_report(
+            pd.DataFrame(), pd.DataFrame(), summary_data, output_path
+        )
+
+        report = output_path.read_text(encoding='utf-8')
+        assert "KEY FINDINGS\n---------------\n• No significant performance differences found\n" in report
+
+
+    def test_reports_share_timestamp(self, comparison_data, tmp_path):
+        """Test a generator created with a timestamp stamps every report with it."""
+        generator = OCIOReportGenerator(timestamp="2024-01-02 03:04:05")
+
+        generator.create_comparison_report(comparison_data, "CPU/OS Report", tmp_path / "report.txt")
+        generator.create_detailed_findings_report(
+            comparison_data, pd.DataFrame(), pd.DataFrame(), tmp_path / "findings.txt"
+        )
+
+        for name in ["report.txt", "findings.txt"]:
+            report = (tmp_path / name).read_text(encoding='utf-8')
+            assert report.endswith("Report generated: 2024-01-02 03:04:05\n"), name
+
+
+    def test_create_all_reports(self, comparison_data, tmp_path):
+        """Test all reports are written, skipping comparison reports without comparisons."""
+        summary_data = pd.DataFrame({'file_name': ["fast.txt"], 'cpu_model': ["CPU B"], 'mean_avg_time': [100.0]})
+
+        OCIOReportGenerator().create_all_reports(
+            summary_data, {'total_results': 1}, comparison_data, pd.DataFrame(), tmp_path
+        )
+
+        assert sorted(path.name for path in tmp_path.glob("*.txt")) == [
+            "analysis_summary.txt", "cpu_os_comparison_report.txt", "detailed_findings.txt"
+        ]
+        assert "Total comparisons found: 2\n" in (tmp_path / "cpu_os_comparison_report.txt").read_text(encoding='utf-8')
+
+    def test_create_all_reports_raises_first_failure(self, comparison_data, tmp_path, monkeypatch):
+        """Test a failing report is raised from create_all_reports."""
+        def fail(*args):
+            raise AnalysisError("Failed to create comparison report: disk full")
+
+        monkeypatch.setattr(OCIOReportGenerator, "create_comparison_report", fail)
+
+        with pytest.raises(AnalysisError, match="disk full"):
+            OCIOReportGenerator().create_all_reports(
+                pd.DataFrame(), {}, comparison_data, pd.DataFrame(), tmp_path
+            )
+
+
+    def test_unchanged_report_is_not_rewritten(self, comparison_data, tmp_path):
+        """Test a report is only regenerated when its inputs change."""
+        output_path = tmp_path / "report.txt"
+        generator = OCIOReportGenerator()
+        generator.create_comparison_report(comparison_data, "CPU/OS Report", output_path)
+        output_path.write_text("previous run", encoding='utf-8')
+
+        generator.create_comparison_report(comparison_data, "CPU/OS Report", output_path)
+        assert output_path.read_text(encoding='utf-8') == "previous run"
+
+        comparison_data.loc[1, 'improvement_pct'] = 12.0
+        generator.create_comparison_report(comparison_data, "CPU/OS Report", output_path)
+        assert "2. Improvement: 12.0%\n" in output_path.read_text(encoding='utf-8')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
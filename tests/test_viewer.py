@@ -0,0 +1,100 @@
+"""
+Unit tests for OCIO Chart Viewer
+"""
+
+import logging
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.ocio_performance_analysis import viewer as viewer_module
+from src.ocio_performance_analysis.viewer import OCIOChartViewer
+
+
+class TestOCIOChartViewer:
+    """Test suite for OCIOChartViewer class."""
+
+    def test_list_charts_reports_existing_files(self, tmp_path, caplog):
+        """Test chart availability comes from the files in the analysis directory."""
+        (tmp_path / "summary_analysis.png").write_bytes(b"")
+        viewer = OCIOChartViewer(tmp_path)
+
+        with caplog.at_level(logging.INFO):
+            viewer.list_charts()
+
+        assert "✅ Summary Analysis Overview" in caplog.text
+        assert "❌ Comprehensive ACES Comparison" in caplog.text
+
+    def test_view_specific_chart_displays_match(self, tmp_path, monkeypatch):
+        """Test a partial name selects the matching existing chart."""
+        (tmp_path / "summary_analysis.png").write_bytes(b"")
+        (tmp_path / "ocio_version_comparison.png").write_bytes(b"")
+        viewer = OCIOChartViewer(tmp_path)
+        displayed = []
+        monkeypatch.setattr(
+            OCIOChartViewer, "_display_chart", lambda self, chart_file, chart_info: displayed.append(chart_file)
+        )
+
+        viewer.view_specific_chart("Summary")
+
+        assert displayed == ["summary_analysis.png"]
+
+    def test_display_chart_opens_system_viewer(self, tmp_path, monkeypatch):
+        """Test charts are handed to the system viewer unless matplotlib is requested."""
+        (tmp_path / "summary_analysis.png").write_bytes(b"")
+        opened = []
+        monkeypatch.setattr(viewer_module.webbrowser, "open", lambda url: opened.append(url) or True)
+        monkeypatch.setattr(
+            OCIOChartViewer, "_show_with_matplotlib", lambda self, chart_path, chart_info: opened.append("mpl")
+        )
+
+        OCIOChartViewer(tmp_path).view_specific_chart("summary")
+        OCIOChartViewer(tmp_path, use_matplotlib=True).view_specific_chart("summary")
+
+        assert opened == [(tmp_path / "summary_analysis.png").resolve().as_uri(), "mpl"]
+
+    def test_decoded_charts_are_reused_until_rewritten(self, tmp_path, monkeypatch):
+        """Test a chart is decoded again only after its file changes."""
+        import matplotlib.image as mpimg
+
+        chart_path = tmp_path / "summary_analysis.png"
+        mpimg.imsave(chart_path, np.zeros((2, 2, 3)))
+        decoded = []
+        imread = mpimg.imread
+        monkeypatch.setattr(mpimg, "imread", lambda path: decoded.append(path) or imread(path))
+        viewer_module._load_image.cache_clear()
+
+        for _ in range(2):
+            viewer_module._load_image(str(chart_path), chart_path.stat().st_mtime_ns)
+        os.utime(chart_path, ns=(0, chart_path.stat().st_mtime_ns + 1_000_000))
+        viewer_module._load_image(str(chart_path), chart_path.stat().st_mtime_ns)
+
+        assert decoded == [str(chart_path)] * 2
+
+    def test_missing_analysis_directory(self, tmp_path, caplog):
+        """Test viewing charts from a missing directory logs an error."""
+        viewer = OCIOChartViewer(tmp_path / "missing")
+
+        with caplog.at_level(logging.INFO):
+            viewer.view_all_charts()
+            viewer.list_charts()
+
+        assert "Analysis results directory not found" in caplog.text
+        assert "❌ Summary Analysis Overview" in caplog.text
+
+    def test_matplotlib_not_imported_with_viewer(self):
+        """Test importing the viewer and listing charts does not import matplotlib."""
+        code = (
+            "import sys\n"
+            "from src.ocio_performance_analysis.viewer import OCIOChartViewer\n"
+            "OCIOChartViewer().list_charts()\n"
+            "assert 'matplotlib' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])